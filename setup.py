@@ -25,6 +25,7 @@ setup(
     url='https://github.com/ooknosi/django_material_widgets',
     author='Edison KOO',
     #author_email='',
+    python_requires='>=3.7',
     install_requires=[
         'Django',
         ],
@@ -38,7 +39,7 @@ setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
         'Topic :: Software Development :: Libraries :: Python Modules',
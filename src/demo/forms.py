@@ -18,6 +18,8 @@ from .models import MaterialWidgetsDemoModel
 
 class DemoForm(MaterialForm):
     """Demo Form with Material widget fields."""
+    ### Validate fields in the browser before submitting
+    client_validation = True
 
     username = forms.CharField(
         ### Default label uses field name.replace('_', ' ').title()
@@ -14,6 +14,8 @@ SECRET_KEY = "THIS IS A DEMO SECRET KEY"
 
 INSTALLED_APPS += ['material_widgets', 'demo',]
 
+MIDDLEWARE += ['material_widgets.choices.RequestChoicesMiddleware',]
+
 ALLOWED_HOSTS = ['localhost',]
 
 DATABASES = {
@@ -7,17 +7,17 @@ demo/views.py
 from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.views.generic.edit import FormView
+from material_widgets.views import FieldValidationMixin
 from .forms import DemoForm, DemoModelForm
 
-class IndexView(FormView):
-    """Form view of index.html."""
+class IndexView(FieldValidationMixin, FormView):
+    """Form view of index.html, validating fields as they are edited."""
     template_name = 'demo/index.html'
     form_class = DemoForm
     success_url = reverse_lazy('demo:index')
 
-    def post(self, request, *args, **kwargs):
-        form = DemoForm(request.POST)
-        return render(request, 'demo/index.html', {'form': form})
+    def form_valid(self, form):
+        return render(self.request, 'demo/index.html', {'form': form})
 
 
 class DemoModelFormView(FormView):
@@ -10,3 +10,13 @@ class MaterialWidgetsConfig(AppConfig):
     """
     name = 'material_widgets'
     verbose_name = 'Material Widgets'
+
+    def ready(self):
+        """Connect the invalidation of cached model choices to model signals.
+        Warm up widget templates if MATERIAL_WARM_UP is set.
+        """
+        from . import choices  # pylint: disable=unused-import
+        from .settings import MATERIAL_WARM_UP
+        if MATERIAL_WARM_UP:
+            from .warmup import warm_up
+            warm_up(render=MATERIAL_WARM_UP == 'render')
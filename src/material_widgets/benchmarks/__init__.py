@@ -0,0 +1,183 @@
+"""Benchmark scenarios and timing helpers for Material widgets.
+
+Each scenario declares the same form field twice: once as it would be declared
+on a stock ``django.forms.Form``, and once as it would be declared on a
+``MaterialForm``. Benchmark modes build single-field and all-fields forms from
+these scenarios so that Material widgets can be compared like for like.
+
+Examples
+--------
+>>> from material_widgets.benchmarks import SCENARIOS, build_form, measure
+>>> form_class = build_form(MaterialForm, SCENARIOS)
+>>> samples = measure(form_class, number=100, repeat=5)
+
+"""
+from collections import OrderedDict
+from statistics import median
+from timeit import default_timer
+from django import forms
+from django.forms import widgets
+from ..widgets import MaterialSliderInput, MaterialSwitchInput
+
+__all__ = ('SCENARIOS', 'build_form', 'field_name', 'measure', 'summarize',)
+
+CHOICES = (
+    ('choice_1', 'Choice 1'),
+    ('choice_2', 'Choice 2'),
+    ('choice_3', 'Choice 3'),
+    )
+HELP_TEXTS = ('Help 1', 'Help 2', 'Help 3',)
+
+
+def _same(factory):
+    """Return a (plain, material) factory pair declaring an identical field."""
+    return factory, factory
+
+
+# Material widget class name: (plain field factory, material field factory)
+SCENARIOS = OrderedDict((
+    ('MaterialCheckboxInput', _same(
+        lambda: forms.BooleanField(help_text='Help', required=False))),
+    ('MaterialCheckboxSelectMultiple', _same(
+        lambda: forms.MultipleChoiceField(
+            help_text=HELP_TEXTS, choices=CHOICES,
+            widget=widgets.CheckboxSelectMultiple()))),
+    ('MaterialClearableFileInput', _same(
+        lambda: forms.FileField(help_text='Help', required=False))),
+    ('MaterialDateInput', _same(
+        lambda: forms.DateField(help_text='YYYY-MM-DD'))),
+    ('MaterialDateTimeInput', _same(
+        lambda: forms.DateTimeField(help_text='YYYY-MM-DD HH:MM:SS'))),
+    ('MaterialEmailInput', _same(
+        lambda: forms.EmailField(help_text='Help'))),
+    ('MaterialFileInput', _same(
+        lambda: forms.FileField(help_text='Help', widget=widgets.FileInput()))),
+    ('MaterialHiddenInput', _same(
+        lambda: forms.CharField(initial='hidden',
+                                widget=widgets.HiddenInput()))),
+    ('MaterialMultipleHiddenInput', _same(
+        lambda: forms.MultipleChoiceField(
+            initial=['choice_1', 'choice_2'], choices=CHOICES,
+            widget=widgets.MultipleHiddenInput()))),
+    ('MaterialNullBooleanSelect', _same(
+        lambda: forms.NullBooleanField(help_text='Help'))),
+    ('MaterialNumberInput', _same(
+        lambda: forms.IntegerField(help_text='Help',
+                                   min_value=1, max_value=9))),
+    ('MaterialPasswordInput', _same(
+        lambda: forms.CharField(help_text='Help', min_length=8,
+                                widget=widgets.PasswordInput()))),
+    ('MaterialRadioSelect', _same(
+        lambda: forms.ChoiceField(help_text=HELP_TEXTS, choices=CHOICES,
+                                  widget=widgets.RadioSelect()))),
+    ('MaterialSelect', _same(
+        lambda: forms.ChoiceField(help_text='Help', choices=CHOICES))),
+    ('MaterialSelectDateWidget', _same(
+        lambda: forms.DateField(help_text='Help',
+                                widget=widgets.SelectDateWidget()))),
+    ('MaterialSelectMultiple', _same(
+        lambda: forms.MultipleChoiceField(help_text='Help',
+                                          choices=CHOICES))),
+    ('MaterialSliderInput', (
+        lambda: forms.IntegerField(help_text='Help',
+                                   min_value=0, max_value=10),
+        lambda: forms.IntegerField(help_text='Help',
+                                   min_value=0, max_value=10,
+                                   widget=MaterialSliderInput()),
+        )),
+    ('MaterialSplitDateTimeWidget', _same(
+        lambda: forms.SplitDateTimeField())),
+    ('MaterialSplitHiddenDateTimeWidget', _same(
+        lambda: forms.SplitDateTimeField(
+            initial=['1965-08-09', '12:00:00'],
+            widget=widgets.SplitHiddenDateTimeWidget()))),
+    ('MaterialSwitchInput', (
+        lambda: forms.BooleanField(help_text='Help', required=False),
+        lambda: forms.BooleanField(help_text='Help', required=False,
+                                   widget=MaterialSwitchInput()),
+        )),
+    ('MaterialTextarea', _same(
+        lambda: forms.CharField(help_text='Help', widget=widgets.Textarea()))),
+    ('MaterialTextInput', _same(
+        lambda: forms.CharField(help_text='Help',
+                                min_length=3, max_length=32))),
+    ('MaterialTimeInput', _same(
+        lambda: forms.TimeField(help_text='HH:MM:SS'))),
+    ('MaterialURLInput', _same(
+        lambda: forms.URLField(help_text='Help'))),
+    ))
+
+
+def field_name(scenario):
+    """Return the form field name used for a scenario.
+
+    Examples
+    --------
+    >>> field_name('MaterialTextInput')
+    'materialtextinput'
+
+    """
+    return scenario.lower()
+
+
+def build_form(form_class, scenarios, material=None):
+    """Return a new form class declaring one field per scenario.
+
+    Parameters
+    ----------
+    form_class : class object
+        Base form class, e.g. `django.forms.Form` or `MaterialForm`.
+    scenarios : iterable of str
+        Scenario names from `SCENARIOS`.
+    material : bool, optional
+        Use the material field factory if True, else the plain one.
+        Defaults to whether `form_class` materializes its fields.
+
+    Returns
+    -------
+    form : class object
+        Subclass of `form_class`.
+
+    """
+    if material is None:
+        material = hasattr(form_class, 'as_components')
+    attrs = OrderedDict(
+        (field_name(scenario), SCENARIOS[scenario][int(material)]())
+        for scenario in scenarios
+        )
+    return type('Benchmark' + form_class.__name__, (form_class,), attrs)
+
+
+def measure(func, number=100, repeat=5):
+    """Time `func` and return the seconds taken per call for each repeat.
+
+    Parameters
+    ----------
+    func : callable
+        Called without arguments.
+    number : int, optional
+        Calls per sample.
+    repeat : int, optional
+        Number of samples.
+
+    Returns
+    -------
+    samples : list of float
+
+    """
+    samples = []
+    for _ in range(repeat):
+        start = default_timer()
+        for _ in range(number):
+            func()
+        samples.append((default_timer() - start) / number)
+    return samples
+
+
+def summarize(samples):
+    """Return the min, median and max of timing samples as a dict."""
+    return {
+        'min': min(samples),
+        'median': median(samples),
+        'max': max(samples),
+        }
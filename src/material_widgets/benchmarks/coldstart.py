@@ -0,0 +1,110 @@
+"""Import time and first render latency of a freshly started process.
+
+Every sample starts a new Python interpreter with the current settings and
+``sys.path``, as a management command or serverless worker would, and times
+each step from ``django.setup()`` to the first rendered form. Widgets are
+rendered a second time in the same process to separate one-off costs, such as
+loading templates, from the steady state measured by the overhead mode.
+
+Pass the directory written by the ``compile_material_templates`` command as
+`template_cache` to measure the first render with compiled templates.
+
+Examples
+--------
+>>> results = run(samples=10)
+>>> median(results['import_widgets'])
+>>> compiled = run(samples=10, template_cache='material_templates/')
+>>> median(compiled['first_render']) / median(results['first_render'])
+
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import OrderedDict
+
+__all__ = ('STEPS', 'run',)
+
+STEPS = (
+    'setup',
+    'import_forms',
+    'import_widgets',
+    'instantiate',
+    'first_render',
+    'second_render',
+    )
+
+# Run in the child process. Prints the seconds taken by each step as JSON.
+_CHILD = '''
+import json, sys
+from time import perf_counter
+steps = []
+start = perf_counter()
+def step(name):
+    global start
+    now = perf_counter()
+    steps.append((name, now - start))
+    start = now
+import django
+from django.conf import settings
+if {template_cache!r}:
+    settings.MATERIAL_TEMPLATE_CACHE = {template_cache!r}
+django.setup()
+step('setup')
+from material_widgets import forms
+step('import_forms')
+from material_widgets.benchmarks import SCENARIOS, build_form
+scenarios = {scenarios!r} or list(SCENARIOS)
+form_class = build_form(forms.MaterialForm, scenarios)
+step('import_widgets')
+form = form_class()
+step('instantiate')
+str(form)
+step('first_render')
+str(form_class())
+step('second_render')
+sys.stdout.write(json.dumps(steps))
+'''
+
+
+def _sample(scenarios, template_cache):
+    environ = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        path for path in sys.path if path
+        ))
+    output = subprocess.check_output(
+        [sys.executable, '-c', _CHILD.format(
+            scenarios=scenarios, template_cache=template_cache,
+            )],
+        env=environ,
+        )
+    return json.loads(output.decode())
+
+
+def run(scenarios=None, samples=5, template_cache=None):
+    """Time cold starts of fresh processes rendering Material forms.
+
+    Parameters
+    ----------
+    scenarios : list of str, optional
+        Names of scenarios to put in the rendered form. Defaults to all.
+    samples : int, optional
+        Processes to start.
+    template_cache : str, optional
+        ``MATERIAL_TEMPLATE_CACHE`` directory of the processes.
+
+    Returns
+    -------
+    results : dict
+        Maps each of `STEPS` to a list of `samples` durations in seconds.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If a process fails, e.g. because DJANGO_SETTINGS_MODULE is unset.
+
+    """
+    results = OrderedDict((step, []) for step in STEPS)
+    for _ in range(samples):
+        for step, seconds in _sample(list(scenarios or ()), template_cache):
+            results[step].append(seconds)
+    return results
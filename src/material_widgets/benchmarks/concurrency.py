@@ -0,0 +1,115 @@
+"""Concurrent renders of a form from asyncio tasks.
+
+Compares two ways async code can render a form whose choices come from the
+database, e.g. a `MaterialModelForm` with foreign keys:
+
+'offload'
+    Each whole render is run in a thread pool, as ``sync_to_async`` would. By
+    default the pool has a single thread, like ``sync_to_async`` with
+    ``thread_sensitive=True``.
+'async'
+    `material_widgets.forms.BaseMaterialForm.arender_components` loads the
+    choices without blocking the event loop, then renders in the event loop.
+
+Each of `concurrency` tasks renders the form `renders` times in a row, and
+the throughput and latency percentiles of both approaches are reported.
+
+Examples
+--------
+>>> from demo.forms import DemoModelForm
+>>> results = [run(DemoModelForm, tasks) for tasks in (1, 10, 50)]
+
+"""
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from django.db import close_old_connections
+from .load import PERCENTILES, percentile
+
+__all__ = ('APPROACHES', 'run',)
+
+APPROACHES = ('offload', 'async',)
+
+
+def _render(form_class):
+    try:
+        return form_class().as_components()
+    finally:
+        close_old_connections()
+
+
+async def _offload(form_class, renders, latencies):
+    loop = asyncio.get_running_loop()
+    for _ in range(renders):
+        start = perf_counter()
+        await loop.run_in_executor(None, _render, form_class)
+        latencies.append(perf_counter() - start)
+
+
+async def _async(form_class, renders, latencies):
+    for _ in range(renders):
+        start = perf_counter()
+        await form_class().arender_components()
+        latencies.append(perf_counter() - start)
+
+
+async def _gather(approach, form_class, concurrency, renders, latencies):
+    await asyncio.gather(*(
+        approach(form_class, renders, latencies) for _ in range(concurrency)
+        ))
+
+
+def _measure(approach, form_class, concurrency, renders, workers):
+    latencies = []
+    # offloaded renders and queries of the async approach share the pool
+    executor = ThreadPoolExecutor(workers)
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(executor)
+    start = perf_counter()
+    try:
+        loop.run_until_complete(_gather(
+            approach, form_class, concurrency, renders, latencies
+            ))
+    finally:
+        wall = perf_counter() - start
+        loop.close()
+        executor.shutdown()
+    return OrderedDict((
+        ('throughput', len(latencies) / wall if wall else 0.0),
+        ('latencies', latencies),
+        ('percentiles', OrderedDict(
+            (str(percent), percentile(latencies, percent))
+            for percent in PERCENTILES
+            )),
+        ))
+
+
+def run(form_class, concurrency=10, renders=10, workers=1):
+    """Render `form_class` from concurrent tasks with both approaches.
+
+    Parameters
+    ----------
+    form_class : class
+        Subclass of `material_widgets.forms.BaseMaterialForm`.
+    concurrency : int, optional
+        Tasks rendering at the same time.
+    renders : int, optional
+        Renders per task.
+    workers : int, optional
+        Threads running offloaded renders, or queries of the async approach.
+
+    Returns
+    -------
+    results : dict
+        'concurrency', and for each of `APPROACHES` the 'throughput' in
+        renders per second, 'latencies' in seconds and latency 'percentiles'.
+
+    """
+    approaches = {'offload': _offload, 'async': _async}
+    results = OrderedDict((('concurrency', concurrency),))
+    for name in APPROACHES:
+        results[name] = _measure(
+            approaches[name], form_class, concurrency, renders, workers
+            )
+    return results
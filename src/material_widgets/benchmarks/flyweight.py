@@ -0,0 +1,92 @@
+"""Time and memory of forms sharing frozen widgets between instances.
+
+A form of `fields` fields, cycling through `SCENARIOS`, is declared twice:
+'copied' with the default per-instance widget copies, and 'shared' with
+``share_widgets = True``. Both are timed for instantiation and rendering,
+and traced for the memory a single instance retains.
+
+Forms are `MaterialModelForm` subclasses when a `model` is given, declaring
+the scenario fields besides ``Meta.fields``, else `MaterialForm` subclasses.
+
+Examples
+--------
+>>> from demo.models import MaterialWidgetsDemoModel
+>>> results = run(fields=100, model=MaterialWidgetsDemoModel)
+>>> results['shared']['bytes'] / results['copied']['bytes']
+
+"""
+from collections import OrderedDict
+from itertools import cycle, islice
+from ..forms import MaterialForm, MaterialModelForm
+from . import SCENARIOS, field_name, measure, memory
+
+__all__ = ('VARIANTS', 'build_wide_form', 'run',)
+
+VARIANTS = ('copied', 'shared',)
+
+
+def build_wide_form(fields=100, model=None, share_widgets=False):
+    """Return a new form class declaring `fields` scenario fields.
+
+    Parameters
+    ----------
+    fields : int, optional
+        Fields declared, cycling through `SCENARIOS`.
+    model : class object, optional
+        Model of a `MaterialModelForm`. Defaults to a `MaterialForm`.
+    share_widgets : bool, optional
+        `BaseMaterialForm.share_widgets` of the form.
+
+    Returns
+    -------
+    form : class object
+
+    """
+    attrs = OrderedDict(
+        ('{}_{}'.format(field_name(scenario), index),
+         SCENARIOS[scenario][1]())
+        for index, scenario in enumerate(islice(cycle(SCENARIOS), fields))
+        )
+    attrs['share_widgets'] = share_widgets
+    base = MaterialForm
+    if model is not None:
+        base = MaterialModelForm
+        attrs['Meta'] = type('Meta', (), {'model': model, 'fields': []})
+    return type('Wide' + base.__name__, (base,), attrs)
+
+
+def run(fields=100, model=None, number=100, repeat=5):
+    """Run the flyweight benchmark.
+
+    Parameters
+    ----------
+    fields : int, optional
+        Fields of the benchmarked forms.
+    model : class object, optional
+        Model of the benchmarked `MaterialModelForm`.
+    number : int, optional
+        Instances per timing sample and instances traced. Renders are timed
+        a tenth as many times.
+    repeat : int, optional
+        Timing samples per metric.
+
+    Returns
+    -------
+    results : dict
+        Maps each of `VARIANTS` to 'instantiate' and 'render' timing samples,
+        and the 'bytes' and 'blocks' an instance retains.
+
+    """
+    results = OrderedDict()
+    for variant in VARIANTS:
+        form_class = build_wide_form(fields, model, variant == 'shared')
+        form = form_class()
+        allocations = memory.trace(form_class, number)
+        results[variant] = OrderedDict((
+            ('instantiate', measure(form_class, number, repeat)),
+            ('render', measure(form.as_components, max(number // 10, 1),
+                               repeat)),
+            ('bytes', allocations['bytes']),
+            ('blocks', allocations['blocks']),
+            ))
+    return results
@@ -0,0 +1,166 @@
+"""Concurrent load on the project's WSGI application.
+
+Pages are requested by calling the WSGI application in-process, as a WSGI
+server such as gunicorn would, from several threads in each of several
+processes. No external load generator or network is involved, so the results
+isolate the cost of Django and Material form rendering.
+
+Each run reports throughput, latency percentiles per path, and the CPU time of
+each process over its wall time. A threaded run whose CPU to wall ratio stays
+near 1.0 while latency grows with threads is bound by the GIL.
+
+Examples
+--------
+Measure how the demo pages scale from 1 to 8 threads in 1 and 4 processes.
+
+>>> runs = [run(['/', '/modelform/'], threads, processes)
+...         for processes in (1, 4) for threads in (1, 2, 4, 8)]
+
+"""
+import multiprocessing
+import sys
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from time import perf_counter, process_time
+import django
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+
+__all__ = ('PERCENTILES', 'percentile', 'run',)
+
+PERCENTILES = (50, 95, 99,)
+
+
+def percentile(samples, percent):
+    """Return the nearest-rank `percent` percentile of `samples`."""
+    ordered = sorted(samples)
+    rank = max(-(-percent * len(ordered) // 100), 1)
+    return ordered[rank - 1]
+
+
+def _environ(path, host):
+    path, _, query = path.partition('?')
+    return {
+        'REQUEST_METHOD': 'GET',
+        'SCRIPT_NAME': '',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': host,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': host,
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+        }
+
+
+def _request(application, path, host):
+    """Return (status code, seconds) of one request to `application`."""
+    status = []
+    start = perf_counter()
+    response = application(
+        _environ(path, host),
+        lambda code, headers, exc_info=None: status.append(code),
+        )
+    try:
+        for _ in response:
+            pass
+    finally:
+        if hasattr(response, 'close'):
+            response.close()
+    return int(status[0].split()[0]), perf_counter() - start
+
+
+def _drive(arguments):
+    """Request paths from threads in this process and return the samples."""
+    paths, threads, requests, host = arguments
+    application = get_wsgi_application()
+    samples = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        for index in range(requests):
+            path = paths[(offset + index) % len(paths)]
+            result = _request(application, path, host)
+            with lock:
+                samples.append((path,) + result)
+
+    workers = [
+        threading.Thread(target=worker, args=(offset,))
+        for offset in range(threads)
+        ]
+    cpu, start = process_time(), perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    cpu, wall = process_time() - cpu, perf_counter() - start
+    return samples, cpu / wall if wall else 0.0, wall
+
+
+def run(paths, threads=1, processes=1, requests=50, host='localhost'):
+    """Request `paths` concurrently and return throughput and latencies.
+
+    Parameters
+    ----------
+    paths : list of str
+        URL paths to request, e.g. '/' or '/modelform/'. Each thread cycles
+        through them.
+    threads : int, optional
+        Threads per process.
+    processes : int, optional
+        Worker processes. Requests are made in-process if 1.
+    requests : int, optional
+        Requests per thread.
+    host : str, optional
+        Host header of the requests. Must be in ``ALLOWED_HOSTS``.
+
+    Returns
+    -------
+    result : dict
+        'threads', 'processes', 'requests' in total, 'throughput' in requests
+        per second, 'cpu' to wall time ratio of each process, and 'paths'
+        mapping each path to its 'latencies' in seconds, count of 'errors'
+        (status 400 or above) and latency 'percentiles'.
+
+    """
+    arguments = (list(paths), threads, requests, host)
+    if processes == 1:
+        outcomes = [_drive(arguments)]
+    else:
+        # children must not share the parent's database connections
+        connections.close_all()
+        pool = multiprocessing.Pool(processes, initializer=django.setup)
+        try:
+            outcomes = pool.map(_drive, [arguments] * processes)
+        finally:
+            pool.close()
+            pool.join()
+    by_path = OrderedDict(
+        (path, {'latencies': [], 'errors': 0}) for path in paths
+        )
+    for samples, _, _ in outcomes:
+        for path, status, seconds in samples:
+            by_path[path]['latencies'].append(seconds)
+            by_path[path]['errors'] += status >= 400
+    for result in by_path.values():
+        result['percentiles'] = OrderedDict(
+            (str(percent), percentile(result['latencies'], percent))
+            for percent in PERCENTILES
+            ) if result['latencies'] else {}
+    total = sum(len(samples) for samples, _, _ in outcomes)
+    wall = max(wall for _, _, wall in outcomes)
+    return OrderedDict((
+        ('threads', threads),
+        ('processes', processes),
+        ('requests', total),
+        ('throughput', total / wall if wall else 0.0),
+        ('cpu', [cpu for _, cpu, _ in outcomes]),
+        ('paths', by_path),
+        ))
@@ -0,0 +1,227 @@
+"""Memory allocations of ``MaterialForm`` instantiation and rendering.
+
+Allocations are traced with `tracemalloc`. Each operation is run once to warm
+up caches, then `number` times with every result kept alive, so the traced
+difference is the memory a single operation retains, e.g. a form instance and
+its materialized fields, or a rendered widget. Allocations are attributed to
+the innermost line of ``material_widgets/forms.py``, ``widgets.py``,
+``_widgets.py`` or ``flyweight.py`` on their traceback.
+
+Budgets are stored as JSON mapping Python versions, e.g. ``"3.11"``, then
+scenario names and operations to the maximum retained 'bytes' and 'peak'
+bytes per call. Allocations differ between Python versions, and slightly
+between runs, so budgets are only enforced for the running Python version,
+with the headroom they were written with. `FORM` is the scenario name of the
+form declaring every field. The shipped budgets were recorded with the cached
+template loader, i.e. ``DEBUG = False``, in a fresh process.
+
+"""
+import json
+import os
+import sys
+import tracemalloc
+from collections import Counter, OrderedDict
+from ..forms import MaterialForm
+from . import SCENARIOS, build_form, field_name
+
+__all__ = (
+    'BUDGETED', 'BUDGETS', 'FORM', 'OPERATIONS', 'exceeded', 'load_budgets',
+    'python_version', 'run', 'trace', 'write_budgets',
+    )
+
+BUDGETS = os.path.join(os.path.dirname(__file__), 'memory_budgets.json')
+FORM = 'MaterialForm'
+OPERATIONS = ('instantiate', 'render',)
+BUDGETED = ('bytes', 'peak',)
+
+_PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SOURCES = tuple(
+    os.path.join(_PACKAGE, filename)
+    for filename in ('forms.py', 'widgets.py', '_widgets.py', 'flyweight.py')
+    )
+
+
+def _source_line(traceback):
+    """Return 'filename:lineno' of the innermost package frame, or None."""
+    for frame in reversed(traceback):
+        if frame.filename in _SOURCES:
+            return '{}:{}'.format(
+                os.path.basename(frame.filename), frame.lineno
+                )
+    return None
+
+
+def trace(func, number=20):
+    """Return allocations retained per call of `func`.
+
+    Parameters
+    ----------
+    func : callable
+        Called without arguments. Its return values are kept alive until all
+        calls have been traced.
+    number : int, optional
+        Calls to trace.
+
+    Returns
+    -------
+    allocations : dict
+        'bytes' and 'blocks' retained per call, 'peak' bytes allocated at once
+        during a call, and 'lines' mapping source lines of the package
+        modules above to bytes retained per call. 'peak' is None before Python
+        3.9, which lacks `tracemalloc.reset_peak`.
+
+    """
+    func()
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start(10)
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)
+    peak = None
+    try:
+        before = tracemalloc.take_snapshot()
+        results = []
+        for _ in range(number):
+            if reset_peak is not None:
+                reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+            results.append(func())
+            if reset_peak is not None:
+                peak = max(
+                    peak or 0, tracemalloc.get_traced_memory()[1] - current
+                    )
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not started:
+            tracemalloc.stop()
+    del results
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    diff = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), 'traceback'
+        )
+    lines = Counter()
+    for stat in diff:
+        line = _source_line(stat.traceback)
+        if line is not None:
+            lines[line] += stat.size_diff
+    return {
+        'bytes': sum(stat.size_diff for stat in diff) // number,
+        'blocks': sum(stat.count_diff for stat in diff) // number,
+        'peak': peak,
+        'lines': OrderedDict(
+            (line, size // number) for line, size in lines.most_common()
+            if size > 0
+            ),
+        }
+
+
+def _profile(form_class, render, number):
+    form = form_class()
+    return OrderedDict((
+        ('instantiate', trace(form_class, number)),
+        ('render', trace(lambda: render(form), number)),
+        ))
+
+
+def run(scenarios=None, number=20):
+    """Run the memory benchmark.
+
+    Parameters
+    ----------
+    scenarios : iterable of str, optional
+        Scenario names from `material_widgets.benchmarks.SCENARIOS`.
+        Defaults to all scenarios.
+    number : int, optional
+        Calls traced per operation.
+
+    Returns
+    -------
+    results : dict
+        Maps each scenario, and `FORM`, to the allocations of each of
+        `OPERATIONS`.
+
+    """
+    scenarios = list(scenarios or SCENARIOS)
+    results = OrderedDict()
+    for scenario in scenarios:
+        name = field_name(scenario)
+        results[scenario] = _profile(
+            build_form(MaterialForm, [scenario]),
+            lambda form, name=name: str(form[name]),
+            number,
+            )
+    results[FORM] = _profile(
+        build_form(MaterialForm, scenarios), MaterialForm.as_components, number
+        )
+    return results
+
+
+def python_version():
+    """Return the 'major.minor' version of the running Python."""
+    return '{}.{}'.format(*sys.version_info[:2])
+
+
+def _load(path):
+    try:
+        with open(path) as budgets:
+            return json.load(budgets, object_pairs_hook=OrderedDict)
+    except FileNotFoundError:
+        return OrderedDict()
+
+
+def load_budgets(path=BUDGETS, version=None):
+    """Return the budgets of Python `version` stored as JSON at `path`.
+
+    Parameters
+    ----------
+    path : str, optional
+        Budgets file.
+    version : str, optional
+        Python version, defaults to `python_version`.
+
+    Returns
+    -------
+    budgets : dict
+        Budgets by scenario and operation, empty if none were written for
+        `version`.
+
+    """
+    return _load(path).get(version or python_version(), {})
+
+
+def write_budgets(results, path=BUDGETS, headroom=1.25, version=None):
+    """Store `headroom` times the measured allocations as the budgets of
+    Python `version`, defaulting to `python_version`, at `path`. Budgets of
+    other versions are kept.
+    """
+    budgets = OrderedDict(
+        (scenario, OrderedDict(
+            (operation, OrderedDict(
+                (key, int(allocations[key] * headroom))
+                for key in BUDGETED if allocations[key] is not None
+                ))
+            for operation, allocations in operations.items()
+            ))
+        for scenario, operations in results.items()
+        )
+    versions = _load(path)
+    versions[version or python_version()] = budgets
+    with open(path, 'w') as output:
+        json.dump(OrderedDict(sorted(versions.items())), output, indent=2)
+        output.write('\n')
+    return budgets
+
+
+def exceeded(results, budgets):
+    """Return (scenario, operation, key, bytes, budget) for each exceeded
+    budget.
+
+    Allocations without a budget, or not measured, are never exceeded.
+
+    """
+    return [
+        (scenario, operation, key, allocations[key], budget)
+        for scenario, operations in results.items()
+        for operation, allocations in operations.items()
+        for key, budget in budgets.get(scenario, {}).get(operation, {}).items()
+        if allocations.get(key) is not None and allocations[key] > budget
+        ]
@@ -0,0 +1,109 @@
+"""Overhead of ``MaterialForm`` over a stock ``django.forms.Form``.
+
+Every scenario is declared twice, once on each base class, and timed for
+instantiation, rendering and media resolution. Per-field results use a form
+with the single scenario field; the per-form result uses a form with every
+scenario field.
+
+Rendering is timed with ``str(form[name])`` per field, and with ``str(form)``
+against ``MaterialForm.as_components()`` per form.
+
+Each operation is first run `warmup` times untimed, so that imports, template
+compilation and other one-time costs are not measured as overhead of the
+first scenarios.
+
+"""
+from collections import OrderedDict
+from statistics import median
+from django.forms import Form
+from ..forms import MaterialForm
+from . import SCENARIOS, build_form, field_name, measure
+
+__all__ = ('METRICS', 'ratio', 'run',)
+
+METRICS = ('instantiate', 'render', 'media',)
+
+
+def _timings(form_class, render, number, repeat, warmup):
+    form = form_class()
+    for _ in range(warmup):
+        form_class()
+        render(form)
+        str(form.media)
+    return OrderedDict((
+        ('instantiate', measure(form_class, number, repeat)),
+        ('render', measure(lambda: render(form), number, repeat)),
+        ('media', measure(lambda: str(form.media), number, repeat)),
+        ))
+
+
+def _compare(plain_class, material_class, plain_render, material_render,
+             number, repeat, warmup):
+    plain = _timings(plain_class, plain_render, number, repeat, warmup)
+    material = _timings(material_class, material_render, number, repeat,
+                        warmup)
+    return OrderedDict(
+        (metric, {'plain': plain[metric], 'material': material[metric]})
+        for metric in METRICS
+        )
+
+
+def ratio(result):
+    """Return the material to plain ratio of median timings for a metric.
+
+    Parameters
+    ----------
+    result : dict
+        Dict with 'plain' and 'material' lists of timing samples.
+
+    Returns
+    -------
+    ratio : float
+
+    """
+    plain = median(result['plain'])
+    return median(result['material']) / plain if plain else float('inf')
+
+
+def run(scenarios=None, number=100, repeat=5, warmup=10):
+    """Run the overhead benchmark.
+
+    Parameters
+    ----------
+    scenarios : iterable of str, optional
+        Scenario names from `material_widgets.benchmarks.SCENARIOS`.
+        Defaults to all scenarios.
+    number : int, optional
+        Calls per timing sample.
+    repeat : int, optional
+        Timing samples per metric.
+    warmup : int, optional
+        Untimed calls of each operation before its samples.
+
+    Returns
+    -------
+    results : dict
+        'fields' maps each scenario to its metrics, and 'form' holds the
+        metrics of the form declaring every scenario field. Each metric maps
+        'plain' and 'material' to lists of seconds per call.
+
+    """
+    scenarios = list(scenarios or SCENARIOS)
+    fields = OrderedDict()
+    for scenario in scenarios:
+        name = field_name(scenario)
+        fields[scenario] = _compare(
+            build_form(Form, [scenario]),
+            build_form(MaterialForm, [scenario]),
+            lambda form, name=name: str(form[name]),
+            lambda form, name=name: str(form[name]),
+            number, repeat, warmup,
+            )
+    form = _compare(
+        build_form(Form, scenarios),
+        build_form(MaterialForm, scenarios),
+        str,
+        MaterialForm.as_components,
+        number, repeat, warmup,
+        )
+    return {'fields': fields, 'form': form}
@@ -0,0 +1,247 @@
+"""Store benchmark results and compare them for regressions.
+
+Results are saved as JSON files named after their mode and UTC timestamp,
+together with the Python, Django and django-material-widgets versions they
+were recorded with. Comparing two result files flags every measurement that
+got slower, or larger, by more than a threshold percentage.
+
+Timings are compared on their medians and must also be significantly slower
+under a one-sided Mann-Whitney U test, so that noise between runs is not
+reported as a regression. Memory allocations vary far less than timings, but
+still slightly between runs, e.g. with hash randomization, so they are
+compared on the threshold alone, which should leave room for that.
+
+Examples
+--------
+>>> path = save('overhead', overhead.run(), 'benchmarks/')
+>>> regressions = [row for row in compare(load(old), load(path))
+...                if row['regression']]
+
+"""
+import json
+import os
+import platform
+from collections import Counter, OrderedDict
+from datetime import datetime
+from math import erf, sqrt
+from statistics import median
+import django
+
+__all__ = ('FORMAT', 'compare', 'load', 'mann_whitney_u', 'save',)
+
+FORMAT = 1
+EXACT_LIMIT = 50  # largest combined sample size tested with exact p-values
+
+
+def _package_version():
+    try:
+        from pkg_resources import get_distribution
+        return get_distribution('django-material-widgets').version
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def save(mode, results, directory, options=None):
+    """Save `results` of a benchmark `mode` as timestamped JSON.
+
+    Parameters
+    ----------
+    mode : str
+        Benchmark mode that produced the results, e.g. 'overhead'.
+    results : dict
+        Results returned by the benchmark mode.
+    directory : str
+        Directory to save the JSON file in. Created if missing.
+    options : dict, optional
+        Benchmark options to record with the results.
+
+    Returns
+    -------
+    path : str
+        Path of the saved file.
+
+    """
+    created = datetime.utcnow()
+    document = OrderedDict((
+        ('format', FORMAT),
+        ('mode', mode),
+        ('created', created.isoformat() + 'Z'),
+        ('versions', OrderedDict((
+            ('python', platform.python_version()),
+            ('django', django.get_version()),
+            ('material_widgets', _package_version()),
+            ))),
+        ('options', options or {}),
+        ('results', results),
+        ))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'material_benchmark-{}-{}.json'.format(
+        mode, created.strftime('%Y%m%dT%H%M%S%fZ')
+        ))
+    with open(path, 'w') as output:
+        json.dump(document, output, indent=2)
+        output.write('\n')
+    return path
+
+
+def load(path):
+    """Return a saved results document, checking its format.
+
+    Raises
+    ------
+    ValueError
+        If the file was not saved by `save` in a supported format.
+
+    """
+    with open(path) as source:
+        document = json.load(source)
+    if not isinstance(document, dict) or document.get('format') != FORMAT:
+        raise ValueError('{} is not a benchmark results file.'.format(path))
+    return document
+
+
+def _ranks(values):
+    """Return the 1-based ranks of values, averaging ties."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while (end + 1 < len(order)
+               and values[order[end + 1]] == values[order[start]]):
+            end += 1
+        for index in order[start:end + 1]:
+            ranks[index] = (start + end) / 2.0 + 1
+        start = end + 1
+    return ranks
+
+
+def mann_whitney_u(baseline, candidate):
+    """Test whether `candidate` samples tend to be larger than `baseline`.
+
+    Uses exact p-values for small samples without ties, else the normal
+    approximation with tie and continuity corrections.
+
+    Parameters
+    ----------
+    baseline, candidate : list of float
+
+    Returns
+    -------
+    u : float
+        U statistic of `candidate`.
+    p : float
+        One-sided p-value.
+
+    """
+    n1, n2 = len(candidate), len(baseline)
+    values = list(candidate) + list(baseline)
+    ranks = _ranks(values)
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+    if n1 + n2 <= EXACT_LIMIT and len(set(values)) == len(values):
+        # count the rank sums of every way to draw n1 of the ranks
+        sums = [Counter() for _ in range(n1 + 1)]
+        sums[0][0] = 1
+        for rank in range(1, n1 + n2 + 1):
+            for drawn in range(min(rank, n1), 0, -1):
+                for total, ways in sums[drawn - 1].items():
+                    sums[drawn][total + rank] += ways
+        observed = u + n1 * (n1 + 1) / 2.0
+        extreme = sum(
+            ways for total, ways in sums[n1].items() if total >= observed
+            )
+        return u, extreme / sum(sums[n1].values())
+    ties = sum(
+        count ** 3 - count
+        for count in (values.count(value) for value in set(values))
+        )
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - ties / (n * (n - 1.0)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / sqrt(variance)
+    return u, 0.5 * (1 - erf(z / sqrt(2)))
+
+
+def _measurements(mode, results):
+    """Yield (name, metric, samples, value) for every comparable measurement."""
+    if mode == 'overhead':
+        entries = [('fields/' + scenario, metrics)
+                   for scenario, metrics in results['fields'].items()]
+        entries.append(('form', results['form']))
+        for prefix, metrics in entries:
+            for metric, result in metrics.items():
+                samples = result['material']
+                yield ('{}/{}'.format(prefix, metric), metric,
+                       samples, median(samples))
+    elif mode == 'memory':
+        for scenario, operations in results.items():
+            for operation, allocations in operations.items():
+                for key in ('bytes', 'peak'):
+                    if allocations.get(key) is not None:
+                        yield ('{}/{}/{}'.format(scenario, operation, key),
+                               operation, None, allocations[key])
+    elif mode == 'coldstart':
+        for step, samples in results.items():
+            yield step, step, samples, median(samples)
+    else:
+        raise ValueError('Cannot compare {} results.'.format(mode))
+
+
+def compare(baseline, candidate, threshold=5.0, alpha=0.05, metrics=None):
+    """Compare two saved results documents of the same mode.
+
+    Parameters
+    ----------
+    baseline, candidate : dict
+        Documents returned by `load`.
+    threshold : float, optional
+        Percentage increase above which a measurement regresses.
+    alpha : float, optional
+        Significance level for timing regressions.
+    metrics : iterable of str, optional
+        Only compare these metrics, e.g. 'render', or memory operations.
+        Defaults to all.
+
+    Returns
+    -------
+    rows : list of dict
+        One row per measurement found in both documents, with 'name',
+        'baseline', 'candidate', 'change' percentage, 'p' value (None for
+        memory) and 'regression' flag.
+
+    Raises
+    ------
+    ValueError
+        If the documents were recorded by different modes.
+
+    """
+    if baseline['mode'] != candidate['mode']:
+        raise ValueError('Cannot compare {} results with {} results.'.format(
+            baseline['mode'], candidate['mode']
+            ))
+    mode = baseline['mode']
+    old = {
+        name: (samples, value)
+        for name, metric, samples, value
+        in _measurements(mode, baseline['results'])
+        }
+    rows = []
+    for name, metric, samples, value in _measurements(
+            mode, candidate['results']):
+        if name not in old or (metrics and metric not in metrics):
+            continue
+        old_samples, old_value = old[name]
+        change = ((value - old_value) / old_value * 100 if old_value
+                  else 0.0)
+        p = (mann_whitney_u(old_samples, samples)[1] if samples is not None
+             else None)
+        rows.append(OrderedDict((
+            ('name', name),
+            ('baseline', old_value),
+            ('candidate', value),
+            ('change', change),
+            ('p', p),
+            ('regression', change > threshold and (p is None or p < alpha)),
+            )))
+    return rows
@@ -0,0 +1,340 @@
+"""Validate and save many rows of data with one Material model form.
+
+`bulk_validate` prepares a single instance of the form, with lazy widgets so
+no widget is materialized, and cleans each row of data in it instead of
+instantiating a form per row. Rows are handled in chunks:
+
+1. The values of every `ModelChoiceField` and `ModelMultipleChoiceField` in
+   the chunk are fetched with one ``pk__in`` query per field. Cleaning the
+   rows then looks the objects up instead of querying them one at a time, and
+   the model does not query foreign keys chosen from these objects again.
+2. Each row is cleaned as ``form.is_valid()`` would.
+3. Valid rows are saved with one ``bulk_create`` per chunk, and their many to
+   many values then set. Rows with many to many values are saved one by one
+   if the database cannot return the primary keys of bulk inserts.
+4. The result of each row of the chunk is yielded.
+
+Uniqueness is still validated row by row, with a query per unique field,
+and against the valid rows before it in the chunk, whose values are not in
+the database yet.
+
+Rows saved with ``bulk_create`` do not call ``Model.save()``, and send no
+``pre_save`` or ``post_save`` signals. Code relying on either, e.g. a
+``save()`` override filling in fields or signal handlers, does not run for
+them, unlike with ``form.save()`` per row. Rows with many to many values
+saved one by one on databases without bulk insert keys are the exception.
+
+Examples
+--------
+>>> with open('books.csv', newline='') as rows:
+>>>     for result in BookForm.bulk_validate(csv.DictReader(rows)):
+>>>         if result.errors:
+>>>             print(result.index, result.errors.as_json())
+
+"""
+from collections import namedtuple
+from itertools import islice
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import connections, router, transaction
+from django.forms.models import (
+    ModelChoiceField, ModelMultipleChoiceField,
+    )
+
+__all__ = ('RowResult', 'bulk_validate',)
+
+RowResult = namedtuple('RowResult', ('index', 'instance', 'errors',))
+RowResult.__doc__ = """Result of a row of `bulk_validate`.
+
+Attributes
+----------
+index : int
+    Position of the row in the rows, from 0.
+instance : django.db.models.Model
+    Instance built from the row. Saved if `errors` is empty and `commit` is
+    True, though its pk is only set if saved one by one, or if the database
+    returns the primary keys of bulk inserts.
+errors : django.forms.utils.ErrorDict
+    Errors of the row by field name, empty if valid.
+
+"""
+
+
+def _is_key(value):
+    return isinstance(value, (str, int)) and not isinstance(value, bool)
+
+
+def _has_values(value):
+    """Return whether a cleaned value holds any object, without querying."""
+    query = getattr(value, 'query', None)
+    if query is not None:
+        return not query.is_empty()
+    return bool(value)
+
+
+def _fetch(field, values):
+    """Return the objects of `field.queryset` whose key is in `values`, by
+    key as text. Values that are not valid keys are left out.
+    """
+    key = field.to_field_name or 'pk'
+    model_field = (field.queryset.model._meta.pk if key == 'pk'
+                   else field.queryset.model._meta.get_field(key))
+    keys = set()
+    for value in values:
+        try:
+            keys.add(model_field.to_python(value))
+        except ValidationError:
+            continue
+    if not keys:
+        return {}
+    return {
+        str(getattr(obj, key)): obj
+        for obj in field.queryset.filter(**{key + '__in': keys})
+        }
+
+
+def _to_python(field, objects):
+    """Return a `ModelChoiceField.to_python` looking up `objects`."""
+    fallback = field.to_python
+
+    def to_python(value):
+        if value in field.empty_values:
+            return None
+        if _is_key(value) and str(value) in objects:
+            return objects[str(value)]
+        # unknown values query the database as usual, and mostly fail
+        return fallback(value)
+
+    return to_python
+
+
+def _check_values(field, objects):
+    """Return a `ModelMultipleChoiceField._check_values` looking up
+    `objects`.
+    """
+    # pylint: disable=protected-access
+    fallback = field._check_values
+    key = field.to_field_name or 'pk'
+
+    def check_values(value):
+        try:
+            values = frozenset(value)
+        except TypeError:
+            return fallback(value)
+        if not all(_is_key(val) and str(val) in objects for val in values):
+            return fallback(value)
+        return field.queryset.filter(**{key + '__in': values})
+
+    return check_values
+
+
+class _PreparedForm:
+    """Form instance cleaning one row after the other."""
+    # pylint: disable=protected-access
+
+    def __init__(self, form_class, kwargs):
+        form = form_class.__new__(form_class)
+        # materialize nothing unless a field is accessed for display
+        form.lazy_widgets = True
+        form.__init__(data={}, **kwargs)
+        self.form = form
+        self.model = form._meta.model
+        self.choice_fields = [
+            (name, field) for name, field in form.fields.items()
+            if isinstance(field, ModelChoiceField) and not field.disabled
+            ]
+        model_fields = {field.name: field for field in self.model._meta.fields}
+        self.resolved = [
+            name for name, field in self.choice_fields
+            if not isinstance(field, ModelMultipleChoiceField)
+            and getattr(model_fields.get(name), 'remote_field', None)
+            ]
+        self.excluding_resolved = False
+        # unique values of the valid rows of the chunk, by unique check
+        self.unique_values = {}
+        self.row_unique_values = []
+        exclusions = form._get_validation_exclusions
+        validate_unique = form.validate_unique
+
+        def get_validation_exclusions():
+            exclude = exclusions()
+            if self.excluding_resolved:
+                exclude.extend(self.resolved)
+            return exclude
+
+        def validate_unique_once():
+            # unique checks include the foreign keys chosen from the fetched
+            # objects, which only the model's field validation skips
+            self.excluding_resolved = False
+            validate_unique()
+            self.validate_unique_in_chunk()
+
+        form._get_validation_exclusions = get_validation_exclusions
+        form.validate_unique = validate_unique_once
+
+    def validate_unique_in_chunk(self):
+        """Add an error for each unique value of the row already taken by a
+        valid row of the chunk, as `Model.validate_unique` does for the
+        database.
+        """
+        form = self.form
+        instance = form.instance
+        connection = connections[router.db_for_write(self.model)]
+        unique_checks, _ = instance._get_unique_checks(
+            exclude=form._get_validation_exclusions()
+            )
+        errors = {}
+        self.row_unique_values = []
+        for model_class, unique_check in unique_checks:
+            values = tuple(
+                getattr(instance, self.model._meta.get_field(name).attname)
+                for name in unique_check
+                )
+            # NULLs are never equal, as in Model._perform_unique_checks
+            if any(value is None or (
+                    value == ''
+                    and connection.features.interprets_empty_strings_as_nulls
+                    ) for value in values):
+                continue
+            check = (model_class, unique_check)
+            if values in self.unique_values.get(check, ()):
+                key = (unique_check[0] if len(unique_check) == 1
+                       else NON_FIELD_ERRORS)
+                errors.setdefault(key, []).append(
+                    instance.unique_error_message(model_class, unique_check)
+                    )
+            else:
+                self.row_unique_values.append((check, values))
+        if errors:
+            form._update_errors(ValidationError(errors))
+
+    def prefetch(self, rows):
+        """Fetch the model choices of `rows` and look them up when cleaning.
+        """
+        form = self.form
+        self.unique_values = {}
+        for name, field in self.choice_fields:
+            # look up the objects of this chunk only
+            field.__dict__.pop('to_python', None)
+            field.__dict__.pop('_check_values', None)
+            values = []
+            for row in rows:
+                value = field.widget.value_from_datadict(
+                    row, {}, form.add_prefix(name)
+                    )
+                if isinstance(value, (list, tuple)):
+                    values.extend(val for val in value if _is_key(val))
+                elif _is_key(value):
+                    values.append(value)
+            objects = _fetch(field, values)
+            if isinstance(field, ModelMultipleChoiceField):
+                field._check_values = _check_values(field, objects)
+            else:
+                field.to_python = _to_python(field, objects)
+
+    def clean(self, row):
+        """Clean `row` and return the form's errors."""
+        form = self.form
+        form.data = row
+        form.is_bound = True
+        form._errors = None
+        form._bound_fields_cache.clear()
+        form.__dict__.pop('changed_data', None)
+        form.instance = self.model()
+        self.excluding_resolved = True
+        self.row_unique_values = []
+        form.full_clean()
+        if not form._errors:
+            for check, values in self.row_unique_values:
+                self.unique_values.setdefault(check, set()).add(values)
+        return form._errors
+
+
+def _save(prepared, pending):
+    """Save the valid instances of a chunk, with their many to many values.
+
+    Parameters
+    ----------
+    prepared : _PreparedForm
+    pending : list of tuple
+        Valid instance and cleaned_data of each row.
+
+    """
+    # pylint: disable=protected-access
+    model = prepared.model
+    form = prepared.form
+    using = router.db_for_write(model)
+    features = connections[using].features
+    returns_keys = getattr(
+        features, 'can_return_rows_from_bulk_insert',
+        getattr(features, 'can_return_ids_from_bulk_insert', False),
+        )
+    many_to_many = [
+        field.name for field in model._meta.many_to_many
+        if field.name in form.fields
+        ]
+    related = [
+        (instance, data) for instance, data in pending
+        if any(_has_values(data.get(name)) for name in many_to_many)
+        ]
+    saved_apart = set() if returns_keys else set(
+        id(instance) for instance, _ in related
+        )
+    with transaction.atomic(using=using):
+        model._default_manager.db_manager(using).bulk_create([
+            instance for instance, _ in pending
+            if id(instance) not in saved_apart
+            ])
+        for instance, data in related:
+            if id(instance) in saved_apart:
+                instance.save(using=using)
+            form.instance, form.cleaned_data = instance, data
+            form._save_m2m()
+
+
+def bulk_validate(form_class, rows, chunk_size=500, commit=True, **kwargs):
+    """Clean rows of data with one instance of a model form, and save the
+    valid rows in bulk.
+
+    Parameters
+    ----------
+    form_class : class
+        Subclass of `material_widgets.forms.MaterialModelForm`.
+    rows : iterable of dict
+        Data of each row, as the form's ``data``, e.g. from
+        `csv.DictReader` or a JSON list. Consumed one chunk at a time.
+    chunk_size : int, optional
+        Rows fetched, cleaned and saved together.
+    commit : bool, optional
+        Save the valid rows. Each chunk is saved in a transaction.
+    **kwargs
+        Passed to the form, e.g. ``prefix``. Not ``instance``: every row
+        creates an instance.
+
+    Yields
+    ------
+    result : RowResult
+        Result of each row, in order, once its chunk is saved.
+
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1.')
+    prepared = _PreparedForm(form_class, kwargs)
+    rows = iter(rows)
+    index = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        prepared.prefetch(chunk)
+        results, pending = [], []
+        for row in chunk:
+            errors = prepared.clean(row)
+            instance = prepared.form.instance
+            if not errors:
+                pending.append((instance, prepared.form.cleaned_data))
+            results.append(RowResult(index, instance, errors))
+            index += 1
+        if commit and pending:
+            _save(prepared, pending)
+        for result in results:
+            yield result
@@ -0,0 +1,196 @@
+"""Process-wide caches safe under threaded servers.
+
+`StripedCache` spreads keys over independently locked stripes. Reads take no
+lock. Writes, and the computation of missing values by `get_or_set`, lock
+only their key's stripe, so each missing value is computed once however many
+threads ask for it. Stripe locks are reentrant, so computing a value may look
+up other keys of the cache. Every stripe holds up to ``maxsize / stripes`` entries and
+evicts its oldest entry first.
+
+Hits, misses, evictions and the time spent waiting for stripe locks are
+counted per thread, so that counting needs no lock and loses no update. The
+counts of a thread are added to the cache's totals when the thread ends, so
+thread-per-request servers do not keep counters of every past thread.
+
+Examples
+--------
+>>> cache = StripedCache('fragments', maxsize=256)
+>>> cache.get_or_set(('login', 'en'), render)
+>>> stats()['fragments']
+OrderedDict([('hits', 0), ('misses', 1), ('evictions', 0),
+             ('lock_wait', 1.2e-06), ('size', 1)])
+
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from time import perf_counter
+
+__all__ = ('CACHES', 'StripedCache', 'stats',)
+
+CACHES = OrderedDict()
+
+_MISSING = object()
+
+
+class _Counters:
+    __slots__ = ('hits', 'misses', 'evictions', 'lock_wait',)
+
+    def __init__(self):
+        self.hits = self.misses = self.evictions = 0
+        self.lock_wait = 0.0
+
+    def add(self, other):
+        """Add the counts of `other`."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.lock_wait += other.lock_wait
+
+
+class _Owner:
+    """Thread-local object whose collection retires a thread's counters."""
+    __slots__ = ('__weakref__',)
+
+
+class _Stripe:
+    __slots__ = ('lock', 'data',)
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data = OrderedDict()
+
+
+class StripedCache:
+    """Bounded mapping with striped locks, lock-free reads and statistics.
+
+    Parameters
+    ----------
+    name : str
+        Name under which the cache is registered in `CACHES`.
+    maxsize : int, optional
+        Maximum number of entries.
+    stripes : int, optional
+        Number of independently locked stripes.
+
+    """
+
+    def __init__(self, name, maxsize=1024, stripes=16):
+        self.name = name
+        self.stripe_size = max(maxsize // stripes, 1)
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+        self._local = threading.local()
+        self._counters = set()
+        self._retired = _Counters()
+        self._counters_lock = threading.Lock()
+        CACHES[name] = self
+
+    def _count(self):
+        """Return the counters of the current thread."""
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = _Counters()
+            # the owner is discarded with the thread's locals when it ends
+            owner = self._local.owner = _Owner()
+            with self._counters_lock:
+                self._counters.add(counters)
+            weakref.finalize(owner, self._retire, counters)
+            return counters
+
+    def _retire(self, counters):
+        """Add the counters of an ended thread to the totals."""
+        with self._counters_lock:
+            self._counters.discard(counters)
+            self._retired.add(counters)
+
+    def _stripe(self, key):
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _acquire(self, stripe, counters):
+        start = perf_counter()
+        stripe.lock.acquire()
+        counters.lock_wait += perf_counter() - start
+
+    def _store(self, stripe, key, value, counters):
+        """Store under the stripe's lock, evicting the oldest entries."""
+        stripe.data[key] = value
+        while len(stripe.data) > self.stripe_size:
+            stripe.data.popitem(last=False)
+            counters.evictions += 1
+
+    def get(self, key, default=None):
+        """Return the value of `key`, or `default` if missing."""
+        value = self._stripe(key).data.get(key, _MISSING)
+        counters = self._count()
+        if value is _MISSING:
+            counters.misses += 1
+            return default
+        counters.hits += 1
+        return value
+
+    def get_or_set(self, key, factory):
+        """Return the value of `key`, storing ``factory()`` if missing.
+
+        `factory` is called at most once per missing key, while holding the
+        key's stripe lock. It may call the cache again for other keys.
+
+        """
+        stripe = self._stripe(key)
+        counters = self._count()
+        value = stripe.data.get(key, _MISSING)
+        if value is not _MISSING:
+            counters.hits += 1
+            return value
+        self._acquire(stripe, counters)
+        try:
+            value = stripe.data.get(key, _MISSING)
+            if value is not _MISSING:
+                counters.hits += 1
+                return value
+            counters.misses += 1
+            value = factory()
+            self._store(stripe, key, value, counters)
+            return value
+        finally:
+            stripe.lock.release()
+
+    def set(self, key, value):
+        """Store `value` under `key`."""
+        stripe = self._stripe(key)
+        counters = self._count()
+        self._acquire(stripe, counters)
+        try:
+            self._store(stripe, key, value, counters)
+        finally:
+            stripe.lock.release()
+
+    def clear(self):
+        """Remove every entry. Statistics are kept."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.data.clear()
+
+    def __len__(self):
+        return sum(len(stripe.data) for stripe in self._stripes)
+
+    def stats(self):
+        """Return the hits, misses, evictions, lock wait in seconds and size.
+        """
+        total = _Counters()
+        with self._counters_lock:
+            total.add(self._retired)
+            for counters in self._counters:
+                total.add(counters)
+        return OrderedDict((
+            ('hits', total.hits),
+            ('misses', total.misses),
+            ('evictions', total.evictions),
+            ('lock_wait', total.lock_wait),
+            ('size', len(self)),
+            ))
+
+
+def stats():
+    """Return the statistics of every registered cache by name."""
+    return OrderedDict((name, cache.stats()) for name, cache in CACHES.items())
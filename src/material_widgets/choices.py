@@ -0,0 +1,350 @@
+"""Model choices fetched once per request.
+
+Every render of a field of model choices, e.g. a foreign key of a
+`MaterialModelForm`, runs the query of its queryset. While a request is
+handled by `RequestChoicesMiddleware`, or within `request_choices`, Material
+choice widgets instead look the objects up by the SQL and parameters of
+their queryset, so each distinct query runs once, however many fields and
+forms of the request use it. Each field still builds its own choices from
+the objects, with its own labels and empty label.
+
+The objects are discarded once the response is returned, so later requests
+see changes to the database.
+
+Choices that rarely change, e.g. of countries or currencies, can also be
+kept between requests in the Django cache MATERIAL_CHOICE_CACHE, by setting
+`cache_choices` on their widgets, or listing their fields in the
+``cache_choices`` option of a Material form. Their values and labels are
+stored per language, under a fingerprint of the queryset and of how the field
+labels its objects, together with the generation of every table the query
+reads. Each ``post_save``, ``post_delete`` or ``m2m_changed`` signal of a
+model whose tables cached choices read increments the generation of the
+tables, so changed choices are queried again by every process sharing the
+cache. These tables are those of the fields of registered Material forms
+declared with ``cache_choices``, or with widgets setting it, see
+`material_widgets.registry`, and those of choices the process stored or read.
+Signals of other models cost no cache request. Processes changing models
+without importing the forms caching their choices, e.g. task workers, should
+call `invalidate` instead. Entries expire after their timeout
+in any case, e.g. after updates that send no signal such as
+``QuerySet.update()``. `choice_cache_stats` returns the hits and misses of
+the current process.
+
+Labels of model choices that read related objects, e.g. a ``__str__`` of
+``'{} ({})'.format(self.name, self.parent.name)``, query each related object
+while rendering. Declaring the fields the labels read as `label_fields` of
+the widget, or in the ``label_fields`` option of a Material form, loads the
+choices with those fields only, and their relations with ``select_related``,
+in a single query. See `label_choices`.
+
+Examples
+--------
+Add the middleware to the project's settings.
+
+>>> MIDDLEWARE += ['material_widgets.choices.RequestChoicesMiddleware']
+
+Share choices outside of requests, e.g. when rendering forms in a task.
+
+>>> with request_choices():
+>>>     html = [OrderForm().as_components() for _ in range(10)]
+
+Keep the choices of a field for up to an hour, or of a widget for
+MATERIAL_CHOICE_CACHE_TIMEOUT seconds.
+
+>>> class OrderForm(MaterialModelForm):
+>>>     cache_choices = {'country': 3600}
+>>>     currency = ModelChoiceField(Currency.objects.all(),
+>>>                                 widget=MaterialSelect(cache_choices=True))
+
+Load the names of cities and of their countries in the query of the choices.
+
+>>> class AddressForm(MaterialModelForm):
+>>>     label_fields = {'city': ('name', 'country__name')}
+
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import copy
+from time import time
+from weakref import WeakSet
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.forms.models import ModelChoiceIterator
+from django.utils.encoding import force_text
+from django.utils.translation import get_language
+from .registry import FORMS
+
+__all__ = (
+    'RequestChoicesMiddleware', 'cached_choices', 'choice_cache_stats',
+    'invalidate', 'label_choices', 'request_choices',
+    )
+
+PREFIX = 'material_widgets:choices:'
+
+_state = threading.local()
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+_stored_tables = set()
+_scanned_forms = WeakSet()
+
+
+@contextmanager
+def request_choices():
+    """Share the objects of model choices rendered in this thread until
+    exiting the context.
+    """
+    previous = getattr(_state, 'objects', None)
+    _state.objects = {} if previous is None else previous
+    try:
+        yield _state.objects
+    finally:
+        _state.objects = previous
+
+
+def _key(queryset):
+    """Return the key of the objects of `queryset`, or None if they cannot
+    be shared.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    key = (queryset.db, sql, tuple(params),
+           tuple(queryset._prefetch_related_lookups))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _objects(choices, key):
+    """Return the objects of the queryset of `choices`, shared by the
+    request if within `request_choices`.
+    """
+    objects = getattr(_state, 'objects', None)
+    if objects is None:
+        return list(choices.queryset.all())
+    if key not in objects:
+        objects[key] = list(choices.queryset.all())
+    return objects[key]
+
+
+def _cache():
+    from .settings import MATERIAL_CHOICE_CACHE
+    return caches[MATERIAL_CHOICE_CACHE]
+
+
+def _generation_key(table):
+    return PREFIX + 'generation:' + table
+
+
+def _tables(queryset):
+    """Return the names of the tables read by `queryset`, once compiled."""
+    return sorted(set(
+        join.table_name for join in queryset.query.alias_map.values()
+        ) | {queryset.model._meta.db_table})
+
+
+def _generations(cache, tables):
+    """Return the generation of each table, starting missing ones from the
+    current time so that they differ from any evicted generation.
+    """
+    keys = [_generation_key(table) for table in tables]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, int(time() * 1000), None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def _record(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def _stored_choices(choices, key, timeout):
+    """Return the (value, label) pairs of the objects of `choices`, from the
+    Django cache if stored within the last `timeout` seconds and no table
+    they were read from changed since.
+    """
+    from .settings import MATERIAL_CHOICE_CACHE_TIMEOUT
+    if timeout is True:
+        timeout = MATERIAL_CHOICE_CACHE_TIMEOUT
+    field = choices.field
+    label = getattr(field.label_from_instance, '__func__',
+                    field.label_from_instance)
+    cache = _cache()
+    fingerprint = hashlib.sha1(repr((
+        key, get_language(), type(field).__module__, type(field).__qualname__,
+        field.to_field_name, label.__module__, label.__qualname__,
+        )).encode()).hexdigest()
+    tables = _tables(choices.queryset)
+    with _stats_lock:
+        _stored_tables.update(tables)
+    entry_key = '{}{}:{}'.format(
+        PREFIX, fingerprint,
+        '.'.join(str(generation)
+                 for generation in _generations(cache, tables)),
+        )
+    pairs = cache.get(entry_key)
+    if pairs is not None:
+        _record('hits')
+        return pairs
+    _record('misses')
+    pairs = [
+        (value, force_text(label))
+        for value, label in (choices.choice(obj)
+                             for obj in _objects(choices, key))
+        ]
+    cache.set(entry_key, pairs, timeout)
+    return pairs
+
+
+def cached_choices(choices, timeout=None):
+    """Return `choices` as a list built from the objects of their queryset
+    shared by the request, or from the Django cache if `timeout` is set.
+
+    Parameters
+    ----------
+    choices : iterable
+        Choices of a widget, a `ModelChoiceIterator` for model choices.
+    timeout : int or True, optional
+        Seconds the choices are kept in MATERIAL_CHOICE_CACHE, or True for
+        MATERIAL_CHOICE_CACHE_TIMEOUT. Not kept between requests if None.
+
+    Returns
+    -------
+    choices : list of (value, label) pairs, or None
+        None if `choices` are not model choices, or are neither shared nor
+        kept between requests.
+
+    """
+    if not isinstance(choices, ModelChoiceIterator) or not (
+            timeout or getattr(_state, 'objects', None) is not None):
+        return None
+    key = _key(choices.queryset)
+    if key is None:
+        return None
+    if timeout:
+        pairs = _stored_choices(choices, key, timeout)
+    else:
+        pairs = [choices.choice(obj) for obj in _objects(choices, key)]
+    field = choices.field
+    return (
+        ([('', field.empty_label)] if field.empty_label is not None else [])
+        + pairs
+        )
+
+
+def label_choices(choices, label_fields):
+    """Return model choices loading only the fields their labels read.
+
+    Parameters
+    ----------
+    choices : iterable
+        Choices of a widget, a `ModelChoiceIterator` for model choices.
+    label_fields : iterable of str
+        Fields read by the labels of the choices, following relations with
+        ``__``, e.g. ``('name', 'parent__name')``.
+
+    Returns
+    -------
+    choices : iterable
+        Copy of `choices` whose queryset selects the related objects of
+        `label_fields` and defers other fields, or `choices` if they are not
+        model choices.
+
+    """
+    if not isinstance(choices, ModelChoiceIterator) or not label_fields:
+        return choices
+    queryset = choices.queryset
+    relations = sorted(set(
+        name.rsplit(LOOKUP_SEP, 1)[0] for name in label_fields
+        if LOOKUP_SEP in name
+        ))
+    if relations:
+        queryset = queryset.select_related(*relations)
+    fields = [queryset.model._meta.pk.name] + list(relations)
+    if choices.field.to_field_name:
+        fields.append(choices.field.to_field_name)
+    labelled = copy(choices)
+    labelled.queryset = queryset.only(*(fields + list(label_fields)))
+    return labelled
+
+
+def choice_cache_stats():
+    """Return the hits, misses and hit rate of the choices kept between
+    requests, counted in this process.
+    """
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    return OrderedDict((
+        ('hits', hits),
+        ('misses', misses),
+        ('hit_rate', hits / (hits + misses) if hits + misses else None),
+        ))
+
+
+def invalidate(model):
+    """Discard the stored choices read from the tables of `model`."""
+    cache = _cache()
+    for ancestor in [model] + model._meta.get_parent_list():
+        try:
+            cache.incr(_generation_key(ancestor._meta.db_table))
+        except ValueError:
+            # no choices were stored since the generation was evicted
+            continue
+
+
+def _declare_registered():
+    """Add the tables of the cached choices declared by registered forms not
+    scanned yet to the stored tables, so that changes to them invalidate the
+    choices before this process reads any.
+    """
+    for form_class in list(FORMS.values()):
+        if form_class in _scanned_forms:
+            continue
+        tables = set()
+        for name, field in form_class.base_fields.items():
+            queryset = getattr(field, 'queryset', None)
+            if queryset is not None and (
+                    name in form_class.cache_choices
+                    or getattr(field.widget, 'cache_choices', None)):
+                tables.update(_tables(queryset))
+        with _stats_lock:
+            _stored_tables.update(tables)
+            _scanned_forms.add(form_class)
+
+
+def _changed(sender, **kwargs):  # pylint: disable=unused-argument
+    tables = [model._meta.db_table
+              for model in [sender] + sender._meta.get_parent_list()]
+    if not any(table in _stored_tables for table in tables):
+        _declare_registered()
+        if not any(table in _stored_tables for table in tables):
+            return
+    invalidate(sender)
+
+
+post_save.connect(_changed, dispatch_uid=PREFIX + 'post_save')
+post_delete.connect(_changed, dispatch_uid=PREFIX + 'post_delete')
+m2m_changed.connect(_changed, dispatch_uid=PREFIX + 'm2m_changed')
+
+
+class RequestChoicesMiddleware:
+    """Middleware sharing the objects of model choices rendered while
+    handling a request. See `request_choices`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_choices():
+            return self.get_response(request)
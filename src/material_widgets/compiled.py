@@ -0,0 +1,165 @@
+"""Persist compiled Material widget templates between processes.
+
+The compiled node trees of every Material widget template are pickled to one
+file per source hash, a SHA-256 of the Django version and of every template's
+name and source. A process whose templates or Django version differ finds no
+file for its hash, and parses the templates as usual.
+
+Write the file at build time with the ``compile_material_templates``
+management command, and point the ``MATERIAL_TEMPLATE_CACHE`` setting at its
+directory. `MaterialFormRenderer` then loads the templates into its cached
+loader instead of parsing them.
+
+Only load files written by your own build: unpickling runs arbitrary code.
+
+"""
+import copyreg
+import hashlib
+import logging
+import os
+import pickle
+import django
+from django.template.base import Origin, Template
+from django.template.engine import Engine
+from django.template.loaders.base import Loader
+from django.template.loaders.cached import Loader as CachedLoader
+from django.template.smartif import OPERATORS
+from .warmup import template_names
+
+__all__ = ('cache_path', 'dump', 'load', 'source_hash',)
+
+PREFIX = 'material_templates-'
+
+logger = logging.getLogger(__name__)
+
+
+def _operator(key, state):
+    """Rebuild a `{% if %}` operator, whose classes are local to smartif."""
+    operator = OPERATORS[key]()
+    operator.__dict__.update(state)
+    return operator
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle templates without the engine and loader they reference."""
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table.update({
+        operator: lambda value: (_operator, (value.id, vars(value)))
+        for operator in OPERATORS.values()
+        })
+
+    def persistent_id(self, obj):  # pylint: disable=method-hidden
+        if isinstance(obj, Engine):
+            return 'engine'
+        if isinstance(obj, CachedLoader):
+            return 'cached'
+        if isinstance(obj, Loader):
+            return 'loader'
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickle templates onto the given engine."""
+
+    def __init__(self, source, engine):
+        super().__init__(source)
+        self.engine = engine
+
+    def persistent_load(self, pid):  # pylint: disable=method-hidden
+        cached = self.engine.template_loaders[0]
+        return {
+            'engine': self.engine, 'cached': cached, 'loader': cached.loaders[0],
+            }[pid]
+
+
+def _sources(engine):
+    for name in template_names():
+        for directory in engine.dirs:
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as source:
+                    yield name, path, source.read()
+                break
+
+
+def source_hash(engine):
+    """Return the hash of the Django version and of the template sources."""
+    digest = hashlib.sha256(django.get_version().encode())
+    for name, _, source in _sources(engine):
+        digest.update(name.encode() + b'\0' + source + b'\0')
+    return digest.hexdigest()
+
+
+def cache_path(directory, engine):
+    """Return the path of the compiled templates matching `engine`."""
+    return os.path.join(directory, '{}{}.pickle'.format(
+        PREFIX, source_hash(engine)
+        ))
+
+
+def dump(directory, engine):
+    """Compile the Material widget templates and pickle them.
+
+    Files of other source hashes in `directory` are removed.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to write to. Created if missing.
+    engine : django.template.Engine
+        Engine compiling the templates, whose first loader is a cached loader
+        of filesystem templates, e.g. that of `MaterialFormRenderer`.
+
+    Returns
+    -------
+    path : str
+        Path of the written file.
+
+    """
+    loader = engine.template_loaders[0].loaders[0]
+    templates = {
+        name: Template(
+            source.decode(), Origin(path, name, loader), name, engine
+            )
+        for name, path, source in _sources(engine)
+        }
+    os.makedirs(directory, exist_ok=True)
+    path = cache_path(directory, engine)
+    for filename in os.listdir(directory):
+        if filename.startswith(PREFIX):
+            os.remove(os.path.join(directory, filename))
+    with open(path + '.tmp', 'wb') as output:
+        _Pickler(output, pickle.HIGHEST_PROTOCOL).dump(templates)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def load(directory, engine):
+    """Load compiled templates into the cached loader of `engine`.
+
+    Parameters
+    ----------
+    directory : str
+        Directory the templates were dumped to.
+    engine : django.template.Engine
+        Engine whose first loader is a cached loader.
+
+    Returns
+    -------
+    loaded : int
+        Number of templates loaded, 0 if none match the current sources.
+
+    """
+    path = cache_path(directory, engine)
+    try:
+        with open(path, 'rb') as source:
+            templates = _Unpickler(source, engine).load()
+    except FileNotFoundError:
+        logger.info('No compiled Material templates at %s.', path)
+        return 0
+    except Exception:  # pylint: disable=broad-except
+        logger.warning('Cannot load compiled Material templates from %s.',
+                       path, exc_info=True)
+        return 0
+    engine.template_loaders[0].get_template_cache.update(templates)
+    return len(templates)
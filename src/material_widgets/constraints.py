@@ -0,0 +1,165 @@
+"""Client-side constraint validation rules derived from form fields.
+
+Forms with ``client_validation = True`` give every widget the HTML5
+constraint attributes of its field's validators, and a ``data-mdc-rules``
+attribute holding the rules as compact JSON, together with the field's own
+error messages. ``material_constraints.js`` checks the rules as the user
+types, shows errors in place of the field's helper text, and blocks invalid
+submits. The server still validates every submission.
+
+Rules are keyed by constraint: 'required', 'invalid' (type mismatch of e.g.
+email or number inputs), 'minlength', 'maxlength', 'min', 'max' and 'step'
+map to the error message, and 'regex' to a list of the JavaScript pattern,
+its flags, whether it must not match, and the error message. Messages
+include ``{show_value}`` where the client should insert the value's length.
+
+Examples
+--------
+>>> rules(forms.CharField(min_length=3, max_length=32))
+{'required': 'This field is required.',
+ 'minlength': 'Ensure this value has at least 3 characters (it has
+ {show_value}).',
+ 'maxlength': 'Ensure this value has at most 32 characters (it has
+ {show_value}).'}
+
+"""
+import json
+import re
+from django.core import validators
+from django.forms import widgets
+
+__all__ = ('constrain', 'html_attrs', 'js_regex', 'rules',)
+
+# stands in for the value's length in formatted messages
+SHOW_VALUE = 918273645
+
+LENGTH_VALIDATORS = (
+    (validators.MinLengthValidator, 'minlength'),
+    (validators.MaxLengthValidator, 'maxlength'),
+    )
+VALUE_VALIDATORS = (
+    (validators.MinValueValidator, 'min'),
+    (validators.MaxValueValidator, 'max'),
+    )
+# Python only regular expression syntax, which is left to the server
+PYTHON_ONLY = re.compile(r'\\[AZ]|\(\?[aiLmsux#]|\(\?P=|\*\+|\+\+|\?\+')
+# classes matching Unicode in Python but only ASCII in JavaScript
+UNICODE_CLASSES = re.compile(r'\\[wWdDbBsS]')
+
+
+def _message(field, validator, limit_value=None):
+    message = field.error_messages.get(validator.code, validator.message)
+    if limit_value is not None:
+        message = message % {
+            'limit_value': limit_value, 'show_value': SHOW_VALUE,
+            }
+    return str(message).replace(str(SHOW_VALUE), '{show_value}')
+
+
+def js_regex(validator):
+    """Return the JavaScript (source, flags) of a `RegexValidator`, or None
+    if its pattern uses Python only syntax or Unicode aware classes.
+    """
+    source = validator.regex.pattern
+    flags = validator.regex.flags
+    if not isinstance(source, str) or flags & (re.VERBOSE | re.LOCALE):
+        return None
+    if source.startswith('\\A'):
+        source = '^' + source[2:]
+    if source.endswith('\\Z') and not source.endswith('\\\\Z'):
+        source = source[:-2] + '$'
+    if (PYTHON_ONLY.search(source) or not flags & re.ASCII
+            and UNICODE_CLASSES.search(source)):
+        return None
+    source = source.replace('(?P<', '(?<')
+    return source, ''.join(
+        letter for flag, letter in (
+            (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'),
+            )
+        if flags & flag
+        )
+
+
+def rules(field):
+    """Return the client-side rules of `field` as a dict.
+
+    Parameters
+    ----------
+    field : django.forms.Field
+
+    Returns
+    -------
+    rules : dict
+        See the module documentation.
+
+    """
+    result = {}
+    if field.required:
+        result['required'] = str(field.error_messages['required'])
+    if isinstance(field.widget, (widgets.NumberInput, widgets.EmailInput,
+                                 widgets.URLInput)):
+        invalid = field.error_messages.get('invalid') or next((
+            validator.message for validator in field.validators
+            if getattr(validator, 'code', None) == 'invalid'
+            ), None)
+        if invalid is not None:
+            result['invalid'] = str(invalid)
+    for validator in field.validators:
+        for validator_class, key in LENGTH_VALIDATORS + VALUE_VALIDATORS:
+            if isinstance(validator, validator_class):
+                result[key] = _message(field, validator, validator.limit_value)
+        if type(validator) is validators.RegexValidator:
+            regex = js_regex(validator)
+            if regex is not None:
+                result['regex'] = list(regex) + [
+                    validator.inverse_match, _message(field, validator),
+                    ]
+    step = field.widget.attrs.get('step')
+    if step not in (None, 'any') and hasattr(field, 'decimal_places'):
+        result['step'] = str(
+            validators.DecimalValidator.messages['max_decimal_places']
+            % {'max': field.decimal_places}
+            )
+    return result
+
+
+def html_attrs(field):
+    """Return HTML5 constraint attributes of `field` missing from its widget
+    attributes.
+    """
+    attrs = {}
+    for validator in field.validators:
+        for validator_class, key in LENGTH_VALIDATORS + VALUE_VALIDATORS:
+            if isinstance(validator, validator_class):
+                attrs[key] = validator.limit_value
+        if type(validator) is validators.RegexValidator:
+            regex = js_regex(validator)
+            pattern = regex and regex[0]
+            # HTML patterns must match whole values
+            if (pattern and not regex[1] and not validator.inverse_match
+                    and pattern.startswith('^') and pattern.endswith('$')
+                    and not pattern.endswith('\\$')):
+                attrs['pattern'] = pattern[1:-1]
+    return {
+        key: value for key, value in attrs.items()
+        if key not in field.widget.attrs
+        }
+
+
+def constrain(field):
+    """Add the constraint attributes and rules of `field` to its widget, if
+    it is a text or number input.
+    """
+    if (not isinstance(field.widget, (widgets.Input, widgets.Textarea))
+            or isinstance(field.widget, (widgets.CheckboxInput,
+                                         widgets.FileInput,
+                                         widgets.HiddenInput))):
+        return field
+    rule_set = rules(field)
+    if not rule_set:
+        return field
+    field.widget.attrs.update(html_attrs(field))
+    field.widget.attrs['data-mdc-rules'] = json.dumps(
+        rule_set, separators=(',', ':'), sort_keys=True,
+        )
+    return field
@@ -0,0 +1,176 @@
+"""Export unbound Material forms as static HTML fragments.
+
+Each form is rendered once per language into ``<form>.<language>.html``,
+holding the tags of its merged media followed by `as_components`, so the
+fragment can be included in pages served from a static origin. The form's
+submissions still go to the Django project, which validates them.
+
+A ``manifest.json`` file in the same directory maps each file to its form,
+language, media tags and a fingerprint of the form class source, its declared
+fields, and the Material widget templates. Later exports only render forms
+whose fingerprint changed, or whose file is missing. Rendering needs no
+network access: media are referenced, never fetched.
+
+Examples
+--------
+>>> export('static/forms', ['accounts.forms.SignupForm'], ['en', 'fr'])
+[OrderedDict([('file', 'accounts.forms.SignupForm.en.html'),
+              ('status', 'exported'), ...]), ...]
+
+"""
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from time import perf_counter
+from django.db import connections
+from django.utils.translation import override
+from .registry import FORMS, discover, registered
+from .renderers import MaterialFormRenderer
+from .warmup import _initialize
+
+__all__ = ('MANIFEST', 'export', 'source_fingerprint',)
+
+MANIFEST = 'manifest.json'
+
+
+def source_fingerprint(form_class):
+    """Return a hash of the source of `form_class` and of its Material form
+    ancestors, of its declared fields, and of the Material widget templates,
+    or None if the form has no `material_widgets.forms.fingerprint`.
+    """
+    from .compiled import source_hash
+    from .forms import fingerprint
+    form_fingerprint = fingerprint(form_class)
+    if form_fingerprint is None:
+        return None
+    digest = hashlib.sha256(form_fingerprint.encode())
+    digest.update(source_hash(MaterialFormRenderer.get_engine().engine)
+                  .encode())
+    for ancestor in form_class.__mro__:
+        if ancestor.__module__.startswith(('django.', 'material_widgets.forms',
+                                           'builtins')):
+            continue
+        try:
+            digest.update(inspect.getsource(ancestor).encode())
+        except (OSError, TypeError):
+            # classes built at run time have no source
+            digest.update(ancestor.__qualname__.encode())
+    return digest.hexdigest()
+
+
+def _write(path, content):
+    with open(path + '.tmp', 'w', encoding='utf-8') as output:
+        output.write(content)
+    os.replace(path + '.tmp', path)
+
+
+def _export_form(arguments):
+    """Render the named form in a language to its file.
+
+    Returns
+    -------
+    entry : dict
+        Manifest entry of the file, with the 'seconds' taken.
+
+    """
+    name, language, directory, filename, form_fingerprint = arguments
+    with override(language):
+        start = perf_counter()
+        form = FORMS[name]()
+        media = str(form.media)
+        html = form.as_components()
+        seconds = perf_counter() - start
+    _write(os.path.join(directory, filename), '{}\n{}\n'.format(media, html))
+    return OrderedDict((
+        ('form', name),
+        ('language', language),
+        ('media', media.splitlines()),
+        ('fingerprint', form_fingerprint),
+        ('seconds', seconds),
+        ))
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as manifest:
+            return json.load(manifest, object_pairs_hook=OrderedDict)
+    except (OSError, ValueError):
+        return OrderedDict()
+
+
+def export(directory, names=None, languages=None, processes=1, force=False):
+    """Render registered forms to static HTML fragments in `directory`.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the fragments and manifest. Created if missing.
+    names : list of str, optional
+        Dotted paths of the forms to export. Defaults to every form of
+        `material_widgets.registry.FORMS`, after `discover`.
+    languages : list of str, optional
+        Language codes to render each form in. Defaults to LANGUAGE_CODE.
+    processes : int, optional
+        Worker processes rendering forms. Forms are rendered in-process if 1.
+    force : bool, optional
+        Render every form, even if unchanged since the last export.
+
+    Returns
+    -------
+    results : list of dict
+        'file', 'form', 'language', 'status', 'exported' or 'unchanged', and
+        'seconds' taken to render, of each form and language.
+
+    Raises
+    ------
+    KeyError
+        If a name is not registered.
+
+    """
+    from django.conf import settings
+    discover()
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST)
+    manifest = _load_manifest(manifest_path)
+    results, tasks = [], []
+    for name, form_class in registered(names).items():
+        form_fingerprint = source_fingerprint(form_class)
+        for language in languages or [settings.LANGUAGE_CODE]:
+            filename = '{}.{}.html'.format(name, language)
+            entry = manifest.get(filename, {})
+            if (not force and form_fingerprint is not None
+                    and entry.get('fingerprint') == form_fingerprint
+                    and os.path.exists(os.path.join(directory, filename))):
+                results.append(OrderedDict((
+                    ('file', filename), ('form', name),
+                    ('language', language), ('status', 'unchanged'),
+                    ('seconds', 0.0),
+                    )))
+            else:
+                tasks.append(
+                    (name, language, directory, filename, form_fingerprint)
+                    )
+    if processes == 1 or len(tasks) < 2:
+        entries = [_export_form(task) for task in tasks]
+    else:
+        # children must not share the parent's database connections
+        connections.close_all()
+        pool = multiprocessing.Pool(processes, initializer=_initialize)
+        try:
+            entries = pool.map(_export_form, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    for task, entry in zip(tasks, entries):
+        filename = task[3]
+        results.append(OrderedDict((
+            ('file', filename), ('form', entry['form']),
+            ('language', entry['language']), ('status', 'exported'),
+            ('seconds', entry.pop('seconds')),
+            )))
+        manifest[filename] = entry
+    _write(manifest_path, json.dumps(manifest, indent=2) + '\n')
+    return results
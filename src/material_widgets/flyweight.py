@@ -0,0 +1,162 @@
+"""Widgets shared by every instance of a form, copied on write.
+
+Django deep-copies each field's widget for every form instance, although
+Material widgets are rarely changed after the form materialized them. Forms
+with ``share_widgets = True`` materialize their base fields once per class,
+and give each instance's fields a `SharedWidget` wrapping the frozen widget
+instead of a copy of it.
+
+A `SharedWidget` behaves as the widget it wraps: attributes and methods are
+read from the frozen widget, and ``isinstance`` checks see its class. Setting
+any attribute, e.g. ``choices``, or changing ``attrs`` or a ``choices`` list in
+place, first replaces the frozen widget by a deep copy of it, owned by that
+field alone. So does reading any other list, dict, set or widget attribute,
+e.g. the ``widgets`` of a `MultiWidget`, which may be changed in place.
+
+Examples
+--------
+>>> form = SignupForm()
+>>> form.fields['email'].widget.attrs['class'] = 'wide'  # copies the widget
+>>> 'class' in SignupForm().fields['email'].widget.attrs
+False
+
+"""
+from collections.abc import MutableMapping, MutableSequence
+from copy import deepcopy
+from django.forms import Widget
+
+__all__ = ('SharedWidget',)
+
+
+class _CopyOnWriteAttrs(MutableMapping):
+    """View of the attrs of a shared widget, copying the widget on write."""
+    __slots__ = ('_shared',)
+
+    def __init__(self, shared):
+        self._shared = shared
+
+    def __getitem__(self, key):
+        return self._shared.widget.attrs[key]
+
+    def __iter__(self):
+        return iter(self._shared.widget.attrs)
+
+    def __len__(self):
+        return len(self._shared.widget.attrs)
+
+    def __setitem__(self, key, value):
+        self._shared.thaw().attrs[key] = value
+
+    def __delitem__(self, key):
+        del self._shared.thaw().attrs[key]
+
+    def __repr__(self):
+        return repr(self._shared.widget.attrs)
+
+
+class _CopyOnWriteChoices(MutableSequence):
+    """View of the choices list of a shared widget, copying the widget on
+    write.
+    """
+    __slots__ = ('_shared',)
+
+    def __init__(self, shared):
+        self._shared = shared
+
+    def __getitem__(self, index):
+        return self._shared.widget.choices[index]
+
+    def __len__(self):
+        return len(self._shared.widget.choices)
+
+    def __setitem__(self, index, value):
+        self._shared.thaw().choices[index] = value
+
+    def __delitem__(self, index):
+        del self._shared.thaw().choices[index]
+
+    def insert(self, index, value):
+        self._shared.thaw().choices.insert(index, value)
+
+    def __eq__(self, other):
+        return self._shared.widget.choices == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._shared.widget.choices)
+
+
+class SharedWidget:
+    """Wrapper of a frozen widget shared between form instances.
+
+    Parameters
+    ----------
+    widget : django.forms.Widget
+        Widget to share. It must not be changed once shared.
+
+    Attributes
+    ----------
+    widget : django.forms.Widget
+        The frozen widget, or the copy owned by this wrapper once thawed.
+    thawed : bool
+        Whether `widget` is a copy owned by this wrapper.
+
+    """
+    __slots__ = ('widget', 'thawed',)
+
+    def __init__(self, widget, thawed=False):
+        object.__setattr__(self, 'widget', widget)
+        object.__setattr__(self, 'thawed', thawed)
+
+    def thaw(self):
+        """Replace the frozen widget by a copy of it and return the copy."""
+        if not self.thawed:
+            object.__setattr__(self, 'widget', deepcopy(self.widget))
+            object.__setattr__(self, 'thawed', True)
+        return self.widget
+
+    @property
+    def __class__(self):
+        return self.widget.__class__
+
+    @property
+    def attrs(self):
+        """The widget's attrs, copied before the first change."""
+        if self.thawed:
+            return self.widget.attrs
+        return _CopyOnWriteAttrs(self)
+
+    @property
+    def choices(self):
+        """The widget's choices, copied before the first change if a list."""
+        choices = self.widget.choices
+        if self.thawed or not isinstance(choices, list):
+            return choices
+        return _CopyOnWriteChoices(self)
+
+    def __getattr__(self, name):
+        value = getattr(self.widget, name)
+        if not self.thawed and isinstance(value, (list, dict, set, Widget)):
+            # nested state, e.g. subwidgets, may be changed in place
+            return getattr(self.thaw(), name)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self.thaw(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.thaw(), name)
+
+    def __deepcopy__(self, memo):
+        if self.thawed:
+            return deepcopy(self.widget, memo)
+        shared = SharedWidget(self.widget)
+        memo[id(self)] = shared
+        return shared
+
+    def __copy__(self):
+        return SharedWidget(self.widget, self.thawed)
+
+    def __repr__(self):
+        return '<SharedWidget {!r}>'.format(self.widget)
@@ -12,16 +12,60 @@ References
 """
 # pylint: disable=no-member
 # pylint: disable=too-few-public-methods, too-many-ancestors
-# pylint: disable=unused-wildcard-import, wildcard-import
+import asyncio
+import hashlib
+import os
+import re
+from collections import OrderedDict
 from copy import deepcopy
+from datetime import date, time, timedelta
+from functools import lru_cache
+from numbers import Number
 from sys import modules
+from types import BuiltinFunctionType, FunctionType
+import django
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections
 from django.forms import Form, ModelForm, widgets
 from django.forms.utils import ErrorList
-from .widgets import MaterialComponent, MaterialMultiWidget
-from .widgets import *
+from django.utils.functional import LazyObject, Promise, empty
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language, override
+from . import widgets as material_widgets
+from .cache import StripedCache
+from .constraints import constrain
+from .flyweight import SharedWidget
+from .registry import register
+from .renderers import MaterialFormRenderer
+from .sharedcache import shared_cache
 
 __all__ = ('MaterialForm', 'MaterialModelForm',)
 
+CONSTRAINTS_JS = 'material_widgets/js/material_constraints.js'
+
+COMPONENT_ROW = (
+    '<div%(html_class_attr)s data-mdc-field="%(field_name)s">%(field)s</div>'
+    )
+
+UNBOUND_COMPONENTS = StripedCache('unbound_components', maxsize=1024)
+MEDIA = StripedCache('media', maxsize=256)
+FINGERPRINTS = StripedCache('fingerprints', maxsize=1024)
+TEMPLATE_HASHES = StripedCache('template_hashes', maxsize=16)
+SHARED_FIELDS = StripedCache('shared_fields', maxsize=256)
+
+
+def __getattr__(name):
+    """Return Material widgets previously imported into this module."""
+    if name in material_widgets.__all__ or name in (
+            'MaterialComponent', 'MaterialMultiWidget'):
+        return getattr(material_widgets, name)
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+
 def str_to_object(string):
     """Return python object from string.
 
@@ -75,7 +119,10 @@ def materialize_field(name, field):
             isinstance(field.widget, widgets.Widget)
             and not
             isinstance(
-                field.widget, (MaterialComponent, MaterialMultiWidget)
+                field.widget, (
+                    material_widgets.MaterialComponent,
+                    material_widgets.MaterialMultiWidget,
+                    )
                 )
         ):
         # match Django widget to Material widget
@@ -97,6 +144,200 @@ def materialize_field(name, field):
     return field
 
 
+def _evaluate(queryset):
+    """Return the objects of `queryset` as a list, then close the database
+    connections of the current thread unless persistent, as Django does at
+    the end of a request. Executor threads otherwise never close them.
+    """
+    try:
+        return list(queryset)
+    finally:
+        close_old_connections()
+
+
+async def aload_choices(field):
+    """Load the choices of a model choice field without blocking the event
+    loop, and give them to its widget.
+
+    Querysets are iterated with ``async for`` if the ORM supports it (Django
+    4.1+), else evaluated in the event loop's default executor, whose thread
+    then closes its database connection as at the end of a request.
+
+    Parameters
+    ----------
+    field : django.forms.ModelChoiceField
+
+    Returns
+    -------
+    field : django.forms.ModelChoiceField
+        The field, whose widget renders without querying the database.
+
+    """
+    queryset = field.queryset
+    if hasattr(queryset, '__aiter__'):
+        objects = [obj async for obj in queryset]
+    else:
+        objects = await asyncio.get_running_loop().run_in_executor(
+            None, _evaluate, queryset
+            )
+    iterator = field.iterator(field)
+    choices = ([('', field.empty_label)]
+               if getattr(field, 'empty_label', None) is not None else [])
+    choices.extend(iterator.choice(obj) for obj in objects)
+    field.widget.choices = choices
+    return field
+
+
+class _Unstable(Exception):
+    """Raised by `_stable` for values whose repr may differ between
+    processes."""
+
+
+def _name(obj):
+    return '{}.{}'.format(obj.__module__, obj.__qualname__)
+
+
+def _stable(value, _path=()):
+    """Return `value` as builtins whose repr is equal in every process.
+
+    Objects are described by their type and attributes, classes and
+    functions by their qualified name.
+
+    Raises
+    ------
+    _Unstable
+        If `value` holds an object that cannot be described so, e.g. a
+        lambda, an object without attributes, or a reference cycle.
+
+    """
+    # pylint: disable=protected-access, too-many-return-statements
+    if isinstance(value, Promise):
+        with override(None):
+            return str(value)
+    if isinstance(value, LazyObject):
+        if value._wrapped is empty:
+            value._setup()
+        value = value._wrapped
+    if value is None or isinstance(value, (str, bytes, Number)):
+        return value
+    if isinstance(value, (date, time, timedelta, range)):
+        text = repr(value)
+        if ' at 0x' in text:
+            raise _Unstable(text)
+        return text
+    if isinstance(value, re.Pattern):
+        return ('re', value.pattern, value.flags)
+    if isinstance(value, (type, FunctionType, BuiltinFunctionType)):
+        if '<' in value.__qualname__:
+            # lambdas and closures may differ under the same name
+            raise _Unstable(value.__qualname__)
+        return _name(value)
+    if id(value) in _path:
+        raise _Unstable('reference cycle')
+    path = _path + (id(value),)
+    if isinstance(value, (list, tuple)):
+        return tuple(_stable(item, path) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_stable(item, path)) for item in value))
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (str(key), _stable(item, path)) for key, item in value.items()
+            ))
+    if not hasattr(value, '__dict__'):
+        raise _Unstable(_name(type(value)))
+    # creation_counter depends on the order in which modules were imported
+    return (_name(type(value)), tuple(sorted(
+        (name, _stable(item, path)) for name, item in vars(value).items()
+        if name != 'creation_counter'
+        )))
+
+
+def _options(form_class):
+    """Return the class-level options of `form_class`, such as
+    ``error_css_class`` or ``client_validation``, by name.
+    """
+    options = {}
+    for klass in reversed(form_class.__mro__):
+        for name, value in vars(klass).items():
+            if (name.startswith('_')
+                    or name in ('base_fields', 'declared_fields')
+                    or callable(value) or hasattr(value, '__get__')):
+                # methods, classes and properties override options too
+                options.pop(name, None)
+                continue
+            options[name] = value
+    return options
+
+
+@lru_cache(maxsize=None)
+def package_hash():
+    """Return a hash of the Django version and of the Python sources of this
+    package, which change with every upgrade of either.
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1(django.get_version().encode())
+    for filename in sorted(os.listdir(package)):
+        if filename.endswith('.py'):
+            with open(os.path.join(package, filename), 'rb') as source:
+                digest.update(filename.encode() + b'\0' + source.read())
+    return digest.hexdigest()
+
+
+def fingerprint(form_class):
+    """Return a hash of the declared fields and options of `form_class`.
+
+    Unlike the class itself, the hash is equal in every process running the
+    same declaration, e.g. in each worker of a server.
+
+    Parameters
+    ----------
+    form_class : class
+        Subclass of `django.forms.BaseForm`.
+
+    Returns
+    -------
+    fingerprint : str or None
+        SHA-1 hex digest of the class name, of its class-level options, and
+        of the types and attributes of its base fields and their widgets.
+        None if any of them cannot be described equally in every process.
+
+    """
+    def compute():
+        parts = [form_class.__module__, form_class.__qualname__]
+        try:
+            parts.append(_stable(_options(form_class)))
+            for name, field in form_class.base_fields.items():
+                parts.append((name, _stable(field)))
+        except _Unstable:
+            return None
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    return FINGERPRINTS.get_or_set(
+        (form_class, tuple(form_class.base_fields.items())), compute
+        )
+
+
+def clear_unbound_cache(**kwargs):
+    """Discard the cached unbound renders and media of every Material form
+    class, including the renders shared through MATERIAL_SHARED_CACHE.
+
+    Connected to `django.core.signals.setting_changed`.
+
+    """
+    UNBOUND_COMPONENTS.clear()
+    MEDIA.clear()
+    FINGERPRINTS.clear()
+    TEMPLATE_HASHES.clear()
+    SHARED_FIELDS.clear()
+    cache = shared_cache()
+    if cache is not None:
+        # starts a new generation, evicting the renders of every process
+        cache.clear()
+
+
+setting_changed.connect(clear_unbound_cache)
+
+
 class MaterialErrorList(ErrorList):
     """ErrorList formatted with Material Components."""
 
@@ -138,32 +379,303 @@ class BaseMaterialForm:
         respectively.
         See `Django Forms API documentation <https://docs.djangoproject.com\
         /en/dev/ref/forms/api/#styling-required-or-erroneous-form-rows>`_.
+    default_renderer : class
+        `MaterialFormRenderer`, which caches templates whatever the project's
+        template settings, unless the project sets ``FORM_RENDERER``, whose
+        renderer is then used. Set to None to always use ``FORM_RENDERER``,
+        or to `MaterialFormRenderer` to always use it.
+    cache_unbound : bool
+        Cache `as_components` of unbound forms without initial data or
+        queryset choices in `UNBOUND_COMPONENTS`, per class, language, prefix
+        and fields. Only set to True if the rendered fields do not depend on
+        the request. Cached renders are not reused once the class's base
+        fields or the renderer's template engine change, and are discarded
+        when any setting changes, or on `clear_unbound_cache`. Renders are
+        also shared between processes through MATERIAL_SHARED_CACHE if set,
+        under the `fingerprint` of the class and the `package_hash`, unless
+        the class's fields or options cannot be fingerprinted. See
+        `material_widgets.sharedcache`.
+    client_validation : bool
+        Add HTML5 constraint attributes and ``data-mdc-rules`` derived from
+        field validators to text and number widgets, enforced in the browser
+        by ``material_constraints.js``. See `material_widgets.constraints`.
+    share_widgets : bool
+        Materialize the class's base fields once, cached in `SHARED_FIELDS`,
+        and share their frozen widgets between instances instead of copying
+        them per instance. Widgets are only copied when an instance changes
+        them, see `material_widgets.flyweight`.
+    lazy_widgets : bool
+        Materialize each field the first time its `BoundField` is accessed,
+        e.g. to render it, or the form's media are, instead of in
+        ``__init__``. Forms that are only validated never convert their
+        widgets, and templates rendering a few fields only convert those.
+        Labels are then taken from the fields as they are at first access.
+        Ignored if `share_widgets` is True.
+    cache_choices : dict or iterable of str
+        Names of the fields whose model choices are kept between requests,
+        mapped to the seconds they are kept, or True for
+        MATERIAL_CHOICE_CACHE_TIMEOUT if not a dict. Sets `cache_choices` of
+        their widgets, see `material_widgets.choices`.
+    label_fields : dict
+        Maps names of model choice fields to the fields their labels read,
+        e.g. ``{'city': ('name', 'country__name')}``, loaded in the query of
+        their choices. Sets `label_fields` of their widgets, see
+        `material_widgets.choices.label_choices`.
 
     """
     error_css_class = "mdc-error"
     required_css_class = "mdc-required"
 
+    @property
+    def default_renderer(self):
+        """`MaterialFormRenderer`, or None to let Django use the renderer of
+        ``FORM_RENDERER`` if the project sets it.
+        """
+        if settings.is_overridden('FORM_RENDERER'):
+            return None
+        return MaterialFormRenderer
+
+    cache_unbound = False
+    client_validation = False
+    share_widgets = False
+    lazy_widgets = False
+    cache_choices = ()
+    label_fields = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Register subclasses declared outside this module in
+        `material_widgets.registry.FORMS`.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.__module__ != __name__:
+            register(cls)
+
     def __init__(self, *args, **kwargs):
         """Change all default `django.forms.widgets` in Form to
         `material_widgets.widgets`. Set self.error_class to use
         `MaterialErrorList`.
 
         """
-        super().__init__(*args, **kwargs)
+        if not self.share_widgets:
+            super().__init__(*args, **kwargs)
+            self.error_class = MaterialErrorList
+            self._materialized = set()
+            if not self.lazy_widgets:
+                for name, field in self.fields.items():
+                    self._materialize(name, field)
+            return
+        # Form.__init__ deep copies self.base_fields into self.fields
+        self.base_fields = SHARED_FIELDS.get_or_set(
+            (type(self), tuple(type(self).base_fields.items())),
+            self._shared_fields,
+            )
+        try:
+            super().__init__(*args, **kwargs)
+        finally:
+            del self.base_fields
         self.error_class = MaterialErrorList
-        for name, field in self.fields.items():
-            field = materialize_field(name, field)
+        self._materialized = None
+
+    def __getitem__(self, name):
+        """Return the BoundField of `name`, materializing its field first if
+        `lazy_widgets` is True.
+        """
+        if self.lazy_widgets and self._materialized is not None:
+            self._materialize_lazily(name)
+        return super().__getitem__(name)
+
+    def _post_clean(self):
+        """Clean the instance of a model form without materializing lazy
+        fields. ``construct_instance`` reads the widget of each field with a
+        model default only to know whether the data omits it, which the
+        widgets converted by `materialize_field` answer as their Django
+        bases do.
+        """
+        materialized = self._materialized
+        self._materialized = None
+        try:
+            super()._post_clean()
+        finally:
+            self._materialized = materialized
+
+    def _materialize(self, name, field):
+        field = materialize_field(name, field)
+        if self.client_validation:
+            constrain(field)
+        if name in self.cache_choices:
+            field.widget.cache_choices = (
+                self.cache_choices[name]
+                if isinstance(self.cache_choices, dict) else True
+                )
+        if name in self.label_fields:
+            field.widget.label_fields = tuple(self.label_fields[name])
+        return field
+
+    def _materialize_lazily(self, name):
+        """Materialize the field `name` once per form instance."""
+        if name not in self._materialized and name in self.fields:
+            self._materialize(name, self.fields[name])
+            self._materialized.add(name)
+
+    def _shared_fields(self):
+        """Return a copy of the class's base fields, materialized, with
+        their widgets wrapped in `SharedWidget`.
+        """
+        fields = deepcopy(type(self).base_fields)
+        for name, field in fields.items():
+            field = self._materialize(name, field)
+            field.widget = SharedWidget(field.widget)
+        return fields
+
+    @property
+    def media(self):
+        """Media of the form's widgets, and of client validation if enabled.
+
+        Merged media of forms using only Material widgets are cached in
+        `MEDIA` by widget classes.
+
+        """
+        if self.lazy_widgets and self._materialized is not None:
+            for name in self.fields:
+                self._materialize_lazily(name)
+        classes = tuple(
+            field.widget.__class__ for field in self.fields.values()
+            )
+        if all(widget_class.__module__ == material_widgets.MaterialComponent
+               .__module__ for widget_class in classes):
+            return MEDIA.get_or_set(
+                (classes, self.client_validation), self._merge_media
+                )
+        return self._merge_media()
+
+    def _merge_media(self):
+        media = super().media
+        if self.client_validation:
+            media += widgets.Media(js=(CONSTRAINTS_JS,))
+        return media
+
+    def _unbound_key(self):
+        """Return the key of this form's render in `UNBOUND_COMPONENTS`, or
+        None if it cannot be cached.
+        """
+        if (not self.cache_unbound or self.is_bound or self.initial
+                or any(callable(field.initial) or hasattr(field, 'queryset')
+                       for field in self.fields.values())):
+            return None
+        return (
+            type(self), tuple(type(self).base_fields.items()),
+            getattr(self.renderer, 'engine', self.renderer),
+            get_language(), self.prefix, self.auto_id, self.label_suffix,
+            self.use_required_attribute, tuple(self.fields),
+            )
 
     def as_components(self):
         """Return form rendered with Material Components and layout."""
+        key = self._unbound_key()
+        if key is not None:
+            return UNBOUND_COMPONENTS.get_or_set(key, self._render_shared)
+        return self._render_components()
+
+    def _shared_key(self):
+        """Return the key of this unbound form's render in the shared cache,
+        equal in every process, or None if its renderer is not a
+        `MaterialFormRenderer` or the form has no `fingerprint`.
+        """
+        form_fingerprint = fingerprint(type(self))
+        if (form_fingerprint is None
+                or not isinstance(self.renderer, MaterialFormRenderer)):
+            return None
+        engine = self.renderer.engine
+        from .compiled import source_hash
+        templates = TEMPLATE_HASHES.get_or_set(
+            engine, lambda: source_hash(engine.engine)
+            )
+        try:
+            options = repr(_stable((
+                type(self.renderer), get_language(), self.prefix,
+                self.auto_id, self.label_suffix, self.use_required_attribute,
+                tuple(self.fields),
+                )))
+        except _Unstable:
+            return None
+        return '{}:{}:{}:{}'.format(
+            package_hash(), form_fingerprint, templates,
+            hashlib.sha1(options.encode()).hexdigest(),
+            )
+
+    def _render_shared(self):
+        """Return the render of this unbound form from MATERIAL_SHARED_CACHE,
+        shared by every process, rendering and storing it if missing.
+        """
+        cache = shared_cache()
+        key = cache and self._shared_key()
+        if not key:
+            return self._render_components()
+        return mark_safe(cache.get_or_set(key, self._render_components))
+
+    def _render_components(self):
         return self._html_output(
-            normal_row='<div%(html_class_attr)s>%(field)s</div>',
+            normal_row=COMPONENT_ROW,
             error_row='%s',
             row_ender='</div>',
             help_text_html='%s',
             errors_on_separate_row=True,
             )
 
+    async def arender_components(self):
+        """Return `as_components` from async code.
+
+        Model choices are loaded concurrently with `aload_choices`, so that
+        rendering, which then runs in the event loop, does not query the
+        database.
+
+        Examples
+        --------
+        >>> async def view(request):
+        >>>     form = ExampleModelForm()
+        >>>     return HttpResponse(await form.arender_components())
+
+        """
+        await asyncio.gather(*(
+            aload_choices(field) for field in self.fields.values()
+            if getattr(field, 'queryset', None) is not None
+            ))
+        return self.as_components()
+
+    def field_components(self, names=None):
+        """Return visible fields rendered as in `as_components`, each preceded
+        by its errors.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Names of the fields to render. Defaults to all fields.
+
+        Returns
+        -------
+        fields : OrderedDict
+            Maps the HTML name of each field to its rendered row.
+
+        """
+        fields = OrderedDict()
+        for name in self.fields if names is None else names:
+            bound_field = self[name]
+            if bound_field.is_hidden:
+                continue
+            errors = self.error_class(
+                [conditional_escape(error) for error in bound_field.errors]
+                )
+            css_classes = bound_field.css_classes()
+            fields[bound_field.html_name] = (
+                (str(errors) + '\n' if errors else '') + COMPONENT_ROW % {
+                    'html_class_attr': (' class="{}"'.format(css_classes)
+                                        if css_classes else ''),
+                    'field': str(bound_field),
+                    'field_name': bound_field.html_name,
+                    }
+                )
+        return fields
+
 
 class MaterialForm(BaseMaterialForm, Form):
     """Modified `django.forms.Form` that uses `material_widgets.widgets`.
@@ -194,4 +706,22 @@ class MaterialModelForm(BaseMaterialForm, ModelForm):
     >>>         fields = '__all__'
 
     """
-    pass
+
+    @classmethod
+    def bulk_validate(cls, rows, chunk_size=500, commit=True, **kwargs):
+        """Clean rows of data with one instance of this form, save the valid
+        rows with ``bulk_create``, and yield the result of each row.
+
+        See `material_widgets.bulk.bulk_validate`.
+
+        Examples
+        --------
+        >>> errors = {
+        >>>     result.index: result.errors
+        >>>     for result in ExampleModelForm.bulk_validate(rows)
+        >>>     if result.errors
+        >>>     }
+
+        """
+        from .bulk import bulk_validate
+        return bulk_validate(cls, rows, chunk_size, commit, **kwargs)
@@ -0,0 +1,35 @@
+"""Compile Material widget templates for faster cold starts.
+
+Examples
+--------
+Write the compiled templates to the ``MATERIAL_TEMPLATE_CACHE`` directory as
+part of the build.
+
+$ python manage.py compile_material_templates
+
+"""
+from django.core.management.base import BaseCommand, CommandError
+from ...compiled import dump
+from ...renderers import MaterialFormRenderer
+from ...settings import MATERIAL_TEMPLATE_CACHE
+
+
+class Command(BaseCommand):
+    """Pickle the compiled Material widget templates."""
+    help = "Compile Material widget templates to a cache directory."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--directory', default=MATERIAL_TEMPLATE_CACHE,
+            help='Directory to write to. Defaults to MATERIAL_TEMPLATE_CACHE.',
+            )
+
+    def handle(self, *args, **options):
+        if not options['directory']:
+            raise CommandError(
+                'Set MATERIAL_TEMPLATE_CACHE or pass --directory.'
+                )
+        path = dump(
+            options['directory'], MaterialFormRenderer.get_engine().engine
+            )
+        self.stdout.write('Compiled templates written to {}'.format(path))
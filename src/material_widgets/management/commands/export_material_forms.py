@@ -0,0 +1,65 @@
+"""Export unbound Material forms as static HTML fragments.
+
+Examples
+--------
+Export every registered form in English and French from 4 processes, only
+rendering forms changed since the last export.
+
+$ python manage.py export_material_forms static/forms \
+    --language en --language fr --processes 4
+
+"""
+import os
+from django.core.management.base import BaseCommand, CommandError
+from ...export import export
+
+
+class Command(BaseCommand):
+    """Render registered Material forms to HTML fragment files."""
+    help = "Export Material forms as static HTML fragments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'directory',
+            help='Directory to write fragments and manifest.json to.',
+            )
+        parser.add_argument(
+            '--form', action='append', dest='forms',
+            help=('Dotted path of a form to export. May be repeated. '
+                  'Defaults to every registered form.'),
+            )
+        parser.add_argument(
+            '--language', action='append', dest='languages',
+            help='Language to render in. May be repeated. '
+                 'Defaults to LANGUAGE_CODE.',
+            )
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1,
+            help='Worker processes. Defaults to the number of CPUs.',
+            )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Render every form, even if unchanged.',
+            )
+
+    def handle(self, *args, **options):
+        try:
+            results = export(
+                options['directory'], options['forms'],
+                options['languages'], options['processes'], options['force'],
+                )
+        except KeyError as error:
+            raise CommandError(
+                'Form {} is not registered.'.format(error.args[0])
+                )
+        row = '{:<64}{:<12}{:>10}'
+        self.stdout.write(row.format('File', 'Status', 'ms'))
+        for result in results:
+            self.stdout.write(row.format(
+                result['file'], result['status'],
+                '{:.2f}'.format(result['seconds'] * 1000),
+                ))
+        self.stdout.write('{} of {} fragments exported to {}'.format(
+            sum(result['status'] == 'exported' for result in results),
+            len(results), options['directory'],
+            ))
@@ -0,0 +1,396 @@
+"""Benchmark Material widgets.
+
+Examples
+--------
+Compare every Material widget against its stock Django counterpart.
+
+$ python manage.py material_benchmark --mode overhead
+
+Trace memory allocations, failing if any stored budget is exceeded.
+
+$ python manage.py material_benchmark --mode memory
+
+Drive the demo pages from 1, 2 and 4 threads in 1 and 2 processes.
+
+$ python manage.py material_benchmark --mode load --path / \
+    --path /modelform/ --threads 1 2 4 --processes 1 2
+
+Time imports and the first render of 10 freshly started processes.
+
+$ python manage.py material_benchmark --mode coldstart --repeat 10
+
+Measure the gain of compiled templates on the first render.
+
+$ python manage.py compile_material_templates --directory /tmp/templates
+$ python manage.py material_benchmark --mode coldstart \
+    --template-cache /tmp/templates
+
+Render a model form from 1, 10 and 50 concurrent asyncio tasks, offloading
+renders to a thread or with arender_components().
+
+$ python manage.py material_benchmark --mode async \
+    --form demo.forms.DemoModelForm --concurrency 1 10 50
+
+Compare instances of a 100-field model form sharing frozen widgets with
+instances copying them.
+
+$ python manage.py material_benchmark --mode flyweight \
+    --model demo.MaterialWidgetsDemoModel --fields 100
+
+Save timestamped results, then fail if rendering got significantly slower by
+more than 5% between two saved results.
+
+$ python manage.py material_benchmark --save benchmarks/
+$ python manage.py material_benchmark --compare OLD.json NEW.json \
+    --metric render --threshold 5
+
+"""
+import json
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from ...benchmarks import SCENARIOS, summarize
+from ...benchmarks import (
+    coldstart, concurrency, flyweight, load, memory, overhead,
+    )
+from ...benchmarks import results as stored
+
+MODES = ('overhead', 'memory', 'load', 'coldstart', 'async', 'flyweight',)
+
+
+class Command(BaseCommand):
+    """Run a Material widgets benchmark mode and report its results."""
+    help = "Benchmark Material widgets and forms."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--mode', choices=MODES, default='overhead',
+            help='Benchmark mode to run. Default is overhead.',
+            )
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios',
+            help='Run only the given scenario. May be repeated.',
+            )
+        parser.add_argument(
+            '--number', type=int,
+            help=('Calls per timing sample, calls traced per operation in '
+                  'memory mode, or renders per task in async mode. Default is '
+                  '100, or 20 in memory mode and 10 in async mode.'),
+            )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help=('Timing samples per metric, or processes started in coldstart '
+                  'mode. Default is 5.'),
+            )
+        parser.add_argument(
+            '--json', action='store_true', dest='json',
+            help='Output raw results as JSON.',
+            )
+        parser.add_argument(
+            '--budgets', default=memory.BUDGETS,
+            help='Memory budgets JSON file. Defaults to the shipped budgets.',
+            )
+        parser.add_argument(
+            '--write-budgets', action='store_true', dest='write_budgets',
+            help='Store measured allocations as the new memory budgets.',
+            )
+        parser.add_argument(
+            '--path', action='append', dest='paths',
+            help='URL path requested in load mode. May be repeated.',
+            )
+        parser.add_argument(
+            '--threads', type=int, nargs='+', default=[1],
+            help='Threads per process in load mode. Default is 1.',
+            )
+        parser.add_argument(
+            '--processes', type=int, nargs='+', default=[1],
+            help='Worker processes in load mode. Default is 1.',
+            )
+        parser.add_argument(
+            '--requests', type=int, default=50,
+            help='Requests per thread in load mode. Default is 50.',
+            )
+        parser.add_argument(
+            '--host', default='localhost',
+            help='Host header in load mode. Default is localhost.',
+            )
+        parser.add_argument(
+            '--form',
+            help='Dotted path of the form class rendered in async mode.',
+            )
+        parser.add_argument(
+            '--concurrency', type=int, nargs='+', default=[1, 10, 50],
+            help='Concurrent tasks in async mode. Default is 1 10 50.',
+            )
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help='Threads offloaded to in async mode. Default is 1.',
+            )
+        parser.add_argument(
+            '--model', metavar='APP_LABEL.MODEL',
+            help=('Model of the MaterialModelForm in flyweight mode. Defaults '
+                  'to a MaterialForm.'),
+            )
+        parser.add_argument(
+            '--fields', type=int, default=100,
+            help='Fields of the form in flyweight mode. Default is 100.',
+            )
+        parser.add_argument(
+            '--template-cache', dest='template_cache', metavar='DIRECTORY',
+            help='Compiled templates directory in coldstart mode.',
+            )
+        parser.add_argument(
+            '--save', metavar='DIRECTORY',
+            help='Save results as timestamped JSON in the given directory.',
+            )
+        parser.add_argument(
+            '--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'),
+            help='Compare two saved results files instead of benchmarking.',
+            )
+        parser.add_argument(
+            '--threshold', type=float, default=5.0,
+            help='Percentage increase reported as a regression. Default is 5.',
+            )
+        parser.add_argument(
+            '--alpha', type=float, default=0.05,
+            help='Significance level of timing regressions. Default is 0.05.',
+            )
+        parser.add_argument(
+            '--metric', action='append', dest='metrics',
+            help='Compare only the given metric, e.g. render. May be repeated.',
+            )
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            return self.compare(options)
+        unknown = set(options['scenarios'] or ()) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(
+                'Unknown scenario(s): {}'.format(', '.join(sorted(unknown)))
+                )
+        results = getattr(self, 'run_' + options['mode'])(options)
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            getattr(self, 'report_' + options['mode'])(results)
+        if options['save']:
+            path = stored.save(options['mode'], results, options['save'], {
+                key: options[key]
+                for key in ('scenarios', 'number', 'repeat', 'paths',
+                            'threads', 'processes', 'requests',
+                            'template_cache', 'form', 'concurrency',
+                            'workers', 'model', 'fields')
+                })
+            self.stderr.write('Results saved to {}'.format(path))
+        getattr(self, 'check_' + options['mode'], lambda *args: None)(
+            results, options
+            )
+
+    def compare(self, options):
+        """Compare two saved results files, failing on any regression."""
+        try:
+            baseline, candidate = (
+                stored.load(path) for path in options['compare']
+                )
+            rows = stored.compare(
+                baseline, candidate,
+                options['threshold'], options['alpha'], options['metrics'],
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
+        if options['json']:
+            self.stdout.write(json.dumps(rows, indent=2))
+        else:
+            row = '{:<56}{:>10}{:>10}{:>12}'
+            self.stdout.write(row.format('Measurement', 'Change', 'p', ''))
+            for result in rows:
+                self.stdout.write(row.format(
+                    result['name'],
+                    '{:+.1f}%'.format(result['change']),
+                    '-' if result['p'] is None else '{:.3f}'.format(result['p']),
+                    'REGRESSION' if result['regression'] else '',
+                    ))
+        regressions = [row['name'] for row in rows if row['regression']]
+        if regressions:
+            raise CommandError(
+                '{} regression(s) above {}%: {}'.format(
+                    len(regressions), options['threshold'],
+                    ', '.join(regressions),
+                    ))
+
+    def run_overhead(self, options):
+        """Return overhead results with per-metric ratios and summaries."""
+        results = overhead.run(
+            options['scenarios'], options['number'] or 100, options['repeat']
+            )
+        for metrics in list(results['fields'].values()) + [results['form']]:
+            for result in metrics.values():
+                result['ratio'] = overhead.ratio(result)
+                result['summary'] = {
+                    'plain': summarize(result['plain']),
+                    'material': summarize(result['material']),
+                    }
+        return results
+
+    def report_overhead(self, results):
+        """Write overhead ratios, worst render ratio first."""
+        row = '{:<36}' + '{:>14}' * len(overhead.METRICS)
+        self.stdout.write(row.format('Widget', *overhead.METRICS))
+        fields = sorted(
+            results['fields'].items(),
+            key=lambda item: item[1]['render']['ratio'],
+            reverse=True,
+            )
+        for name, metrics in fields + [('Form (all fields)', results['form'])]:
+            self.stdout.write(row.format(name, *(
+                '{:.2f}x'.format(metrics[metric]['ratio'])
+                for metric in overhead.METRICS
+                )))
+
+    def run_memory(self, options):
+        """Return memory allocation results."""
+        return memory.run(options['scenarios'], options['number'] or 20)
+
+    def report_memory(self, results):
+        """Write bytes per operation and the top allocating source lines."""
+        for scenario, operations in results.items():
+            self.stdout.write(scenario)
+            for operation, allocations in operations.items():
+                self.stdout.write(
+                    '  {:<12}{:>10} B{:>8} blocks{:>10} B peak'.format(
+                        operation, allocations['bytes'], allocations['blocks'],
+                        allocations['peak'] if allocations['peak'] is not None
+                        else '-',
+                        ))
+                for line, size in list(allocations['lines'].items())[:3]:
+                    self.stdout.write('    {:<22}{:>10} B'.format(line, size))
+
+    def check_memory(self, results, options):
+        """Store or enforce memory budgets."""
+        if options['write_budgets']:
+            memory.write_budgets(results, options['budgets'])
+            self.stderr.write('Budgets written to {}'.format(options['budgets']))
+            return
+        budgets = memory.load_budgets(options['budgets'])
+        if not budgets:
+            self.stderr.write(
+                'No memory budgets for Python {}; store them with '
+                '--write-budgets.'.format(memory.python_version())
+                )
+            return
+        over = memory.exceeded(results, budgets)
+        if over:
+            raise CommandError('Memory budget exceeded:\n' + '\n'.join(
+                '  {} {} {}: {} B > {} B'.format(*item) for item in over
+                ))
+
+    def run_load(self, options):
+        """Return a load result for every processes and threads combination.
+        """
+        if not options['paths']:
+            raise CommandError('Load mode needs at least one --path.')
+        return [
+            load.run(options['paths'], threads, processes,
+                     options['requests'], options['host'])
+            for processes in options['processes']
+            for threads in options['threads']
+            ]
+
+    def report_load(self, results):
+        """Write throughput, CPU use and latency percentiles of each run."""
+        row = '{:<8}{:<8}{:<32}{:>8}' + '{:>10}' * len(load.PERCENTILES)
+        self.stdout.write(row.format(
+            'Procs', 'Threads', 'Path', 'Errors',
+            *('p{} ms'.format(percent) for percent in load.PERCENTILES)
+            ))
+        for result in results:
+            for path, stats in result['paths'].items():
+                self.stdout.write(row.format(
+                    result['processes'], result['threads'], path,
+                    stats['errors'],
+                    *('{:.2f}'.format(seconds * 1000)
+                      for seconds in stats['percentiles'].values())
+                    ))
+            self.stdout.write('{:<16}{:.1f} requests/s, CPU/wall {}'.format(
+                '', result['throughput'],
+                ' '.join('{:.2f}'.format(cpu) for cpu in result['cpu']),
+                ))
+
+    def run_coldstart(self, options):
+        """Return step durations of freshly started processes."""
+        return coldstart.run(
+            options['scenarios'], options['repeat'], options['template_cache']
+            )
+
+    def report_coldstart(self, results):
+        """Write the median and spread of each cold start step."""
+        row = '{:<16}' + '{:>12}' * 3
+        self.stdout.write(row.format('Step', 'Median ms', 'Min ms', 'Max ms'))
+        for step, samples in results.items():
+            summary = summarize(samples)
+            self.stdout.write(row.format(step, *(
+                '{:.2f}'.format(summary[key] * 1000)
+                for key in ('median', 'min', 'max')
+                )))
+
+    def run_async(self, options):
+        """Return concurrency results for every number of tasks."""
+        if not options['form']:
+            raise CommandError('Async mode needs a --form.')
+        try:
+            form_class = import_string(options['form'])
+        except ImportError as error:
+            raise CommandError(error)
+        return [
+            concurrency.run(form_class, tasks, options['number'] or 10,
+                            options['workers'])
+            for tasks in options['concurrency']
+            ]
+
+    def report_async(self, results):
+        """Write throughput and latency percentiles of both approaches."""
+        row = '{:<8}{:<10}{:>12}' + '{:>10}' * len(load.PERCENTILES)
+        self.stdout.write(row.format(
+            'Tasks', 'Approach', 'Renders/s',
+            *('p{} ms'.format(percent) for percent in load.PERCENTILES)
+            ))
+        for result in results:
+            for approach in concurrency.APPROACHES:
+                stats = result[approach]
+                self.stdout.write(row.format(
+                    result['concurrency'], approach,
+                    '{:.1f}'.format(stats['throughput']),
+                    *('{:.2f}'.format(seconds * 1000)
+                      for seconds in stats['percentiles'].values())
+                    ))
+
+    def run_flyweight(self, options):
+        """Return flyweight results with summarized timings."""
+        model = None
+        if options['model']:
+            try:
+                model = apps.get_model(options['model'])
+            except (LookupError, ValueError) as error:
+                raise CommandError(error)
+        results = flyweight.run(
+            options['fields'], model, options['number'] or 100,
+            options['repeat'],
+            )
+        for result in results.values():
+            for metric in ('instantiate', 'render'):
+                result[metric + '_summary'] = summarize(result[metric])
+        return results
+
+    def report_flyweight(self, results):
+        """Write median timings and retained memory of both variants."""
+        row = '{:<10}{:>18}{:>14}{:>16}{:>10}'
+        self.stdout.write(row.format(
+            'Variant', 'Instantiate ms', 'Render ms', 'Retained B', 'Blocks',
+            ))
+        for variant, result in results.items():
+            self.stdout.write(row.format(
+                variant,
+                '{:.3f}'.format(result['instantiate_summary']['median'] * 1000),
+                '{:.3f}'.format(result['render_summary']['median'] * 1000),
+                result['bytes'], result['blocks'],
+                ))
@@ -0,0 +1,68 @@
+"""Render Material forms into the shared cache before traffic arrives.
+
+Examples
+--------
+Render every registered form with ``cache_unbound = True`` in English and
+French, from 4 processes, as part of the deploy.
+
+$ python manage.py warm_material_cache --language en --language fr \
+    --processes 4
+
+"""
+import os
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from ...settings import MATERIAL_WARM_FORMS, MATERIAL_WARM_LANGUAGES
+from ...registry import discover, registered
+from ...warmup import warm_forms
+
+
+class Command(BaseCommand):
+    """Prerender registered Material forms into MATERIAL_SHARED_CACHE."""
+    help = "Render registered Material forms into the shared cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--form', action='append', dest='forms',
+            help=('Dotted path of a form to render. May be repeated. '
+                  'Defaults to MATERIAL_WARM_FORMS, or every registered '
+                  'form.'),
+            )
+        parser.add_argument(
+            '--language', action='append', dest='languages',
+            help=('Language to render in. May be repeated. Defaults to '
+                  'MATERIAL_WARM_LANGUAGES, or LANGUAGE_CODE.'),
+            )
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1,
+            help='Worker processes. Defaults to the number of CPUs.',
+            )
+
+    def handle(self, *args, **options):
+        names = options['forms'] or MATERIAL_WARM_FORMS
+        discover()
+        try:
+            registered(names)
+        except KeyError as error:
+            raise CommandError(
+                'Form {} is not registered.'.format(error.args[0])
+                )
+        try:
+            results = warm_forms(
+                names,
+                options['languages'] or MATERIAL_WARM_LANGUAGES,
+                options['processes'],
+                )
+        except ImproperlyConfigured as error:
+            raise CommandError(error)
+        row = '{:<48}{:<10}{:<14}{:>10}'
+        self.stdout.write(row.format('Form', 'Language', 'Status', 'ms'))
+        for result in results:
+            self.stdout.write(row.format(
+                result['form'], result['language'], result['status'],
+                '{:.2f}'.format(result['seconds'] * 1000),
+                ))
+        self.stdout.write('{} of {} renders stored.'.format(
+            sum(result['status'] == 'stored' for result in results),
+            len(results),
+            ))
@@ -0,0 +1,68 @@
+"""Registry of the Material form classes of a project.
+
+Every subclass of `material_widgets.forms.MaterialForm` and
+`material_widgets.forms.MaterialModelForm` is registered under its dotted
+path when its class statement runs, except classes defined inside functions.
+`discover` imports the ``forms`` module of every installed app, so that the
+registry holds their classes even in processes that never imported them, such
+as management commands.
+
+Classes are held by weak references: a class built at run time, e.g. by
+``type()``, leaves the registry once it is garbage collected.
+
+Examples
+--------
+>>> discover()
+>>> list(FORMS)
+['demo.forms.DemoForm', 'demo.forms.DemoModelForm']
+
+"""
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+from django.utils.module_loading import autodiscover_modules
+
+__all__ = ('FORMS', 'discover', 'dotted_path', 'register', 'registered',)
+
+FORMS = WeakValueDictionary()
+
+
+def dotted_path(form_class):
+    """Return the dotted path of `form_class`."""
+    return '{}.{}'.format(form_class.__module__, form_class.__qualname__)
+
+
+def register(form_class):
+    """Add `form_class` to `FORMS` unless it is defined inside a function.
+    """
+    if '<locals>' not in form_class.__qualname__:
+        FORMS[dotted_path(form_class)] = form_class
+    return form_class
+
+
+def discover():
+    """Import the ``forms`` module of every installed app."""
+    autodiscover_modules('forms')
+
+
+def registered(names=None):
+    """Return registered form classes by dotted path.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Dotted paths of the forms to return. Defaults to every registered
+        form, sorted.
+
+    Returns
+    -------
+    forms : collections.OrderedDict
+
+    Raises
+    ------
+    KeyError
+        If a name is not registered.
+
+    """
+    if names is None:
+        names = sorted(FORMS)
+    return OrderedDict((name, FORMS[name]) for name in names)
@@ -0,0 +1,106 @@
+"""Form renderer with an always cached template engine of its own.
+
+`MaterialFormRenderer` is the default renderer of `MaterialForm` and
+`MaterialModelForm`, unless the project sets ``FORM_RENDERER``, e.g. to
+override templates from its own template directories. It loads the Material
+widget templates, and Django's own form templates, through a cached loader
+whatever the project's ``TEMPLATES`` settings, so templates are read and
+compiled once per process. Compiled templates are loaded from the ``MATERIAL_TEMPLATE_CACHE``
+directory if set, see `material_widgets.compiled`. Templates it does not find
+are loaded by Django's default `django.forms.renderers.DjangoTemplates`
+renderer.
+
+Examples
+--------
+Render any form with the Material renderer.
+
+>>> form = ExampleForm(renderer=MaterialFormRenderer())
+
+Reload edited templates in development.
+
+>>> MaterialFormRenderer.reset()
+
+Use the Material renderer even if the project sets ``FORM_RENDERER``.
+
+>>> class ExampleForm(MaterialForm):
+>>>     default_renderer = MaterialFormRenderer
+
+"""
+import os
+from threading import Lock
+import django.forms
+from django.forms.renderers import BaseRenderer, DjangoTemplates
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates as Backend
+
+__all__ = ('MaterialFormRenderer',)
+
+
+class MaterialFormRenderer(BaseRenderer):
+    """Render templates from Material widgets and Django forms, cached.
+
+    The template engine is shared by every instance of the class.
+
+    Attributes
+    ----------
+    dirs : list of str
+        Template directories, searched in order.
+    fallback : django.forms.renderers.BaseRenderer
+        Renderer of templates missing from `dirs`.
+
+    """
+    dirs = [
+        os.path.join(os.path.dirname(__file__), 'templates'),
+        os.path.join(os.path.dirname(django.forms.__file__), 'templates'),
+        ]
+    fallback = DjangoTemplates()
+    _engine = None
+    _lock = Lock()
+
+    @classmethod
+    def get_engine(cls):
+        """Return the shared template engine, creating it if needed."""
+        engine = cls._engine
+        if engine is None:
+            with cls._lock:
+                engine = cls._engine
+                if engine is None:
+                    engine = Backend({
+                        'APP_DIRS': False,
+                        'DIRS': cls.dirs,
+                        'NAME': 'materialforms',
+                        'OPTIONS': {'loaders': [(
+                            'django.template.loaders.cached.Loader',
+                            ['django.template.loaders.filesystem.Loader'],
+                            )]},
+                        })
+                    cls.load_compiled(engine.engine)
+                    cls._engine = engine
+        return engine
+
+    @staticmethod
+    def load_compiled(engine):
+        """Load compiled templates into `engine` if MATERIAL_TEMPLATE_CACHE is
+        set.
+        """
+        from .settings import MATERIAL_TEMPLATE_CACHE
+        if MATERIAL_TEMPLATE_CACHE:
+            from .compiled import load
+            load(MATERIAL_TEMPLATE_CACHE, engine)
+
+    @classmethod
+    def reset(cls):
+        """Discard cached templates so they are read again on next use."""
+        with cls._lock:
+            cls._engine = None
+
+    @property
+    def engine(self):
+        """Shared template engine, see `get_engine`."""
+        return self.get_engine()
+
+    def get_template(self, template_name):
+        try:
+            return self.engine.get_template(template_name)
+        except TemplateDoesNotExist:
+            return self.fallback.get_template(template_name)
@@ -15,6 +15,41 @@ Path joins can be used as long as they result in a valid URL string.
 
 >>> MATERIAL_JS = os.path.join(STATIC_ROOT, "js/material.js")
 
+Set MATERIAL_WARM_UP to load and compile every Material widget template when
+Django starts, instead of on the first request of each worker. Set it to
+'render' to also render one instance of each widget class.
+
+>>> MATERIAL_WARM_UP = 'render'
+
+Set MATERIAL_TEMPLATE_CACHE to the directory written by the
+``compile_material_templates`` management command to load compiled widget
+templates instead of parsing them in every process.
+
+>>> MATERIAL_TEMPLATE_CACHE = os.path.join(BASE_DIR, "material_templates")
+
+Set MATERIAL_SHARED_CACHE to a file path to share the cached renders of
+``cache_unbound`` forms between the worker processes of a server, through a
+memory-mapped file of MATERIAL_SHARED_CACHE_SIZE bytes of data. See
+`material_widgets.sharedcache`.
+
+>>> MATERIAL_SHARED_CACHE = "/dev/shm/material_widgets.cache"
+
+The ``warm_material_cache`` management command renders registered forms into
+that file at deploy time. Set MATERIAL_WARM_FORMS to the dotted paths of the
+forms to render instead of every registered form, and MATERIAL_WARM_LANGUAGES
+to the languages to render them in instead of LANGUAGE_CODE.
+
+>>> MATERIAL_WARM_FORMS = ["accounts.forms.LoginForm"]
+>>> MATERIAL_WARM_LANGUAGES = ["en", "fr"]
+
+Model choices of widgets with ``cache_choices`` set are kept between requests
+in the Django cache aliased MATERIAL_CHOICE_CACHE, for at most
+MATERIAL_CHOICE_CACHE_TIMEOUT seconds by default. See
+`material_widgets.choices`.
+
+>>> MATERIAL_CHOICE_CACHE = "choices"
+>>> MATERIAL_CHOICE_CACHE_TIMEOUT = 3600
+
 """
 
 from django.conf import settings
@@ -28,3 +63,21 @@ MATERIAL_JS = getattr(settings, 'MATERIAL_JS',
                       ("https://unpkg.com/material-components-web@0.25.0"
                        + "/dist/material-components-web.min.js")
                      )
+
+MATERIAL_WARM_UP = getattr(settings, 'MATERIAL_WARM_UP', False)
+
+MATERIAL_TEMPLATE_CACHE = getattr(settings, 'MATERIAL_TEMPLATE_CACHE', None)
+
+MATERIAL_SHARED_CACHE = getattr(settings, 'MATERIAL_SHARED_CACHE', None)
+
+MATERIAL_SHARED_CACHE_SIZE = getattr(settings, 'MATERIAL_SHARED_CACHE_SIZE',
+                                     64 * 1024 * 1024)
+
+MATERIAL_WARM_FORMS = getattr(settings, 'MATERIAL_WARM_FORMS', None)
+
+MATERIAL_WARM_LANGUAGES = getattr(settings, 'MATERIAL_WARM_LANGUAGES', None)
+
+MATERIAL_CHOICE_CACHE = getattr(settings, 'MATERIAL_CHOICE_CACHE', 'default')
+
+MATERIAL_CHOICE_CACHE_TIMEOUT = getattr(settings,
+                                        'MATERIAL_CHOICE_CACHE_TIMEOUT', 300)
@@ -0,0 +1,303 @@
+"""Fragment cache shared by worker processes through a memory-mapped file.
+
+Pre-forked workers of one server each hold their own in-process caches. A
+`SharedMemoryCache` maps the same file into every worker, so a fragment
+rendered by one worker is reused by all of them, without a cache server.
+
+The file holds a header, a hash index of fixed size, and a data region to
+which records of key, value and CRC-32 are appended. When the data region is
+full, the generation number in the header is incremented and writing starts
+over at the beginning of the region, which evicts every older entry at once.
+
+A file of another layout, e.g. left by a deploy with another size, is never
+truncated, as other processes may have mapped it: a fresh file is written
+next to it and renamed over it. Processes that mapped the old file keep using
+it until they open the cache again.
+
+Writers hold a POSIX record lock on the file, and a thread lock within their
+process. Readers take no lock: they only trust an index entry of the current
+generation whose record holds the key and a matching CRC-32, read while the
+generation did not change.
+
+Examples
+--------
+Share the unbound renders of ``cache_unbound`` forms between workers, using
+memory rather than disk on Linux.
+
+>>> MATERIAL_SHARED_CACHE = '/dev/shm/material_widgets.cache'
+>>> MATERIAL_SHARED_CACHE_SIZE = 64 * 1024 * 1024
+
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+__all__ = ('SharedMemoryCache', 'shared_cache',)
+
+MAGIC = b'MWSC'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQQI')  # magic, version, generation, offset,
+HEADER_SIZE = 64                    # data size, slots
+ENTRY = struct.Struct('<QQII')      # key hash, offset, length, generation
+RECORD = struct.Struct('<III')      # key length, value length, CRC-32
+PROBES = 8
+
+_OPENED = {}
+_OPENED_LOCK = threading.Lock()
+
+
+def _hash(key):
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), 'little'
+        )
+
+
+class SharedMemoryCache:
+    """String cache in a memory-mapped file shared between processes.
+
+    Parameters
+    ----------
+    path : str
+        File to map, created if missing. Use a tmpfs path such as /dev/shm to
+        keep it in memory.
+    size : int, optional
+        Bytes of the data region.
+    slots : int, optional
+        Entries of the hash index.
+
+    Attributes
+    ----------
+    max_value : int
+        Records larger than this are not stored.
+
+    """
+
+    def __init__(self, path, size=64 * 1024 * 1024, slots=65536):
+        self.path = path
+        self.size = size
+        self.slots = slots
+        self.max_value = size // 4
+        self.data_start = HEADER_SIZE + slots * ENTRY.size
+        self._lock = threading.Lock()
+        self._local = OrderedDict(
+            (('hits', 0), ('misses', 0), ('evictions', 0))
+            )
+        self._fd = self._open()
+        try:
+            self._map = mmap.mmap(self._fd, self.data_start + size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    @contextmanager
+    def _locked(self):
+        # POSIX record locks are held per process, so threads need their own
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def _matches(self, fd):
+        """Return whether the file of `fd` has this layout."""
+        header = os.pread(fd, HEADER.size, 0)
+        return (len(header) == HEADER.size
+                and os.fstat(fd).st_size == self.data_start + self.size
+                and HEADER.unpack(header)[:2] == (MAGIC, VERSION)
+                and HEADER.unpack(header)[4:] == (self.size, self.slots))
+
+    def _create(self):
+        """Write a fresh file of this layout and rename it to `path`.
+
+        Returns
+        -------
+        fd : int
+            Descriptor of the new file.
+
+        """
+        directory, name = os.path.split(self.path)
+        fd, temporary = tempfile.mkstemp(prefix=name + '.',
+                                         dir=directory or None)
+        try:
+            os.ftruncate(fd, self.data_start + self.size)
+            os.pwrite(fd, HEADER.pack(
+                MAGIC, VERSION, 1, 0, self.size, self.slots
+                ), 0)
+            os.replace(temporary, self.path)
+        except Exception:
+            os.close(fd)
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+        return fd
+
+    def _open(self):
+        """Return a descriptor of the file at `path`, replaced by a fresh
+        file unless it has this layout.
+        """
+        with self._lock:
+            while True:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    fcntl.lockf(fd, fcntl.LOCK_EX)
+                    opened = os.fstat(fd)
+                    try:
+                        current = os.stat(self.path)
+                    except FileNotFoundError:
+                        current = None
+                    if current is None or (
+                            (opened.st_dev, opened.st_ino)
+                            != (current.st_dev, current.st_ino)):
+                        # replaced by another process while waiting
+                        os.close(fd)
+                        continue
+                    if self._matches(fd):
+                        fcntl.lockf(fd, fcntl.LOCK_UN)
+                        return fd
+                    fresh = self._create()
+                except Exception:
+                    os.close(fd)
+                    raise
+                # closing releases the lock of waiting processes, which then
+                # open the fresh file
+                os.close(fd)
+                return fresh
+
+    def _header(self):
+        """Return the current (generation, offset)."""
+        return HEADER.unpack_from(self._map, 0)[2:4]
+
+    def _entries(self, key_hash):
+        """Yield (index position, entry) of the slots probed for a hash."""
+        home = key_hash % self.slots
+        for probe in range(PROBES):
+            position = HEADER_SIZE + (home + probe) % self.slots * ENTRY.size
+            yield position, ENTRY.unpack_from(self._map, position)
+
+    def get(self, key, default=None):
+        """Return the string stored under `key`, or `default` if missing."""
+        key = key.encode()
+        key_hash = _hash(key)
+        generation = self._header()[0]
+        for _, (entry_hash, offset, length, entry_generation) in (
+                self._entries(key_hash)):
+            if (entry_hash != key_hash
+                    or entry_generation != generation & 0xffffffff
+                    or offset + length > self.size or length < RECORD.size):
+                continue
+            start = self.data_start + offset
+            record = self._map[start:start + length]
+            key_length, value_length, crc = RECORD.unpack_from(record)
+            if RECORD.size + key_length + value_length != length:
+                continue
+            stored_key = record[RECORD.size:RECORD.size + key_length]
+            value = record[RECORD.size + key_length:]
+            if (stored_key == key and zlib.crc32(value) == crc
+                    and self._header()[0] == generation):
+                self._local['hits'] += 1
+                return value.decode()
+        self._local['misses'] += 1
+        return default
+
+    def set(self, key, value):
+        """Store the string `value` under `key`.
+
+        Returns
+        -------
+        stored : bool
+            False if the value is larger than `max_value`.
+
+        """
+        key, value = key.encode(), value.encode()
+        length = RECORD.size + len(key) + len(value)
+        if length > self.max_value:
+            return False
+        key_hash = _hash(key)
+        with self._locked():
+            generation, offset = self._header()
+            if offset + length > self.size:
+                # evict every entry by starting a new generation
+                generation, offset = generation + 1, 0
+                HEADER.pack_into(self._map, 0, MAGIC, VERSION, generation, 0,
+                                 self.size, self.slots)
+                self._local['evictions'] += 1
+            start = self.data_start + offset
+            self._map[start:start + length] = (
+                RECORD.pack(len(key), len(value), zlib.crc32(value))
+                + key + value
+                )
+            slot = None
+            for position, entry in self._entries(key_hash):
+                if entry[0] == key_hash or entry[3] != generation & 0xffffffff:
+                    slot = position
+                    break
+            if slot is None:
+                slot = next(self._entries(key_hash))[0]
+                self._local['evictions'] += 1
+            ENTRY.pack_into(self._map, slot, key_hash, offset, length,
+                            generation & 0xffffffff)
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, generation,
+                             offset + length, self.size, self.slots)
+        return True
+
+    def get_or_set(self, key, factory):
+        """Return the string under `key`, storing ``factory()`` if missing.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """Evict every entry of every process."""
+        with self._locked():
+            generation = self._header()[0] + 1
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, generation, 0,
+                             self.size, self.slots)
+
+    def stats(self):
+        """Return this process's hits, misses and evictions, and the shared
+        generation and bytes used.
+        """
+        generation, offset = self._header()
+        result = OrderedDict(self._local)
+        result['generation'] = generation
+        result['used'] = offset
+        return result
+
+    def close(self):
+        """Unmap and close the file."""
+        self._map.close()
+        os.close(self._fd)
+
+
+def shared_cache():
+    """Return the `SharedMemoryCache` at MATERIAL_SHARED_CACHE, or None if
+    the setting is unset.
+
+    The file is mapped once per process, on first use, so caches opened
+    before a server forks its workers are not shared with them.
+
+    """
+    from .settings import MATERIAL_SHARED_CACHE, MATERIAL_SHARED_CACHE_SIZE
+    if not MATERIAL_SHARED_CACHE:
+        return None
+    key = (os.getpid(), MATERIAL_SHARED_CACHE, MATERIAL_SHARED_CACHE_SIZE)
+    cache = _OPENED.get(key)
+    if cache is None:
+        with _OPENED_LOCK:
+            cache = _OPENED.get(key)
+            if cache is None:
+                cache = _OPENED[key] = SharedMemoryCache(
+                    MATERIAL_SHARED_CACHE, MATERIAL_SHARED_CACHE_SIZE
+                    )
+    return cache
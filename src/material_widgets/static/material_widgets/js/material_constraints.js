@@ -0,0 +1,126 @@
+(function () {
+  let INVALID = 'mdc-text-field--invalid';
+  let MESSAGE = [
+    'mdc-text-field-helper-text--persistent',
+    'mdc-text-field-helper-text--validation-msg',
+  ];
+
+  function helperText(input) {
+    let id = input.id + '-helper-text';
+    let helper = input.id ? document.getElementById(id) : null;
+    if (!helper) {
+      helper = document.createElement('p');
+      helper.className = 'mdc-text-field-helper-text mdc-text-field-helptext';
+      helper.id = id;
+      helper.dataset.mdcCreated = 'true';
+      let field = input.closest('.mdc-text-field') || input;
+      field.parentNode.insertBefore(helper, field.nextSibling);
+    }
+    if (!('mdcHelpText' in helper.dataset)) {
+      helper.dataset.mdcHelpText = helper.textContent;
+    }
+    return helper;
+  }
+
+  function error(input, rules) {
+    let value = input.value;
+    let validity = input.validity;
+    if (validity.valueMissing) {
+      return rules.required;
+    }
+    if (!value && !validity.badInput) {
+      return '';
+    }
+    if (validity.badInput || validity.typeMismatch) {
+      return rules.invalid;
+    }
+    if (rules.minlength && input.minLength > 0 && value.length < input.minLength) {
+      return rules.minlength;
+    }
+    if (rules.maxlength && input.maxLength >= 0 && value.length > input.maxLength) {
+      return rules.maxlength;
+    }
+    if (validity.rangeUnderflow) {
+      return rules.min;
+    }
+    if (validity.rangeOverflow) {
+      return rules.max;
+    }
+    if (validity.stepMismatch) {
+      return rules.step || rules.invalid;
+    }
+    if (rules.regex) {
+      let regex = new RegExp(rules.regex[0], rules.regex[1]);
+      if (regex.test(value) === rules.regex[2]) {
+        return rules.regex[3];
+      }
+    }
+    return '';
+  }
+
+  function check(input) {
+    let rules = JSON.parse(input.dataset.mdcRules);
+    let message = (error(input, rules) || '')
+      .replace('{show_value}', input.value.length);
+    let field = input.closest('.mdc-text-field');
+    let helper = helperText(input);
+    input.setCustomValidity(message);
+    if (field) {
+      field.classList.toggle(INVALID, !!message);
+    }
+    if (message) {
+      helper.textContent = message;
+      helper.removeAttribute('aria-hidden');
+      helper.setAttribute('role', 'alert');
+      MESSAGE.forEach(function (name) { helper.classList.add(name); });
+    } else {
+      helper.textContent = helper.dataset.mdcHelpText;
+      helper.removeAttribute('role');
+      if (!helper.dataset.mdcCreated) {
+        MESSAGE.forEach(function (name) { helper.classList.remove(name); });
+      } else {
+        helper.classList.remove(MESSAGE[0]);
+      }
+    }
+    return !message;
+  }
+
+  function watch(form) {
+    // errors are rendered by this script instead of the browser
+    form.noValidate = true;
+    form.addEventListener('focusout', function (event) {
+      if (event.target.dataset && event.target.dataset.mdcRules) {
+        check(event.target);
+      }
+    });
+    form.addEventListener('input', function (event) {
+      if (event.target.dataset && event.target.dataset.mdcRules
+          && event.target.validationMessage) {
+        check(event.target);
+      }
+    });
+    form.addEventListener('submit', function (event) {
+      let invalid = null;
+      let inputs = form.querySelectorAll('[data-mdc-rules]');
+      for (let i = 0, input; input = inputs[i]; i++) {
+        if (!check(input) && !invalid) {
+          invalid = input;
+        }
+      }
+      if (invalid) {
+        event.preventDefault();
+        event.stopImmediatePropagation();
+        invalid.focus();
+      }
+    }, true);
+  }
+
+  let forms = new Set();
+  let inputs = document.querySelectorAll('[data-mdc-rules]');
+  for (let i = 0, input; input = inputs[i]; i++) {
+    if (input.form) {
+      forms.add(input.form);
+    }
+  }
+  forms.forEach(watch);
+})();
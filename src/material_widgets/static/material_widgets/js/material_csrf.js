@@ -0,0 +1,49 @@
+(function () {
+  let script = document.currentScript;
+  let url = script.dataset.csrfUrl;
+  let cookieName = script.dataset.csrfCookie;
+
+  function readCookie() {
+    if (!cookieName) {
+      return null;
+    }
+    let cookies = document.cookie ? document.cookie.split('; ') : [];
+    for (let i = 0, cookie; cookie = cookies[i]; i++) {
+      if (cookie.indexOf(cookieName + '=') === 0) {
+        return decodeURIComponent(cookie.substring(cookieName.length + 1));
+      }
+    }
+    return null;
+  }
+
+  function getToken() {
+    let token = readCookie();
+    if (token) {
+      return Promise.resolve(token);
+    }
+    return fetch(url, {credentials: 'same-origin'})
+      .then(function (response) { return response.json(); })
+      .then(function (data) { return data.token; });
+  }
+
+  document.addEventListener('submit', function (event) {
+    let form = event.target;
+    let input = form.querySelector('input[data-mdc-csrf]');
+    if (!input || form.dataset.mdcCsrfReady) {
+      // filled in, let the resubmission through
+      delete form.dataset.mdcCsrfReady;
+      return;
+    }
+    event.preventDefault();
+    getToken().then(function (token) {
+      input.value = token;
+      if (form.requestSubmit) {
+        // keeps the name and value of the button that submitted the form
+        form.dataset.mdcCsrfReady = 'true';
+        form.requestSubmit(event.submitter);
+      } else {
+        form.submit();
+      }
+    });
+  });
+})();
@@ -0,0 +1,81 @@
+(function () {
+  let components = [
+    ['.mdc-text-field', function (element) {
+      mdc.textField.MDCTextField.attachTo(element);
+    }],
+    ['.mdc-checkbox', function (element) {
+      mdc.checkbox.MDCCheckbox.attachTo(element);
+    }],
+    ['.mdc-radio', function (element) {
+      mdc.radio.MDCRadio.attachTo(element);
+    }],
+  ];
+
+  function attach(row) {
+    if (typeof mdc === 'undefined') {
+      return;
+    }
+    for (let i = 0, component; component = components[i]; i++) {
+      let elements = row.querySelectorAll(component[0]);
+      for (let j = 0, element; element = elements[j]; j++) {
+        component[1](element);
+      }
+    }
+  }
+
+  function replace(form, name, html) {
+    let row = form.querySelector('[data-mdc-field="' + CSS.escape(name) + '"]');
+    if (!row) {
+      return;
+    }
+    let previous = row.previousElementSibling;
+    if (previous && previous.classList.contains('mdc-errorlist')) {
+      previous.remove();
+    }
+    let template = document.createElement('template');
+    template.innerHTML = html;
+    let rows = Array.from(template.content.children);
+    row.replaceWith(template.content);
+    rows.forEach(attach);
+  }
+
+  function validate(form, dirty) {
+    let names = Array.from(dirty);
+    dirty.clear();
+    fetch(form.dataset.mdcValidate || form.action || window.location.href, {
+      method: 'POST',
+      body: new FormData(form),
+      credentials: 'same-origin',
+      headers: {'X-Material-Validate': names.join(',')},
+    })
+      .then(function (response) { return response.json(); })
+      .then(function (data) {
+        for (let name in data.fields) {
+          replace(form, name, data.fields[name]);
+        }
+      });
+  }
+
+  function watch(form) {
+    let dirty = new Set();
+    function mark(event) {
+      let row = event.target.closest('[data-mdc-field]');
+      if (row && event.target.type !== 'file') {
+        dirty.add(row.dataset.mdcField);
+      }
+    }
+    form.addEventListener('input', mark);
+    form.addEventListener('change', mark);
+    form.addEventListener('focusout', function (event) {
+      let row = event.target.closest('[data-mdc-field]');
+      if (dirty.size && !(row && row.contains(event.relatedTarget))) {
+        validate(form, dirty);
+      }
+    });
+  }
+
+  let forms = document.querySelectorAll('form[data-mdc-validate]');
+  for (let i = 0, form; form = forms[i]; i++) {
+    watch(form);
+  }
+})();
@@ -0,0 +1,58 @@
+"""Template tags to submit forms of cached pages with a CSRF token.
+
+A page using ``{% csrf_token %}`` embeds a token that differs per visitor, so
+it cannot be cached. ``{% material_csrf_token %}`` renders an empty token
+field instead, which ``{% material_csrf_script %}`` fills in at submit time
+from the CSRF cookie, or from the `material_widgets.views.csrf_token` view if
+the cookie is unreadable. The page no longer depends on the visitor, while
+`django.middleware.csrf.CsrfViewMiddleware` checks submissions as usual.
+
+Examples
+--------
+Include ``material_widgets.urls`` in the project's URL configuration, then
+replace ``{% csrf_token %}`` in the form's template.
+
+>>> {% load material_csrf %}
+>>> <form method="post">
+>>>   {% material_csrf_token %}
+>>>   {{ form.as_components }}
+>>> </form>
+>>> {% material_csrf_script %}
+
+"""
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.html import format_html
+
+register = template.Library()
+
+
+@register.simple_tag
+def material_csrf_token():
+    """Render an empty CSRF token field, filled in by material_csrf.js."""
+    return format_html(
+        '<input type="hidden" name="csrfmiddlewaretoken" value=""'
+        ' data-mdc-csrf>'
+        )
+
+
+@register.simple_tag
+def material_csrf_script(url=None):
+    """Render the script filling in CSRF token fields on submit.
+
+    Parameters
+    ----------
+    url : str, optional
+        URL of the `material_widgets.views.csrf_token` view. Defaults to
+        that of the ``material_widgets`` URL namespace.
+
+    """
+    return format_html(
+        '<script src="{}" data-csrf-url="{}" data-csrf-cookie="{}"></script>',
+        static('material_widgets/js/material_csrf.js'),
+        url or reverse('material_widgets:csrf_token'),
+        '' if settings.CSRF_USE_SESSIONS or settings.CSRF_COOKIE_HTTPONLY
+        else settings.CSRF_COOKIE_NAME,
+        )
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-19 12:43
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('material_widgets_tests', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaterialWidgetsUniqueTestModel',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=32, unique=True)),
+                ('group', models.IntegerField()),
+                ('rank', models.IntegerField()),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='materialwidgetsuniquetestmodel',
+            unique_together=set([('group', 'rank')]),
+        ),
+    ]
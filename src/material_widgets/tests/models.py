@@ -66,3 +66,15 @@ class MaterialWidgetsTestModel(models.Model):
     class Meta:
         """Meta settings for MaterialWidgetsTestModel"""
         app_label = 'material_widgets_tests'
+
+
+class MaterialWidgetsUniqueTestModel(models.Model):
+    """Test model with unique fields."""
+    code = models.CharField(max_length=32, unique=True)
+    group = models.IntegerField()
+    rank = models.IntegerField()
+
+    class Meta:
+        """Meta settings for MaterialWidgetsUniqueTestModel"""
+        app_label = 'material_widgets_tests'
+        unique_together = ('group', 'rank')
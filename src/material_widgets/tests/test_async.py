@@ -0,0 +1,94 @@
+"""
+DJANGO MATERIAL WIDGETS ASYNC RENDERING TEST MODULE
+material_widgets/tests/test_async.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import asyncio
+import threading
+from unittest import mock
+from django.test import TransactionTestCase
+from ..benchmarks import concurrency
+from ..forms import MaterialModelForm, aload_choices
+from .models import MaterialWidgetsForeignKeyTestModel
+from .models import MaterialWidgetsManyToManyTestModel
+from .models import MaterialWidgetsTestModel
+
+class AsyncTestModelForm(MaterialModelForm):
+    class Meta:
+        model = MaterialWidgetsTestModel
+        fields = ('char_field', 'foreign_key', 'many_to_many_field')
+
+
+class AsyncQuerySet:
+    """Stand-in for a queryset of an ORM supporting ``async for``."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def all(self):
+        return self
+
+    async def __aiter__(self):  # pylint: disable=invalid-overridden-method
+        for obj in self.objects:
+            await asyncio.sleep(0)
+            yield obj
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncRenderingTests(TransactionTestCase):
+    """Test cases for arender_components and aload_choices."""
+
+    def setUp(self):
+        for item in (1, 2):
+            MaterialWidgetsForeignKeyTestModel.objects.create(item=item)
+            MaterialWidgetsManyToManyTestModel.objects.create(item=item)
+
+    def test_arender_components_matches_as_components(self):
+        self.assertEqual(
+            run(AsyncTestModelForm().arender_components()),
+            AsyncTestModelForm().as_components(),
+            )
+
+    def test_loaded_choices_render_without_queries(self):
+        form = AsyncTestModelForm()
+        for name in ('foreign_key', 'many_to_many_field'):
+            run(aload_choices(form.fields[name]))
+        with self.assertNumQueries(0):
+            html = form.as_components()
+        self.assertEqual(html, AsyncTestModelForm().as_components())
+
+    def test_async_querysets_are_iterated_with_async_for(self):
+        form = AsyncTestModelForm()
+        field = form.fields['foreign_key']
+        objects = list(MaterialWidgetsForeignKeyTestModel.objects.all())
+        field.queryset = AsyncQuerySet(objects)
+        run(aload_choices(field))
+        self.assertEqual(
+            [value for value, _ in field.widget.choices],
+            [''] + [obj.pk for obj in objects],
+            )
+
+    def test_executor_threads_close_their_connections(self):
+        # in-memory SQLite test databases ignore close(), so check the call
+        threads = []
+        form = AsyncTestModelForm()
+        with mock.patch('material_widgets.forms.close_old_connections',
+                        lambda: threads.append(threading.current_thread())):
+            run(aload_choices(form.fields['foreign_key']))
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_benchmark_reports_both_approaches(self):
+        results = concurrency.run(AsyncTestModelForm, concurrency=3, renders=2)
+        self.assertEqual(results['concurrency'], 3)
+        for approach in concurrency.APPROACHES:
+            self.assertEqual(len(results[approach]['latencies']), 6)
+            self.assertGreater(results[approach]['throughput'], 0)
@@ -0,0 +1,237 @@
+"""
+DJANGO MATERIAL WIDGETS BENCHMARKS TEST MODULE
+material_widgets/tests/test_benchmarks.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+from django import forms
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+from .. import widgets
+from ..benchmarks import SCENARIOS, build_form, field_name, memory, overhead
+from ..benchmarks import coldstart, load, results
+from ..forms import MaterialForm
+
+class BenchmarkScenarioTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks scenarios."""
+
+    def test_scenarios_cover_every_Material_widget(self):
+        self.assertEqual(set(SCENARIOS), set(widgets.__all__))
+
+    def test_scenarios_materialize_to_their_Material_widget(self):
+        form = build_form(MaterialForm, SCENARIOS)()
+        for scenario in SCENARIOS:
+            self.assertEqual(
+                type(form.fields[field_name(scenario)].widget).__name__,
+                scenario,
+                )
+
+    def test_plain_scenarios_use_no_Material_widgets(self):
+        form = build_form(forms.Form, SCENARIOS)()
+        for field in form.fields.values():
+            self.assertNotIn(
+                'material_widgets', type(field.widget).__module__,
+                )
+
+
+class OverheadBenchmarkTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks.overhead."""
+
+    def test_run_reports_every_metric_per_field_and_form(self):
+        results = overhead.run(['MaterialSelect'], number=1, repeat=2)
+        for metrics in (results['fields']['MaterialSelect'], results['form']):
+            self.assertEqual(tuple(metrics), overhead.METRICS)
+            for result in metrics.values():
+                self.assertEqual(len(result['plain']), 2)
+                self.assertEqual(len(result['material']), 2)
+                self.assertGreater(overhead.ratio(result), 0)
+
+    def test_operations_are_warmed_up_before_timing(self):
+        with mock.patch.object(MaterialForm, 'as_components',
+                               autospec=True, return_value='') as render:
+            overhead.run(['MaterialSelect'], number=1, repeat=2, warmup=3)
+        # the form of every scenario: 3 untimed calls, then 2 timed
+        self.assertEqual(render.call_count, 3 + 2)
+
+    def test_command_outputs_json_with_ratios(self):
+        stdout = StringIO()
+        call_command(
+            'material_benchmark', mode='overhead', scenarios=['MaterialSelect'],
+            number=1, repeat=1, json=True, stdout=stdout,
+            )
+        results = json.loads(stdout.getvalue())
+        self.assertIn('ratio', results['form']['render'])
+
+    def test_command_rejects_unknown_scenarios(self):
+        with self.assertRaises(CommandError):
+            call_command('material_benchmark', scenarios=['MaterialUnknown'])
+
+
+class MemoryBenchmarkTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks.memory."""
+
+    def test_trace_attributes_allocations_to_package_source_lines(self):
+        form_class = build_form(MaterialForm, ['MaterialTextInput'])
+        allocations = memory.trace(form_class, number=5)
+        self.assertGreater(allocations['bytes'], 0)
+        self.assertTrue(any(
+            line.startswith('forms.py:') for line in allocations['lines']
+            ))
+
+    def test_exceeded_reports_allocations_over_budget(self):
+        results = {'MaterialSelect': {'render': {'bytes': 200, 'peak': 50}}}
+        budgets = {'MaterialSelect': {'render': {'bytes': 100, 'peak': 100}}}
+        self.assertEqual(
+            memory.exceeded(results, budgets),
+            [('MaterialSelect', 'render', 'bytes', 200, 100)],
+            )
+
+    def test_scenarios_stay_within_stored_budgets(self):
+        budgets = memory.load_budgets()
+        if not budgets:
+            self.skipTest('No memory budgets for Python {}.'.format(
+                memory.python_version()
+                ))
+        results = memory.run(['MaterialSelect', 'MaterialTextInput'])
+        del results[memory.FORM]
+        self.assertEqual(memory.exceeded(results, budgets), [])
+
+    def test_budgets_are_stored_per_python_version(self):
+        results = {'MaterialSelect': {'render': {'bytes': 100, 'peak': None}}}
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'budgets.json')
+            memory.write_budgets(results, path, version='3.7')
+            memory.write_budgets(results, path, headroom=2, version='3.8')
+            self.assertEqual(
+                memory.load_budgets(path, '3.7'),
+                {'MaterialSelect': {'render': {'bytes': 125}}},
+                )
+            self.assertEqual(
+                memory.load_budgets(path, '3.8')['MaterialSelect'],
+                {'render': {'bytes': 200}},
+                )
+            self.assertEqual(memory.load_budgets(path, '2.7'), {})
+
+
+class BenchmarkResultsTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks.results."""
+
+    @staticmethod
+    def document(render):
+        metrics = {'render': {'plain': render, 'material': render}}
+        return {
+            'format': results.FORMAT, 'mode': 'overhead',
+            'results': {'fields': {'MaterialSelect': metrics}, 'form': metrics},
+            }
+
+    def test_mann_whitney_u_exact_p_value(self):
+        u, p = results.mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        self.assertEqual(u, 25)
+        self.assertAlmostEqual(p, 1 / 252)
+
+    def test_compare_flags_significant_regressions_above_threshold(self):
+        baseline = self.document([1.0, 1.01, 1.02, 1.03, 1.04])
+        slower = self.document([1.2, 1.21, 1.22, 1.23, 1.24])
+        rows = results.compare(baseline, slower, threshold=5)
+        self.assertTrue(all(row['regression'] for row in rows))
+        rows = results.compare(baseline, slower, threshold=25)
+        self.assertFalse(any(row['regression'] for row in rows))
+
+    def test_compare_ignores_insignificant_changes(self):
+        baseline = self.document([1.0, 1.3, 1.0, 1.3, 1.0])
+        noisy = self.document([1.3, 1.0, 1.3, 1.0, 1.3])
+        rows = results.compare(baseline, noisy, threshold=5)
+        self.assertFalse(any(row['regression'] for row in rows))
+
+    def test_command_saves_and_compares_results(self):
+        with TemporaryDirectory() as directory:
+            for _ in range(2):
+                call_command(
+                    'material_benchmark', scenarios=['MaterialTextInput'],
+                    number=1, repeat=2, save=directory,
+                    stdout=StringIO(), stderr=StringIO(),
+                    )
+            paths = sorted(
+                os.path.join(directory, name) for name in os.listdir(directory)
+                )
+            self.assertEqual(len(paths), 2)
+            self.assertEqual(results.load(paths[0])['mode'], 'overhead')
+            stdout = StringIO()
+            call_command(
+                'material_benchmark', compare=paths, threshold=float('inf'),
+                json=True, stdout=stdout,
+                )
+            self.assertTrue(json.loads(stdout.getvalue()))
+
+
+@override_settings(ROOT_URLCONF='material_widgets.tests.urls')
+class LoadBenchmarkTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks.load."""
+
+    def test_percentile_uses_nearest_rank(self):
+        samples = list(range(1, 101))
+        self.assertEqual(load.percentile(samples, 50), 50)
+        self.assertEqual(load.percentile(samples, 99), 99)
+        self.assertEqual(load.percentile([3], 95), 3)
+
+    def test_run_drives_pages_from_threads(self):
+        result = load.run(['/form/', '/missing/'], threads=3, requests=4)
+        self.assertEqual(result['requests'], 12)
+        self.assertEqual(result['paths']['/form/']['errors'], 0)
+        self.assertEqual(result['paths']['/missing/']['errors'], 6)
+        self.assertEqual(len(result['paths']['/form/']['latencies']), 6)
+        self.assertEqual(
+            tuple(result['paths']['/form/']['percentiles']), ('50', '95', '99')
+            )
+
+    def test_run_drives_pages_from_processes(self):
+        result = load.run(['/form/'], threads=2, processes=2, requests=2)
+        self.assertEqual(result['requests'], 8)
+        self.assertEqual(len(result['cpu']), 2)
+        self.assertEqual(result['paths']['/form/']['errors'], 0)
+
+    def test_command_requires_paths_in_load_mode(self):
+        with self.assertRaises(CommandError):
+            call_command('material_benchmark', mode='load')
+
+
+class ColdStartBenchmarkTests(SimpleTestCase):
+    """Test cases for material_widgets.benchmarks.coldstart."""
+
+    def test_run_times_every_step_of_each_process(self):
+        results = coldstart.run(['MaterialTextInput'], samples=2)
+        self.assertEqual(tuple(results), coldstart.STEPS)
+        for samples in results.values():
+            self.assertEqual(len(samples), 2)
+
+    def test_importing_forms_does_not_load_widget_classes(self):
+        output = subprocess.check_output([sys.executable, '-c', (
+            'import sys, django; django.setup(); '
+            'import material_widgets.forms; '
+            'print("material_widgets._widgets" in sys.modules)'
+            )], env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.assertEqual(output.strip(), b'False')
+
+    def test_widgets_module_exposes_public_names(self):
+        self.assertTrue(set(widgets.__all__) <= set(dir(widgets)))
+        for name in widgets.__all__:
+            self.assertEqual(getattr(widgets, name).__name__, name)
+        with self.assertRaises(AttributeError):
+            getattr(widgets, 'MATERIAL_CSS')
+
+    def test_forms_module_exposes_names_imported_at_baseline(self):
+        from .. import forms as material_forms
+        from ..forms import MaterialComponent, MaterialMultiWidget
+        self.assertIs(MaterialComponent, widgets.MaterialComponent)
+        self.assertIs(MaterialMultiWidget, widgets.MaterialMultiWidget)
+        for name in widgets.__all__:
+            self.assertIs(getattr(material_forms, name),
+                          getattr(widgets, name))
@@ -0,0 +1,126 @@
+"""
+DJANGO MATERIAL WIDGETS BULK TEST MODULE
+material_widgets/tests/test_bulk.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from unittest import mock
+from django.test import TestCase
+from ..bulk import RowResult
+from ..forms import MaterialModelForm, materialize_field
+from .models import MaterialWidgetsForeignKeyTestModel
+from .models import MaterialWidgetsManyToManyTestModel
+from .models import MaterialWidgetsTestModel
+from .models import MaterialWidgetsUniqueTestModel
+
+
+class BulkTestModelForm(MaterialModelForm):
+    class Meta:
+        model = MaterialWidgetsTestModel
+        fields = ('boolean_field', 'integer_field', 'positive_integer_field',
+                  'foreign_key', 'many_to_many_field')
+
+
+class BulkUniqueTestModelForm(MaterialModelForm):
+    class Meta:
+        model = MaterialWidgetsUniqueTestModel
+        fields = ('code', 'group', 'rank')
+
+
+class BulkValidateTests(TestCase):
+    """Test cases for MaterialModelForm.bulk_validate."""
+
+    def setUp(self):
+        self.keys = [
+            MaterialWidgetsForeignKeyTestModel.objects.create(item=item).pk
+            for item in range(3)
+            ]
+        self.many = [
+            MaterialWidgetsManyToManyTestModel.objects.create(item=item).pk
+            for item in range(3)
+            ]
+
+    def rows(self, count):
+        return [
+            {'integer_field': str(index),
+             'foreign_key': str(self.keys[index % 3])}
+            for index in range(count)
+            ]
+
+    def test_valid_rows_are_saved_in_bulk(self):
+        with self.assertNumQueries(4 * 3):
+            # per chunk: foreign keys, bulk_create and a savepoint pair
+            results = list(BulkTestModelForm.bulk_validate(
+                self.rows(30), chunk_size=10
+                ))
+        self.assertEqual([result.index for result in results], list(range(30)))
+        self.assertTrue(all(isinstance(result, RowResult)
+                            and not result.errors for result in results))
+        self.assertEqual(MaterialWidgetsTestModel.objects.count(), 30)
+        self.assertEqual(
+            MaterialWidgetsTestModel.objects.filter(
+                foreign_key=self.keys[1]
+                ).count(), 10,
+            )
+
+    def test_errors_are_collected_per_row(self):
+        rows = self.rows(4)
+        rows[1]['positive_integer_field'] = '-1'
+        rows[2]['foreign_key'] = '999'
+        rows[3]['foreign_key'] = 'nope'
+        results = list(BulkTestModelForm.bulk_validate(rows))
+        self.assertFalse(results[0].errors)
+        self.assertEqual(list(results[1].errors), ['positive_integer_field'])
+        self.assertEqual(list(results[2].errors), ['foreign_key'])
+        self.assertEqual(list(results[3].errors), ['foreign_key'])
+        self.assertEqual(MaterialWidgetsTestModel.objects.count(), 1)
+        self.assertEqual(results[0].instance.integer_field,
+                         MaterialWidgetsTestModel.objects.get().integer_field)
+
+    def test_many_to_many_values_are_saved(self):
+        rows = self.rows(2)
+        rows[0]['many_to_many_field'] = [str(pk) for pk in self.many[:2]]
+        rows[1]['many_to_many_field'] = [str(self.many[0]), '999']
+        results = list(BulkTestModelForm.bulk_validate(rows))
+        self.assertEqual(list(results[1].errors), ['many_to_many_field'])
+        self.assertEqual(
+            sorted(results[0].instance.many_to_many_field.values_list(
+                'pk', flat=True)), self.many[:2],
+            )
+
+    def test_rows_are_streamed_without_widget_work(self):
+        with mock.patch('material_widgets.forms.materialize_field',
+                        side_effect=materialize_field) as materialize:
+            results = BulkTestModelForm.bulk_validate(
+                iter(self.rows(5)), chunk_size=2, commit=False,
+                )
+            self.assertEqual(next(results).index, 0)
+            self.assertEqual(len(list(results)), 4)
+        materialize.assert_not_called()
+        self.assertEqual(MaterialWidgetsTestModel.objects.count(), 0)
+
+    def test_unique_values_repeated_within_a_chunk_are_row_errors(self):
+        rows = [
+            {'code': 'a', 'group': '1', 'rank': '1'},
+            {'code': 'a', 'group': '1', 'rank': '2'},
+            {'code': 'b', 'group': '1', 'rank': '1'},
+            {'code': 'c', 'group': 'nope', 'rank': '3'},
+            {'code': 'c', 'group': '1', 'rank': '3'},
+            {'code': 'd', 'group': '2', 'rank': '1'},
+            ]
+        results = list(BulkUniqueTestModelForm.bulk_validate(
+            rows, chunk_size=4
+            ))
+        self.assertFalse(results[0].errors)
+        self.assertEqual(list(results[1].errors), ['code'])
+        self.assertEqual(list(results[2].errors), ['__all__'])
+        self.assertEqual(list(results[3].errors), ['group'])
+        # the invalid row before it takes no value
+        self.assertFalse(results[4].errors)
+        self.assertFalse(results[5].errors)
+        self.assertEqual(
+            sorted(MaterialWidgetsUniqueTestModel.objects.values_list(
+                'code', flat=True)), ['a', 'c', 'd'],
+            )
+        results = list(BulkUniqueTestModelForm.bulk_validate(rows[:1]))
+        self.assertEqual(sorted(results[0].errors), ['__all__', 'code'])
@@ -0,0 +1,152 @@
+"""
+DJANGO MATERIAL WIDGETS CACHE TEST MODULE
+material_widgets/tests/test_cache.py
+"""
+# pylint: disable=invalid-name, missing-docstring, protected-access
+
+import threading
+from collections import Counter
+from django import forms
+from django.test import SimpleTestCase
+from ..benchmarks import SCENARIOS, build_form
+from ..cache import StripedCache, stats
+from ..forms import MEDIA, UNBOUND_COMPONENTS, MaterialForm
+from ..forms import clear_unbound_cache
+
+THREADS = 32
+
+def in_threads(target, count=THREADS):
+    """Run target(index) from `count` threads started together."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=run, args=(index,)) for index in range(count)
+        ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+class StripedCacheTests(SimpleTestCase):
+    """Test cases for material_widgets.cache.StripedCache."""
+
+    def test_get_or_set_counts_hits_and_misses(self):
+        cache = StripedCache('test_counts', maxsize=16, stripes=4)
+        self.assertEqual(cache.get_or_set('a', lambda: 1), 1)
+        self.assertEqual(cache.get_or_set('a', lambda: 2), 1)
+        self.assertIsNone(cache.get('b'))
+        cache_stats = stats()['test_counts']
+        self.assertEqual(cache_stats['hits'], 1)
+        self.assertEqual(cache_stats['misses'], 2)
+        self.assertEqual(cache_stats['size'], 1)
+
+    def test_oldest_entries_of_full_stripes_are_evicted(self):
+        cache = StripedCache('test_evictions', maxsize=2, stripes=1)
+        for key in 'abc':
+            cache.set(key, key)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), 'c')
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_values_are_computed_once_under_contention(self):
+        cache = StripedCache('test_contention', maxsize=1024, stripes=4)
+        calls = Counter()
+        lock = threading.Lock()
+
+        def factory(key):
+            def compute():
+                with lock:
+                    calls[key] += 1
+                return key * 2
+            return compute
+
+        def work(index):
+            for round_ in range(200):
+                key = (index + round_) % 64
+                self.assertEqual(cache.get_or_set(key, factory(key)), key * 2)
+
+        in_threads(work)
+        self.assertEqual(set(calls.values()), {1})
+        cache_stats = cache.stats()
+        self.assertEqual(
+            cache_stats['hits'] + cache_stats['misses'], THREADS * 200
+            )
+        self.assertEqual(cache_stats['misses'], 64)
+
+    def test_counters_of_ended_threads_are_retired(self):
+        cache = StripedCache('test_retired', maxsize=16, stripes=4)
+        cache.get('a')
+        in_threads(lambda index: cache.get_or_set(index % 4, lambda: 0))
+        # only the counters of the test's thread are still registered
+        self.assertEqual(len(cache._counters), 1)
+        cache_stats = cache.stats()
+        self.assertEqual(cache_stats['hits'] + cache_stats['misses'],
+                         THREADS + 1)
+        self.assertEqual(cache_stats['misses'], 5)
+
+    def test_factory_may_look_up_its_own_stripe(self):
+        cache = StripedCache('test_reentrant', maxsize=16, stripes=1)
+        values = []
+
+        def work():
+            values.append(cache.get_or_set(
+                'outer', lambda: cache.get_or_set('inner', lambda: 1) + 1
+                ))
+
+        thread = threading.Thread(target=work, daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertEqual(values, [2])
+
+
+class ThreadedRenderingTests(SimpleTestCase):
+    """Stress test of Material form rendering from many threads."""
+
+    class CachedForm(MaterialForm):
+        cache_unbound = True
+        username = forms.CharField(min_length=3)
+        choice = forms.ChoiceField(choices=(('1', 'One'), ('2', 'Two')))
+
+    def test_threads_render_identical_forms(self):
+        clear_unbound_cache()
+        form_class = build_form(MaterialForm, list(SCENARIOS)[:8])
+        expected = {
+            'plain': form_class().as_components(),
+            'bound': form_class(data={'materialemailinput': 'x'}).as_components(),
+            'cached': self.CachedForm().as_components(),
+            'media': str(form_class().media),
+            }
+        before = UNBOUND_COMPONENTS.stats()
+        results = [[] for _ in range(THREADS)]
+
+        def work(index):
+            for _ in range(5):
+                results[index].append({
+                    'plain': form_class().as_components(),
+                    'bound': form_class(
+                        data={'materialemailinput': 'x'}
+                        ).as_components(),
+                    'cached': self.CachedForm().as_components(),
+                    'media': str(form_class().media),
+                    })
+
+        in_threads(work)
+        for renders in results:
+            self.assertEqual(len(renders), 5)
+            for render in renders:
+                self.assertEqual(render, expected)
+        after = UNBOUND_COMPONENTS.stats()
+        self.assertEqual(after['hits'] - before['hits'], THREADS * 5)
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertGreaterEqual(MEDIA.stats()['hits'], THREADS * 5)
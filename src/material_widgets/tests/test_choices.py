@@ -0,0 +1,225 @@
+"""
+DJANGO MATERIAL WIDGETS CHOICES TEST MODULE
+material_widgets/tests/test_choices.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from unittest import mock
+from weakref import WeakSet
+from django import forms
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from .. import choices, widgets
+from ..choices import RequestChoicesMiddleware, cached_choices
+from ..choices import choice_cache_stats, label_choices, request_choices
+from ..forms import MaterialModelForm
+from .models import MaterialWidgetsForeignKeyTestModel
+from .models import MaterialWidgetsManyToManyTestModel
+from .models import MaterialWidgetsTestModel
+from .models import MaterialWidgetsUniqueTestModel
+
+class ChoicesTestModelForm(MaterialModelForm):
+    class Meta:
+        model = MaterialWidgetsTestModel
+        fields = ('foreign_key', 'many_to_many_field')
+
+
+class OtherTestModelForm(MaterialModelForm):
+    class Meta:
+        model = MaterialWidgetsTestModel
+        fields = ('foreign_key',)
+        labels = {'foreign_key': 'Other'}
+
+
+class RequestChoicesTests(TestCase):
+    """Test cases for material_widgets.choices."""
+
+    def setUp(self):
+        for item in (1, 2):
+            MaterialWidgetsForeignKeyTestModel.objects.create(item=item)
+            MaterialWidgetsManyToManyTestModel.objects.create(item=item)
+
+    def render(self):
+        return (ChoicesTestModelForm().as_components()
+                + OtherTestModelForm().as_components())
+
+    def test_each_choice_query_runs_once(self):
+        with self.assertNumQueries(3):
+            html = self.render()
+        with request_choices():
+            with self.assertNumQueries(2):
+                self.assertEqual(self.render(), html)
+                self.assertEqual(self.render(), html)
+
+    def test_distinct_querysets_are_queried_apart(self):
+        form = ChoicesTestModelForm()
+        field = form.fields['foreign_key']
+        field.queryset = field.queryset.filter(item=1)
+        expected = str(form['foreign_key'])
+        with request_choices():
+            with self.assertNumQueries(3):
+                self.render()
+                html = str(form['foreign_key'])
+        self.assertEqual(html, expected)
+
+    def test_middleware_discards_objects_after_the_response(self):
+        def view(request):  # pylint: disable=unused-argument
+            return HttpResponse(self.render())
+
+        middleware = RequestChoicesMiddleware(view)
+        with self.assertNumQueries(2):
+            middleware(RequestFactory().get('/'))
+        with self.assertNumQueries(2):
+            middleware(RequestFactory().get('/'))
+        self.assertIsNone(
+            cached_choices(ChoicesTestModelForm().fields['foreign_key'].choices)
+            )
+
+
+class StoredTestModelForm(ChoicesTestModelForm):
+    cache_choices = {'foreign_key': 60}
+    related = forms.ModelMultipleChoiceField(
+        MaterialWidgetsManyToManyTestModel.objects.filter(
+            materialwidgetstestmodel__integer_field=1
+            ).distinct(),
+        required=False, widget=widgets.MaterialSelectMultiple(
+            cache_choices=True
+            ),
+        )
+
+
+class StoredChoicesTests(TestCase):
+    """Test cases for choices kept between requests by
+    material_widgets.choices.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.model = MaterialWidgetsTestModel.objects.create(
+            boolean_field=False, integer_field=1,
+            )
+        self.first = MaterialWidgetsForeignKeyTestModel.objects.create(item=1)
+        MaterialWidgetsManyToManyTestModel.objects.create(item=1)
+
+    def render(self, name):
+        return str(StoredTestModelForm()[name])
+
+    def test_choices_are_queried_once_and_counted(self):
+        before = choice_cache_stats()
+        with self.assertNumQueries(1):
+            html = self.render('foreign_key')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.render('foreign_key'), html)
+        self.assertEqual(html, str(ChoicesTestModelForm()['foreign_key']))
+        stats = choice_cache_stats()
+        self.assertEqual(stats['misses'] - before['misses'], 1)
+        self.assertEqual(stats['hits'] - before['hits'], 1)
+        self.assertGreater(stats['hit_rate'], 0)
+        self.assertIsNone(StoredTestModelForm().fields[
+            'many_to_many_field'].widget.cache_choices)
+
+    def test_saves_and_deletes_invalidate_choices(self):
+        self.render('foreign_key')
+        second = MaterialWidgetsForeignKeyTestModel.objects.create(item=2)
+        with self.assertNumQueries(1):
+            html = self.render('foreign_key')
+        self.assertIn('value="{}"'.format(second.pk), html)
+        second.delete()
+        self.assertNotIn('value="{}"'.format(second.pk),
+                         self.render('foreign_key'))
+
+    def test_many_to_many_changes_invalidate_choices(self):
+        added = MaterialWidgetsManyToManyTestModel.objects.get()
+        self.assertNotIn('value="{}"'.format(added.pk),
+                         self.render('related'))
+        self.model.many_to_many_field.add(added)
+        html = self.render('related')
+        self.assertIn('value="{}"'.format(added.pk), html)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.render('related'), html)
+
+
+    def test_changes_of_other_tables_cost_no_cache_request(self):
+        with mock.patch.object(cache, 'incr') as incr:
+            MaterialWidgetsUniqueTestModel.objects.create(
+                code='a', group=1, rank=1,
+                )
+        incr.assert_not_called()
+
+    def test_fresh_processes_invalidate_choices_of_declared_forms(self):
+        # pylint: disable=protected-access
+        with mock.patch.object(choices, '_stored_tables', set()), \
+                mock.patch.object(choices, '_scanned_forms', WeakSet()), \
+                mock.patch.object(cache, 'incr') as incr:
+            MaterialWidgetsForeignKeyTestModel.objects.create(item=2)
+            incr.assert_called_once_with(choices._generation_key(
+                MaterialWidgetsForeignKeyTestModel._meta.db_table
+                ))
+            self.assertIn(MaterialWidgetsManyToManyTestModel._meta.db_table,
+                          choices._stored_tables)
+
+
+class RelatedLabelChoiceField(forms.ModelChoiceField):
+    def label_from_instance(self, obj):
+        return '{} of {}'.format(obj.integer_field, obj.foreign_key.item)
+
+
+class LabelTestModelForm(ChoicesTestModelForm):
+    label_fields = {
+        'foreign_key': ('item',), 'many_to_many_field': ['item'],
+        'parent': ('integer_field', 'foreign_key__item'),
+        }
+    parent = RelatedLabelChoiceField(MaterialWidgetsTestModel.objects.all())
+
+
+class UnlabelledTestModelForm(LabelTestModelForm):
+    label_fields = {}
+
+
+class LabelFieldsTests(TestCase):
+    """Test cases for label_fields of Material choice widgets."""
+
+    def setUp(self):
+        for item in range(5):
+            foreign_key = MaterialWidgetsForeignKeyTestModel.objects.create(
+                item=item
+                )
+            MaterialWidgetsManyToManyTestModel.objects.create(item=item)
+            MaterialWidgetsTestModel.objects.create(
+                boolean_field=False, integer_field=item,
+                foreign_key=foreign_key,
+                )
+
+    def test_related_labels_are_loaded_in_one_query(self):
+        with self.assertNumQueries(1 + 5):
+            html = str(UnlabelledTestModelForm()['parent'])
+        with self.assertNumQueries(1):
+            self.assertEqual(str(LabelTestModelForm()['parent']), html)
+        self.assertIn('4 of 4', html)
+
+    def test_foreign_key_and_many_to_many_choices_take_one_query_each(self):
+        form = LabelTestModelForm()
+        for name in ('foreign_key', 'many_to_many_field'):
+            expected = str(UnlabelledTestModelForm()[name])
+            with self.assertNumQueries(1):
+                self.assertEqual(str(form[name]), expected)
+        self.assertEqual(form.fields['many_to_many_field'].widget.label_fields,
+                         ('item',))
+
+    def test_querysets_defer_unread_fields(self):
+        choices = label_choices(
+            LabelTestModelForm().fields['parent'].widget.choices,
+            ('integer_field', 'foreign_key__item'),
+            )
+        obj = list(choices.queryset)[0]
+        self.assertEqual(
+            obj.get_deferred_fields(),
+            {field.attname for field in MaterialWidgetsTestModel._meta.fields
+             if field.name not in ('id', 'integer_field', 'foreign_key')},
+            )
+        with request_choices():
+            with self.assertNumQueries(1):
+                str(LabelTestModelForm()['parent'])
+                str(LabelTestModelForm()['parent'])
@@ -0,0 +1,64 @@
+"""
+DJANGO MATERIAL WIDGETS COMPILED TEMPLATES TEST MODULE
+material_widgets/tests/test_compiled.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from .. import compiled
+from ..benchmarks import SCENARIOS, build_form
+from ..forms import MaterialForm
+from ..renderers import MaterialFormRenderer
+from ..warmup import template_names
+
+class CompiledTemplatesTests(SimpleTestCase):
+    """Test cases for material_widgets.compiled."""
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(MaterialFormRenderer.reset)
+        MaterialFormRenderer.reset()
+
+    def render(self):
+        return str(build_form(MaterialForm, SCENARIOS)(auto_id='%s'))
+
+    def load(self):
+        MaterialFormRenderer.reset()
+        with mock.patch(
+                'material_widgets.settings.MATERIAL_TEMPLATE_CACHE',
+                self.directory.name):
+            return MaterialFormRenderer.get_engine()
+
+    def test_loaded_templates_render_like_parsed_templates(self):
+        parsed = self.render()
+        call_command(
+            'compile_material_templates', directory=self.directory.name,
+            stdout=StringIO(),
+            )
+        engine = self.load()
+        cache = engine.engine.template_loaders[0].get_template_cache
+        self.assertEqual(sorted(cache), template_names())
+        self.assertEqual(self.render(), parsed)
+
+    def test_source_changes_fall_back_to_parsing(self):
+        engine = MaterialFormRenderer.get_engine().engine
+        compiled.dump(self.directory.name, engine)
+        with mock.patch('material_widgets.compiled.source_hash',
+                        return_value='changed'):
+            with self.assertLogs('material_widgets.compiled', 'INFO'):
+                engine = self.load()
+        self.assertEqual(engine.engine.template_loaders[0].get_template_cache,
+                         {})
+
+    def test_unreadable_file_falls_back_to_parsing(self):
+        engine = MaterialFormRenderer.get_engine().engine
+        path = compiled.dump(self.directory.name, engine)
+        with open(path, 'wb') as output:
+            output.write(b'corrupt')
+        with self.assertLogs('material_widgets.compiled', 'WARNING'):
+            self.assertEqual(compiled.load(self.directory.name, engine), 0)
@@ -0,0 +1,83 @@
+"""
+DJANGO MATERIAL WIDGETS CONSTRAINTS TEST MODULE
+material_widgets/tests/test_constraints.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import json
+import re
+from django import forms
+from django.core.validators import RegexValidator, validate_slug
+from django.core.validators import validate_unicode_slug
+from django.test import SimpleTestCase
+from .. import constraints
+from ..forms import CONSTRAINTS_JS, MaterialForm
+
+class ConstrainedForm(MaterialForm):
+    client_validation = True
+    username = forms.CharField(min_length=3, max_length=32)
+    number = forms.IntegerField(min_value=1, max_value=9, required=False)
+    price = forms.DecimalField(decimal_places=2)
+    code = forms.RegexField(r'^[A-Z]{3}$')
+    agree = forms.BooleanField()
+    token = forms.CharField(widget=forms.HiddenInput())
+
+
+class ConstraintsTests(SimpleTestCase):
+    """Test cases for material_widgets.constraints."""
+
+    def rules(self, name):
+        return json.loads(
+            ConstrainedForm().fields[name].widget.attrs['data-mdc-rules']
+            )
+
+    def test_length_rules_leave_value_length_to_client(self):
+        rules = self.rules('username')
+        self.assertEqual(rules['required'], 'This field is required.')
+        self.assertEqual(
+            rules['minlength'],
+            'Ensure this value has at least 3 characters (it has '
+            '{show_value}).',
+            )
+        self.assertIn('at most 32', rules['maxlength'])
+
+    def test_value_and_step_rules(self):
+        self.assertEqual(
+            set(self.rules('number')), {'invalid', 'min', 'max'}
+            )
+        self.assertIn('2 decimal places', self.rules('price')['step'])
+
+    def test_regex_rules_and_whole_value_patterns(self):
+        form = ConstrainedForm()
+        self.assertEqual(
+            self.rules('code')['regex'],
+            ['^[A-Z]{3}$', '', False, 'Enter a valid value.'],
+            )
+        self.assertEqual(form.fields['code'].widget.attrs['pattern'], '[A-Z]{3}')
+        self.assertIn('data-mdc-rules="{&quot;', str(form['code']))
+
+    def test_js_regex_translates_or_skips_python_syntax(self):
+        self.assertEqual(
+            constraints.js_regex(validate_slug), ('^[-a-zA-Z0-9_]+$', '')
+            )
+        self.assertIsNone(constraints.js_regex(validate_unicode_slug))
+        self.assertEqual(
+            constraints.js_regex(RegexValidator(r'(?P<a>x)', flags=re.I)),
+            ('(?<a>x)', 'i'),
+            )
+        self.assertIsNone(constraints.js_regex(RegexValidator(r'(?i)x')))
+
+    def test_non_text_widgets_are_not_constrained(self):
+        form = ConstrainedForm()
+        for name in ('agree', 'token'):
+            self.assertNotIn('data-mdc-rules', form.fields[name].widget.attrs)
+
+    def test_media_includes_script_only_if_enabled(self):
+        self.assertIn(CONSTRAINTS_JS, str(ConstrainedForm().media))
+
+        class PlainForm(MaterialForm):
+            username = forms.CharField(min_length=3)
+
+        form = PlainForm()
+        self.assertNotIn(CONSTRAINTS_JS, str(form.media))
+        self.assertNotIn('data-mdc-rules', form.fields['username'].widget.attrs)
@@ -0,0 +1,89 @@
+"""
+DJANGO MATERIAL WIDGETS CSRF TEST MODULE
+material_widgets/tests/test_csrf.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import Client, SimpleTestCase, override_settings
+from django.urls import reverse
+
+@override_settings(ROOT_URLCONF='material_widgets.tests.urls')
+class CachedFormCsrfTests(SimpleTestCase):
+    """Test cases for material_csrf template tags and the csrf_token view.
+    Cached form pages should embed no token, yet submissions stay protected.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(enforce_csrf_checks=True)
+
+    def fetch_token(self):
+        response = self.client.get(reverse('material_widgets:csrf_token'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+        return response.json()['token']
+
+    def test_page_embeds_placeholder_and_script_but_no_token(self):
+        response = self.client.get('/cached/')
+        content = response.content.decode()
+        self.assertIn(
+            'name="csrfmiddlewaretoken" value="" data-mdc-csrf', content
+            )
+        self.assertIn('material_widgets/js/material_csrf.js', content)
+        self.assertIn('data-csrf-url="/material/csrf/"', content)
+        self.assertNotIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+
+    def test_page_is_served_from_cache_to_every_visitor(self):
+        self.client.get('/cached/')
+        self.fetch_token()
+        response = self.client.get('/cached/')
+        self.assertNotIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertIn('value="" data-mdc-csrf', response.content.decode())
+
+    def test_post_without_token_is_forbidden(self):
+        self.client.get('/cached/')
+        self.assertEqual(self.client.post('/cached/').status_code, 403)
+
+    def test_post_with_placeholder_token_is_forbidden(self):
+        self.fetch_token()
+        response = self.client.post(
+            '/cached/', {'csrfmiddlewaretoken': '', 'username': 'x'}
+            )
+        self.assertEqual(response.status_code, 403)
+
+    def test_post_with_forged_token_is_forbidden(self):
+        self.fetch_token()
+        response = self.client.post(
+            '/cached/', {'csrfmiddlewaretoken': 'x' * 64, 'username': 'x'}
+            )
+        self.assertEqual(response.status_code, 403)
+
+    def test_post_with_fetched_token_is_accepted(self):
+        token = self.fetch_token()
+        response = self.client.post(
+            '/cached/', {'csrfmiddlewaretoken': token, 'username': 'x'}
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_with_cookie_value_is_accepted(self):
+        self.fetch_token()
+        cookie = self.client.cookies[settings.CSRF_COOKIE_NAME].value
+        response = self.client.post(
+            '/cached/', {'csrfmiddlewaretoken': cookie, 'username': 'x'}
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_token_view_only_answers_get(self):
+        response = self.client.post(reverse('material_widgets:csrf_token'))
+        self.assertEqual(response.status_code, 403)
+        client = Client()
+        response = client.post(reverse('material_widgets:csrf_token'))
+        self.assertEqual(response.status_code, 405)
+
+    @override_settings(CSRF_COOKIE_HTTPONLY=True)
+    def test_script_fetches_token_if_cookie_is_unreadable(self):
+        content = self.client.get('/cached/').content.decode()
+        self.assertIn('data-csrf-cookie=""', content)
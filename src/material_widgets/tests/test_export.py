@@ -0,0 +1,97 @@
+"""
+DJANGO MATERIAL WIDGETS EXPORT TEST MODULE
+material_widgets/tests/test_export.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+from django import forms
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from ..export import MANIFEST, export, source_fingerprint
+from ..forms import MaterialForm
+from ..registry import dotted_path
+
+class SignupForm(MaterialForm):
+    """Test Form exported as a static fragment"""
+    email = forms.EmailField(label='Email')
+
+
+class NewsletterForm(MaterialForm):
+    """Test Form exported as a static fragment"""
+    name = forms.CharField(label='Name')
+    topics = forms.MultipleChoiceField(choices=[('a', 'A'), ('b', 'B')])
+
+
+FORMS = [dotted_path(SignupForm), dotted_path(NewsletterForm)]
+
+
+class ExportTests(SimpleTestCase):
+    """Test cases for material_widgets.export and the export_material_forms
+    management command.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def statuses(self, results):
+        return {result['file']: result['status'] for result in results}
+
+    def test_fragments_hold_media_and_components(self):
+        results = export(self.directory, FORMS, ['en', 'fr'], processes=2)
+        self.assertEqual(len(results), 4)
+        filename = '{}.fr.html'.format(FORMS[0])
+        with open(os.path.join(self.directory, filename)) as fragment:
+            html = fragment.read()
+        self.assertTrue(html.startswith(str(SignupForm().media)))
+        self.assertIn('data-mdc-field="email"', html)
+        with open(os.path.join(self.directory, MANIFEST)) as manifest:
+            entry = json.load(manifest)[filename]
+        self.assertEqual(entry['form'], FORMS[0])
+        self.assertEqual(entry['language'], 'fr')
+        self.assertEqual(entry['fingerprint'], source_fingerprint(SignupForm))
+        self.assertEqual(entry['media'], str(SignupForm().media).splitlines())
+
+    def test_only_changed_or_missing_fragments_are_exported_again(self):
+        export(self.directory, FORMS)
+        self.assertEqual(set(self.statuses(export(self.directory, FORMS))
+                             .values()), {'unchanged'})
+        os.remove(os.path.join(self.directory, FORMS[0] + '.en-us.html'))
+        self.assertEqual(self.statuses(export(self.directory, FORMS)), {
+            FORMS[0] + '.en-us.html': 'exported',
+            FORMS[1] + '.en-us.html': 'unchanged',
+            })
+        self.assertEqual(
+            set(self.statuses(export(self.directory, FORMS, force=True))
+                .values()), {'exported'},
+            )
+
+    def test_template_changes_export_every_form_again(self):
+        export(self.directory, FORMS)
+        with mock.patch('material_widgets.compiled.source_hash',
+                        return_value='changed'):
+            results = export(self.directory, FORMS)
+        self.assertEqual(set(self.statuses(results).values()), {'exported'})
+
+    def test_fingerprints_change_with_class_source(self):
+        class ChangedForm(SignupForm):
+            pass
+
+        self.assertNotEqual(
+            source_fingerprint(ChangedForm), source_fingerprint(SignupForm)
+            )
+
+    def test_command_reports_exported_fragments(self):
+        stdout = StringIO()
+        call_command('export_material_forms', self.directory,
+                     forms=FORMS, processes=1, stdout=stdout)
+        self.assertIn('2 of 2 fragments exported', stdout.getvalue())
+        with self.assertRaisesMessage(CommandError, 'is not registered'):
+            call_command('export_material_forms', self.directory,
+                         forms=['missing.Form'], processes=1)
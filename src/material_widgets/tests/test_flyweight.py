@@ -0,0 +1,106 @@
+"""
+DJANGO MATERIAL WIDGETS FLYWEIGHT TEST MODULE
+material_widgets/tests/test_flyweight.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from copy import deepcopy
+from django import forms
+from django.test import SimpleTestCase
+from .. import widgets
+from ..benchmarks import flyweight
+from ..flyweight import SharedWidget
+from ..forms import MaterialForm, clear_unbound_cache
+
+
+class SharedForm(MaterialForm):
+    """Test Form sharing its widgets between instances"""
+    share_widgets = True
+    client_validation = True
+    name = forms.CharField(label='Name', min_length=2, help_text='Help')
+    color = forms.ChoiceField(choices=[('r', 'Red'), ('g', 'Green')])
+    when = forms.SplitDateTimeField()
+
+
+class CopiedForm(SharedForm):
+    """Test Form copying its widgets per instance"""
+    share_widgets = False
+
+
+class FlyweightTests(SimpleTestCase):
+    """Test cases for material_widgets.flyweight and
+    BaseMaterialForm.share_widgets.
+    """
+
+    def setUp(self):
+        clear_unbound_cache()
+        self.addCleanup(clear_unbound_cache)
+
+    def test_instances_share_frozen_material_widgets(self):
+        first, second = SharedForm(), SharedForm()
+        widget = first.fields['name'].widget
+        self.assertIs(type(widget), SharedWidget)
+        self.assertIsInstance(widget, widgets.MaterialTextInput)
+        self.assertIs(widget.widget, second.fields['name'].widget.widget)
+        self.assertEqual(widget.label, 'Name')
+        self.assertEqual(widget.attrs['minlength'], '2')
+        self.assertIsNot(first.fields['name'], second.fields['name'])
+
+    def test_renders_and_media_match_copied_widgets(self):
+        self.assertEqual(
+            SharedForm().as_components(), CopiedForm().as_components()
+            )
+        self.assertEqual(str(SharedForm().media), str(CopiedForm().media))
+        data = {'name': 'ab', 'color': 'g', 'when_0': '2018-01-01',
+                'when_1': '12:00'}
+        self.assertTrue(SharedForm(data).is_valid())
+        self.assertEqual(
+            SharedForm({'name': 'a'}).as_components(),
+            CopiedForm({'name': 'a'}).as_components(),
+            )
+
+    def test_changing_attrs_copies_the_widget(self):
+        form = SharedForm()
+        form.fields['name'].widget.attrs['placeholder'] = 'Jane'
+        del form.fields['name'].widget.attrs['minlength']
+        self.assertTrue(form.fields['name'].widget.thawed)
+        self.assertIn('placeholder="Jane"', str(form['name']))
+        other = SharedForm().fields['name'].widget
+        self.assertFalse(other.thawed)
+        self.assertNotIn('placeholder', other.attrs)
+        self.assertIn('minlength', other.attrs)
+
+    def test_changing_choices_copies_the_widget(self):
+        form = SharedForm()
+        form.fields['color'].widget.choices.append(('b', 'Blue'))
+        form.fields['name'].widget.label = 'Full name'
+        self.assertEqual(len(form.fields['color'].widget.choices), 3)
+        self.assertEqual(SharedForm().fields['color'].widget.choices,
+                         [('r', 'Red'), ('g', 'Green')])
+        form.fields['color'].choices = [('w', 'White')]
+        self.assertIn('White', str(form['color']))
+        self.assertNotIn('White', str(SharedForm()['color']))
+        self.assertIn('Full name', str(form['name']))
+        self.assertNotIn('Full name', str(SharedForm()['name']))
+
+    def test_changing_subwidgets_copies_the_widget(self):
+        form = SharedForm()
+        str(form['when'])
+        self.assertFalse(form.fields['when'].widget.thawed)
+        form.fields['when'].widget.widgets[0].attrs['placeholder'] = 'LEAK'
+        self.assertTrue(form.fields['when'].widget.thawed)
+        self.assertIn('LEAK', str(form['when']))
+        self.assertNotIn('LEAK', str(SharedForm()['when']))
+
+    def test_copies_of_thawed_widgets_are_plain_widgets(self):
+        shared = SharedForm().fields['name'].widget
+        self.assertIs(type(deepcopy(shared)), SharedWidget)
+        shared.thaw()
+        self.assertIs(type(deepcopy(shared)), widgets.MaterialTextInput)
+
+    def test_benchmark_compares_both_variants(self):
+        form_class = flyweight.build_wide_form(30, share_widgets=True)
+        self.assertEqual(len(form_class.base_fields), 30)
+        results = flyweight.run(fields=10, number=2, repeat=1)
+        self.assertEqual(list(results), list(flyweight.VARIANTS))
+        self.assertLess(results['shared']['bytes'], results['copied']['bytes'])
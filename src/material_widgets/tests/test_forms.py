@@ -6,10 +6,14 @@ material_widgets/tests/test_forms.py
 # pylint: disable=too-few-public-methods, too-many-ancestors
 # pylint: disable=too-many-public-methods
 
+from unittest import mock
 from django import forms
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import translation
 from .. import widgets
-from ..forms import MaterialForm, MaterialModelForm
+from ..forms import MaterialForm, MaterialModelForm, clear_unbound_cache
+from ..forms import materialize_field
+from ..renderers import MaterialFormRenderer
 from .models import MaterialWidgetsTestModel
 
 class MaterialFormTests(TestCase):
@@ -634,3 +638,122 @@ class MaterialModelFormMethodTests(TestCase):
         form = self._form(data=data)
         self.assertRaises(ValueError, form.save)
         self.assertEqual(MaterialWidgetsTestModel.objects.count(), 0)
+
+
+class MaterialFormUnboundCacheTests(TestCase):
+    """Test cases for the cache_unbound option of material_widgets.forms.
+    Unbound forms should render once per class, language and prefix.
+    """
+
+    class CachedForm(MaterialForm):
+        """Test Form with a cached unbound render"""
+        cache_unbound = True
+        name = forms.CharField(label='Name')
+
+    def setUp(self):
+        clear_unbound_cache()
+        self.renders = 0
+        render = self.CachedForm._render_components
+
+        def counting_render(form):
+            self.renders += 1
+            return render(form)
+
+        self.CachedForm._render_components = counting_render
+        self.addCleanup(delattr, self.CachedForm, '_render_components')
+
+    def test_unbound_renders_are_cached(self):
+        html = self.CachedForm().as_components()
+        self.assertEqual(self.CachedForm().as_components(), html)
+        self.assertEqual(self.renders, 1)
+
+    def test_prefix_and_language_are_cached_separately(self):
+        self.CachedForm().as_components()
+        self.CachedForm(prefix='other').as_components()
+        with translation.override('fr'):
+            self.CachedForm().as_components()
+        self.assertEqual(self.renders, 3)
+
+    def test_bound_and_initial_forms_are_not_cached(self):
+        self.CachedForm(data={'name': 'x'}).as_components()
+        self.CachedForm(data={'name': 'x'}).as_components()
+        self.CachedForm(initial={'name': 'x'}).as_components()
+        self.CachedForm(initial={'name': 'x'}).as_components()
+        self.assertEqual(self.renders, 4)
+
+    def test_settings_and_template_reloads_invalidate_cache(self):
+        self.CachedForm().as_components()
+        with override_settings(USE_THOUSAND_SEPARATOR=True):
+            self.CachedForm().as_components()
+        MaterialFormRenderer.reset()
+        self.CachedForm().as_components()
+        self.assertEqual(self.renders, 3)
+
+    def test_forms_are_not_cached_by_default(self):
+        class UncachedForm(MaterialForm):
+            name = forms.CharField()
+
+        self.assertIsNone(UncachedForm()._unbound_key())
+
+
+class MaterialFormLazyWidgetsTests(TestCase):
+    """Test cases for the lazy_widgets option of material_widgets.forms.
+    Fields should only be materialized once accessed for display.
+    """
+
+    class TestModelForm(MaterialModelForm):
+        """Test ModelForm materializing its fields lazily"""
+        lazy_widgets = True
+        client_validation = True
+
+        class Meta:
+            """Meta settings for TestModelForm"""
+            model = MaterialWidgetsTestModel
+            fields = '__all__'
+
+    class EagerModelForm(TestModelForm):
+        """Test ModelForm materializing its fields in __init__"""
+        lazy_widgets = False
+
+    def test_validation_and_saving_skip_materialization(self):
+        form = self.TestModelForm(data={'integer_field': 1})
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.assertEqual(MaterialWidgetsTestModel.objects.count(), 1)
+        self.assertFalse(any(
+            isinstance(field.widget, widgets.MaterialComponent)
+            for field in form.fields.values()
+            ))
+
+    def test_validation_builds_no_field(self):
+        char_field = MaterialWidgetsTestModel._meta.get_field('char_field')
+        with mock.patch.object(char_field, 'default', 'default'), \
+                mock.patch('material_widgets.forms.materialize_field',
+                           side_effect=materialize_field) as materialize:
+            form = self.TestModelForm(data={'integer_field': 1})
+            self.assertTrue(form.is_valid())
+            self.assertEqual(materialize.call_count, 0)
+            str(form['char_field'])
+            self.assertEqual(materialize.call_count, 1)
+
+    def test_only_accessed_fields_are_materialized(self):
+        form = self.TestModelForm()
+        str(form['char_field'])
+        self.assertIsInstance(
+            form.fields['char_field'].widget, widgets.MaterialTextInput
+            )
+        self.assertEqual(form.fields['char_field'].widget.label, 'Char field')
+        self.assertIn('maxlength', form.fields['char_field'].widget.attrs)
+        self.assertNotIsInstance(
+            form.fields['text_field'].widget, widgets.MaterialComponent
+            )
+
+    def test_renders_and_media_match_eager_forms(self):
+        self.assertEqual(
+            str(self.TestModelForm().media), str(self.EagerModelForm().media)
+            )
+        data = {'positive_integer_field': -1}
+        self.assertEqual(
+            self.TestModelForm(data=data).as_components(),
+            self.EagerModelForm(data=data).as_components(),
+            )
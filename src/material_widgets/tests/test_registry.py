@@ -0,0 +1,135 @@
+"""
+DJANGO MATERIAL WIDGETS REGISTRY TEST MODULE
+material_widgets/tests/test_registry.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import gc
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+from django import forms
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django.utils import translation
+from ..forms import MaterialForm, MaterialModelForm, clear_unbound_cache
+from ..registry import FORMS, dotted_path, registered
+from ..warmup import warm_forms
+
+class WarmForm(MaterialForm):
+    """Test Form rendered into the shared cache"""
+    cache_unbound = True
+    name = forms.CharField(label='Name')
+
+
+class PlainForm(MaterialForm):
+    """Test Form without cached renders"""
+    name = forms.CharField(label='Name')
+
+
+WARM_FORM = dotted_path(WarmForm)
+PLAIN_FORM = dotted_path(PlainForm)
+
+
+class RegistryTests(SimpleTestCase):
+    """Test cases for material_widgets.registry."""
+
+    def test_subclasses_are_registered_by_dotted_path(self):
+        self.assertIs(FORMS[WARM_FORM], WarmForm)
+        self.assertEqual(
+            WARM_FORM, 'material_widgets.tests.test_registry.WarmForm'
+            )
+        self.assertNotIn('material_widgets.forms.MaterialForm', FORMS)
+        self.assertNotIn('material_widgets.forms.MaterialModelForm', FORMS)
+
+    def test_classes_defined_in_functions_are_not_registered(self):
+        class LocalForm(MaterialForm):
+            pass
+
+        self.assertNotIn(LocalForm, FORMS.values())
+
+    def test_collected_classes_leave_the_registry(self):
+        form_class = type('RuntimeForm', (MaterialModelForm,), {})
+        name = dotted_path(form_class)
+        self.assertIn(name, FORMS)
+        del form_class
+        gc.collect()
+        self.assertNotIn(name, FORMS)
+
+    def test_registered_returns_named_forms_in_order(self):
+        self.assertEqual(
+            list(registered([PLAIN_FORM, WARM_FORM]).values()),
+            [PlainForm, WarmForm],
+            )
+        with self.assertRaises(KeyError):
+            registered(['missing.Form'])
+
+
+class WarmFormsTests(SimpleTestCase):
+    """Test cases for material_widgets.warmup.warm_forms and the
+    warm_material_cache management command.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch(
+            'material_widgets.settings.MATERIAL_SHARED_CACHE',
+            os.path.join(directory.name, 'shared.cache'),
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        clear_unbound_cache()
+        self.addCleanup(clear_unbound_cache)
+
+    def test_command_renders_forms_into_the_shared_cache(self):
+        stdout = StringIO()
+        call_command(
+            'warm_material_cache', forms=[WARM_FORM, PLAIN_FORM],
+            languages=['en', 'fr'], processes=2, stdout=stdout,
+            )
+        output = stdout.getvalue()
+        self.assertIn('2 of 4 renders stored.', output)
+        self.assertEqual(output.count('skipped'), 2)
+        with mock.patch.object(WarmForm, '_render_components') as render:
+            for language in ('en', 'fr'):
+                with translation.override(language):
+                    WarmForm().as_components()
+        render.assert_not_called()
+
+    def test_results_are_timed_slowest_first(self):
+        results = warm_forms([WARM_FORM, PLAIN_FORM])
+        self.assertEqual(
+            [list(result) for result in results],
+            [['form', 'language', 'status', 'seconds']] * 2,
+            )
+        self.assertGreaterEqual(results[0]['seconds'], results[1]['seconds'])
+        self.assertEqual(
+            {result['form']: result['status'] for result in results},
+            {WARM_FORM: 'stored', PLAIN_FORM: 'skipped'},
+            )
+
+    def test_shared_cache_is_required(self):
+        with mock.patch('material_widgets.settings.MATERIAL_SHARED_CACHE',
+                        None):
+            with self.assertRaises(ImproperlyConfigured):
+                warm_forms([WARM_FORM])
+            with self.assertRaisesMessage(CommandError, 'not set'):
+                call_command('warm_material_cache', forms=[WARM_FORM])
+
+    def test_unregistered_forms_fail(self):
+        with self.assertRaisesMessage(CommandError, 'is not registered'):
+            call_command('warm_material_cache', forms=['missing.Form'],
+                         processes=1)
+
+    def test_errors_of_registered_forms_propagate(self):
+        class BrokenForm(MaterialForm):
+            def __init__(self, *args, **kwargs):
+                raise KeyError('missing_setting')
+
+        with mock.patch.dict(FORMS, {'tests.BrokenForm': BrokenForm}):
+            with self.assertRaisesMessage(KeyError, 'missing_setting'):
+                call_command('warm_material_cache', forms=['tests.BrokenForm'],
+                             processes=1)
@@ -0,0 +1,70 @@
+"""
+DJANGO MATERIAL WIDGETS RENDERERS TEST MODULE
+material_widgets/tests/test_renderers.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from unittest import mock
+from django import forms
+from django.template import TemplateDoesNotExist
+from django.forms.renderers import TemplatesSetting, get_default_renderer
+from django.test import SimpleTestCase, override_settings
+from ..forms import MaterialForm
+from ..renderers import MaterialFormRenderer
+
+TEMPLATE = 'material_widgets/widgets/material_text.html'
+
+class ExampleForm(MaterialForm):
+    name = forms.CharField()
+
+
+class MaterialFormRendererTests(SimpleTestCase):
+    """Test cases for material_widgets.renderers.MaterialFormRenderer."""
+
+    def tearDown(self):
+        MaterialFormRenderer.reset()
+
+    def test_material_forms_use_renderer_by_default(self):
+        self.assertIsInstance(ExampleForm().renderer, MaterialFormRenderer)
+        self.assertIn('mdc-text-field', str(ExampleForm()))
+
+    def test_project_form_renderer_is_respected(self):
+        path = 'django.forms.renderers.TemplatesSetting'
+        # Django 1.11 does not reset its cached renderer on setting changes
+        get_default_renderer.cache_clear()
+        self.addCleanup(get_default_renderer.cache_clear)
+        with override_settings(FORM_RENDERER=path):
+            self.assertIsInstance(ExampleForm().renderer, TemplatesSetting)
+
+            class MaterialRendererForm(ExampleForm):
+                default_renderer = MaterialFormRenderer
+
+            self.assertIsInstance(MaterialRendererForm().renderer,
+                                  MaterialFormRenderer)
+
+    def test_templates_are_cached_across_instances(self):
+        self.assertIs(
+            MaterialFormRenderer().get_template(TEMPLATE).template,
+            MaterialFormRenderer().get_template(TEMPLATE).template,
+            )
+
+    def test_reset_reloads_templates(self):
+        template = MaterialFormRenderer().get_template(TEMPLATE).template
+        MaterialFormRenderer.reset()
+        self.assertIsNot(
+            MaterialFormRenderer().get_template(TEMPLATE).template, template
+            )
+
+    def test_renders_django_widget_templates(self):
+        html = forms.TextInput().render(
+            'name', 'value', renderer=MaterialFormRenderer()
+            )
+        self.assertIn('value="value"', html)
+
+    def test_missing_templates_fall_back_to_django_renderer(self):
+        renderer = MaterialFormRenderer()
+        with mock.patch.object(renderer, 'fallback') as fallback:
+            renderer.get_template('missing.html')
+        fallback.get_template.assert_called_once_with('missing.html')
+        with self.assertRaises(TemplateDoesNotExist):
+            MaterialFormRenderer().get_template('missing.html')
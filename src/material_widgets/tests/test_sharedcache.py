@@ -0,0 +1,253 @@
+"""
+DJANGO MATERIAL WIDGETS SHARED CACHE TEST MODULE
+material_widgets/tests/test_sharedcache.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date
+from unittest import mock
+from django import forms
+from django.test import SimpleTestCase, override_settings
+from ..forms import UNBOUND_COMPONENTS, MaterialForm, clear_unbound_cache
+from ..forms import fingerprint
+from ..sharedcache import SharedMemoryCache, shared_cache
+
+PROCESSES = 4
+KEYS = 200
+
+FORK = multiprocessing.get_context('fork')
+
+
+def in_processes(target, *args, count=PROCESSES):
+    """Run target(index, *args) in `count` forked processes and return their
+    exit codes.
+    """
+    processes = [
+        FORK.Process(target=target, args=(index,) + args)
+        for index in range(count)
+        ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return [process.exitcode for process in processes]
+
+
+def write_keys(index, path, size):
+    cache = SharedMemoryCache(path, size=size, slots=4096)
+    for number in range(KEYS):
+        cache.set('{}-{}'.format(index, number), 'value {} {}'.format(
+            index, number
+            ) * 10)
+        # read keys written by the other processes meanwhile
+        cache.get('{}-{}'.format((index + 1) % PROCESSES, number))
+
+
+class CachedForm(MaterialForm):
+    """Test Form with a cached unbound render"""
+    cache_unbound = True
+    name = forms.CharField(label='Name', max_length=32)
+    kind = forms.ChoiceField(choices=[('a', 'A'), ('b', 'B')])
+
+
+def render_cached_form(index):
+    # pylint: disable=unused-argument
+    CachedForm().as_components()
+
+
+class SharedMemoryCacheTests(SimpleTestCase):
+    """Test cases for material_widgets.sharedcache.SharedMemoryCache."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'shared.cache')
+
+    def open(self, size=1024 * 1024, slots=4096):
+        cache = SharedMemoryCache(self.path, size=size, slots=slots)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_values_set_in_one_process_are_read_in_another(self):
+        cache = self.open()
+        process = FORK.Process(target=lambda: cache.set('key', 'välue'))
+        process.start()
+        process.join()
+        self.assertEqual(cache.get('key'), 'välue')
+        self.assertIsNone(cache.get('other'))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_concurrent_writers_lose_no_entry(self):
+        self.open()
+        self.assertEqual(
+            in_processes(write_keys, self.path, 1024 * 1024), [0] * PROCESSES
+            )
+        cache = self.open()
+        for index in range(PROCESSES):
+            for number in range(KEYS):
+                self.assertEqual(
+                    cache.get('{}-{}'.format(index, number)),
+                    'value {} {}'.format(index, number) * 10,
+                    )
+        self.assertEqual(cache.stats()['generation'], 1)
+
+    def test_full_data_region_starts_a_new_generation(self):
+        cache = self.open(size=4096)
+        for number in range(20):
+            cache.set(str(number), 'x' * 500)
+        stats = cache.stats()
+        self.assertGreater(stats['generation'], 1)
+        self.assertIsNone(cache.get('0'))
+        self.assertEqual(cache.get('19'), 'x' * 500)
+        self.assertLessEqual(stats['used'], 4096)
+
+    def test_concurrent_writers_wrapping_around_return_only_their_values(self):
+        self.open(size=16 * 1024)
+        self.assertEqual(
+            in_processes(write_keys, self.path, 16 * 1024), [0] * PROCESSES
+            )
+        cache = self.open(size=16 * 1024)
+        self.assertGreater(cache.stats()['generation'], 1)
+        for index in range(PROCESSES):
+            for number in range(KEYS):
+                self.assertIn(cache.get('{}-{}'.format(index, number)), (
+                    None, 'value {} {}'.format(index, number) * 10,
+                    ))
+
+    def test_values_larger_than_max_value_are_not_stored(self):
+        cache = self.open(size=4096)
+        self.assertFalse(cache.set('key', 'x' * 2048))
+        self.assertIsNone(cache.get('key'))
+
+    def test_clear_evicts_entries_of_every_process(self):
+        cache = self.open()
+        cache.set('key', 'value')
+        other = self.open()
+        other.clear()
+        self.assertIsNone(cache.get('key'))
+
+    def test_files_of_another_layout_are_reset(self):
+        first = self.open(size=4096)
+        first.set('key', 'value')
+        cache = self.open(size=8192)
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(os.path.getsize(self.path), cache.data_start + 8192)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)),
+                         [os.path.basename(self.path)])
+        # the file mapped by the first cache was replaced, not truncated
+        self.assertEqual(first.get('key'), 'value')
+        first.set('other', 'value')
+        self.assertIsNone(cache.get('other'))
+
+    def test_concurrent_openers_of_another_layout_share_one_file(self):
+        self.open(size=4096)
+        self.assertEqual(
+            in_processes(write_keys, self.path, 1024 * 1024), [0] * PROCESSES
+            )
+        cache = self.open()
+        for index in range(PROCESSES):
+            self.assertEqual(
+                cache.get('{}-0'.format(index)),
+                'value {} 0'.format(index) * 10,
+                )
+
+
+class SharedUnboundCacheTests(SimpleTestCase):
+    """Test cases for cache_unbound forms with MATERIAL_SHARED_CACHE set.
+    Renders of one process should be reused by the others.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch(
+            'material_widgets.settings.MATERIAL_SHARED_CACHE',
+            os.path.join(directory.name, 'shared.cache'),
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        clear_unbound_cache()
+        self.addCleanup(clear_unbound_cache)
+
+    def test_renders_of_other_processes_are_reused(self):
+        self.assertEqual(in_processes(render_cached_form, count=1), [0])
+        with mock.patch.object(CachedForm, '_render_components') as render:
+            html = CachedForm().as_components()
+        render.assert_not_called()
+        self.assertIn('data-mdc-field="name"', html)
+        self.assertTrue(hasattr(html, '__html__'))
+        self.assertEqual(UNBOUND_COMPONENTS.get(
+            CachedForm()._unbound_key()  # pylint: disable=protected-access
+            ), html)
+        self.assertEqual(shared_cache().stats()['hits'], 1)
+
+    def test_prefixes_are_shared_separately(self):
+        in_processes(render_cached_form, count=1)
+        with mock.patch.object(CachedForm, '_render_components',
+                               return_value='other') as render:
+            self.assertEqual(CachedForm(prefix='x').as_components(), 'other')
+        render.assert_called_once_with()
+
+    def test_fingerprints_are_equal_in_every_process(self):
+        child = (
+            'import django; django.setup(); '
+            'from material_widgets.tests.test_sharedcache import CachedForm; '
+            'from material_widgets.forms import fingerprint; '
+            'print(fingerprint(CachedForm))'
+            )
+        environ = dict(os.environ, PYTHONHASHSEED='1', PYTHONPATH=os.pathsep
+                       .join(path for path in sys.path if path))
+        output = subprocess.check_output([sys.executable, '-c', child],
+                                         env=environ)
+        self.assertEqual(output.decode().strip(), fingerprint(CachedForm))
+
+    def test_fingerprints_change_with_field_declarations(self):
+        class OtherForm(CachedForm):
+            name = forms.CharField(label='Name', max_length=64)
+
+        self.assertNotEqual(fingerprint(OtherForm), fingerprint(CachedForm))
+
+    def test_fingerprints_change_with_values_and_options(self):
+        class DateForm(MaterialForm):
+            day = forms.DateField(initial=date(2018, 1, 1))
+
+        class OtherDateForm(MaterialForm):
+            day = forms.DateField(initial=date(2019, 1, 1))
+
+        OtherDateForm.__qualname__ = DateForm.__qualname__
+        self.assertNotEqual(fingerprint(DateForm), fingerprint(OtherDateForm))
+        before = fingerprint(CachedForm)
+        with mock.patch.object(CachedForm, 'error_css_class', 'invalid'):
+            clear_unbound_cache()
+            self.assertNotEqual(fingerprint(CachedForm), before)
+
+    def test_forms_with_unstable_values_are_not_shared(self):
+        class LambdaForm(CachedForm):
+            name = forms.CharField(validators=[lambda value: None])
+
+        self.assertIsNone(fingerprint(LambdaForm))
+        in_processes(render_cached_form, count=1)
+        with mock.patch('material_widgets.sharedcache.SharedMemoryCache.get'
+                        ) as get:
+            LambdaForm().as_components()
+        get.assert_not_called()
+
+    def test_clearing_discards_renders_of_other_processes(self):
+        in_processes(render_cached_form, count=1)
+        clear_unbound_cache()
+        with mock.patch.object(CachedForm, '_render_components',
+                               return_value='fresh') as render:
+            self.assertEqual(CachedForm().as_components(), 'fresh')
+        render.assert_called_once_with()
+        CachedForm().as_components()
+        with override_settings(USE_THOUSAND_SEPARATOR=True):
+            with mock.patch.object(CachedForm, '_render_components',
+                                   return_value='changed') as render:
+                self.assertEqual(CachedForm().as_components(), 'changed')
+        render.assert_called_once_with()
@@ -0,0 +1,53 @@
+"""
+DJANGO MATERIAL WIDGETS FIELD VALIDATION TEST MODULE
+material_widgets/tests/test_validation.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from django.test import SimpleTestCase, override_settings
+from .urls import LoadTestForm
+
+@override_settings(ROOT_URLCONF='material_widgets.tests.urls')
+class FieldValidationTests(SimpleTestCase):
+    """Test cases for material_widgets.views.FieldValidationMixin.
+    Validation requests should answer with the rows of the named fields only.
+    """
+
+    def validate(self, names, data, path='/validate/'):
+        return self.client.post(
+            path, data, HTTP_X_MATERIAL_VALIDATE=names
+            ).json()['fields']
+
+    def test_field_components_match_rows_of_as_components(self):
+        form = LoadTestForm(data={'username': '', 'choice': '3'})
+        html = form.as_components()
+        rows = form.field_components()
+        self.assertEqual(list(rows), ['username', 'choice'])
+        for row in rows.values():
+            self.assertIn(row, html)
+        self.assertIn('data-mdc-field="username"', rows['username'])
+
+    def test_validation_returns_only_named_fields_with_errors(self):
+        fields = self.validate('username', {'username': '', 'choice': '3'})
+        self.assertEqual(list(fields), ['username'])
+        self.assertIn('mdc-errorlist', fields['username'])
+
+    def test_validation_of_valid_fields_has_no_errors(self):
+        fields = self.validate('username,choice', {'username': 'ooknosi'})
+        self.assertNotIn('mdc-errorlist', fields['username'])
+        self.assertIn('mdc-errorlist', fields['choice'])
+
+    def test_form_clean_reading_other_fields_is_skipped(self):
+        fields = self.validate('username', {'username': '1'},
+                               path='/validate-cross/')
+        self.assertEqual(list(fields), ['username'])
+        self.assertNotIn('mdc-errorlist', fields['username'])
+
+    def test_unknown_fields_are_ignored(self):
+        self.assertEqual(self.validate('unknown', {}), {})
+
+    def test_posts_without_header_are_handled_as_usual(self):
+        response = self.client.post(
+            '/validate/', {'username': 'ooknosi', 'choice': '1'}
+            )
+        self.assertRedirects(response, '/form/', fetch_redirect_response=False)
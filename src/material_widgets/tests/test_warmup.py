@@ -0,0 +1,55 @@
+"""
+DJANGO MATERIAL WIDGETS WARM-UP TEST MODULE
+material_widgets/tests/test_warmup.py
+"""
+# pylint: disable=invalid-name, missing-docstring
+
+from unittest import mock
+from django.apps import apps
+from django.forms.renderers import DjangoTemplates
+from django.test import SimpleTestCase
+from .. import warmup
+
+class RecordingRenderer(DjangoTemplates):
+    def __init__(self):
+        self.loaded = []
+
+    def get_template(self, template_name):
+        self.loaded.append(template_name)
+        return super().get_template(template_name)
+
+
+class WarmUpTests(SimpleTestCase):
+    """Test cases for material_widgets.warmup."""
+
+    def test_template_names_cover_widget_templates(self):
+        names = warmup.template_names()
+        self.assertIn('material_widgets/widgets/material_select.html', names)
+        self.assertIn('material_widgets/widgets/material_attrs.html', names)
+
+    def test_warm_up_loads_every_template_and_logs_time(self):
+        renderer = RecordingRenderer()
+        with self.assertLogs('material_widgets.warmup', 'INFO') as logs:
+            warmup.warm_up(renderer=renderer)
+        self.assertEqual(renderer.loaded, warmup.template_names())
+        self.assertIn('templates in', logs.output[0])
+
+    def test_warm_up_renders_widgets_if_asked(self):
+        renderer = RecordingRenderer()
+        with self.assertLogs('material_widgets.warmup', 'INFO') as logs:
+            warmup.warm_up(render=True, renderer=renderer)
+        self.assertGreater(
+            len(renderer.loaded), len(warmup.template_names())
+            )
+        self.assertIn('and widgets', logs.output[0])
+
+    def test_ready_warms_up_only_if_enabled(self):
+        config = apps.get_app_config('material_widgets')
+        with mock.patch('material_widgets.warmup.warm_up') as warm_up:
+            with mock.patch('material_widgets.settings.MATERIAL_WARM_UP', False):
+                config.ready()
+            warm_up.assert_not_called()
+            with mock.patch(
+                    'material_widgets.settings.MATERIAL_WARM_UP', 'render'):
+                config.ready()
+            warm_up.assert_called_once_with(render=True)
@@ -0,0 +1,124 @@
+"""
+DJANGO MATERIAL WIDGETS WIDGETS TEST MODULE
+material_widgets/tests/test_widgets.py
+"""
+# pylint: disable=invalid-name, missing-docstring, protected-access
+
+from copy import deepcopy
+from django.forms import widgets as django_widgets
+from django.template import Context, Template
+from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
+from .. import widgets
+from .._widgets import MaterialComponent, attrs_html, flat_attrs
+from ..renderers import MaterialFormRenderer
+
+ATTRS_LOOP = Template(
+    '{% include "material_widgets/widgets/material_attrs.html" %}',
+    engine=MaterialFormRenderer.get_engine().engine,
+    )
+
+
+def loop(attrs):
+    """Render attrs with the template loop of material_attrs.html."""
+    return ATTRS_LOOP.render(Context({'widget': {'attrs': attrs}}))
+
+
+class AttrsHTMLTests(SimpleTestCase):
+    """Test cases for the precomputed attrs_html of Material widgets."""
+
+    def test_flat_attrs_match_the_template_loop(self):
+        attrs = {
+            'class': 'a "b" <c>', 'step': 0.5, 'min': 1, 'autofocus': True,
+            'disabled': False, 'data-safe': mark_safe('<&>'),
+            }
+        self.assertEqual(flat_attrs(attrs.items()), loop(attrs))
+
+    def test_static_attrs_are_escaped_once(self):
+        widget = widgets.MaterialTextInput(attrs={'class': 'x', 'min': 1})
+        html = attrs_html(widget, widget.build_attrs(widget.attrs, {
+            'id': 'id_x', 'required': True,
+            }))
+        self.assertEqual(html, ' class="x" min="1" id="id_x" required')
+        static = widget._static_attrs
+        attrs_html(widget, widget.build_attrs(widget.attrs, {'id': 'id_y'}))
+        self.assertIs(widget._static_attrs, static)
+
+    def test_changed_widget_attrs_are_escaped_again(self):
+        widget = widgets.MaterialTextInput(attrs={'class': 'x'})
+        attrs_html(widget, widget.attrs)
+        widget.attrs['class'] = 'y'
+        self.assertEqual(attrs_html(widget, widget.attrs), ' class="y"')
+
+    def test_overridden_static_attrs_are_escaped_in_full(self):
+        widget = widgets.MaterialTextInput(attrs={'class': 'x', 'min': 1})
+        self.assertEqual(
+            attrs_html(widget, {'class': 'x y', 'min': 1}),
+            ' class="x y" min="1"',
+            )
+        self.assertEqual(attrs_html(widget, {'min': 1}), ' min="1"')
+
+    def test_rendered_widgets_and_options_use_attrs_html(self):
+        renderer = MaterialFormRenderer()
+        radio = widgets.MaterialRadioSelect(
+            choices=[('a', 'A'), ('b', 'B')], help_text=['', ''],
+            attrs={'class': 'x'},
+            )
+        html = radio.render('r', 'a', {'id': 'id_r'}, renderer=renderer)
+        self.assertIn('class="x" id="id_r_0" checked', html)
+        self.assertIn('class="x" id="id_r_1"', html)
+        select = widgets.MaterialSelect(choices=[('a', 'A')])
+        html = select.render('s', 'a', {'id': 'id_s'}, renderer=renderer)
+        self.assertIn('id="id_s" class="mdc-select"', html)
+
+
+class StaticContextTests(SimpleTestCase):
+    """Test cases for the static context of Material widgets."""
+
+    def test_flat_contexts_match_the_django_get_context_chain(self):
+        flat = [
+            getattr(widgets, name) for name in widgets.__all__
+            if getattr(getattr(widgets, name), '_flat_context', False)
+            ]
+        self.assertIn(widgets.MaterialTextInput, flat)
+        self.assertNotIn(widgets.MaterialPasswordInput, flat)
+        self.assertNotIn(widgets.MaterialCheckboxInput, flat)
+        for widget_class in flat:
+            widget = widget_class(label='Label', attrs={'class': 'x'})
+            context = widget.get_context('name', 'value', {'id': 'id_name'})
+            expected = super(MaterialComponent, widget).get_context(
+                'name', 'value', {'id': 'id_name'}
+                )
+            expected['widget'].update(widget.static_context())
+            self.assertEqual(context, expected, widget_class.__name__)
+
+    def test_setting_context_keys_rebuilds_the_static_context(self):
+        widget = widgets.MaterialSliderInput(label='Before')
+        self.assertEqual(widget.static_context()['label'], 'Before')
+        copy = deepcopy(widget)
+        widget.label = 'After'
+        widget.is_discrete = True
+        context = widget.get_context('name', None, None)['widget']
+        self.assertEqual(context['label'], 'After')
+        self.assertIs(context['is_discrete'], True)
+        self.assertEqual(copy.static_context()['label'], 'Before')
+
+    def test_css_class_is_appended_to_the_class_attribute(self):
+        select = widgets.MaterialSelect(attrs={'class': 'x'})
+        self.assertEqual(
+            select.get_context('s', None, None)['widget']['attrs']['class'],
+            'x mdc-select',
+            )
+        self.assertEqual(widgets.MaterialSelectMultiple().get_context(
+            's', None, None
+            )['widget']['attrs']['class'], 'mdc-multi-select mdc-list')
+        self.assertNotIn('class', widgets.MaterialTextInput().get_context(
+            't', None, None
+            )['widget']['attrs'])
+
+    def test_django_get_context_overrides_disable_flat_contexts(self):
+        class PasswordLike(widgets.MaterialTextInput,
+                           django_widgets.PasswordInput):
+            pass
+
+        self.assertFalse(PasswordLike._flat_context)
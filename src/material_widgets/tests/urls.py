@@ -0,0 +1,64 @@
+"""
+DJANGO MATERIAL WIDGETS TESTS URL CONFIGURATION
+material_widgets/tests/urls.py
+"""
+# pylint: disable=invalid-name
+
+from django import forms
+from django.conf.urls import include, url
+from django.http import HttpResponse
+from django.template import engines
+from django.views.decorators.cache import cache_page
+from django.views.generic.edit import FormView
+from ..forms import MaterialForm
+from ..views import FieldValidationMixin
+
+class LoadTestForm(MaterialForm):
+    username = forms.CharField(help_text='3-32 characters required')
+    choice = forms.ChoiceField(choices=(('1', 'One'), ('2', 'Two')))
+
+
+class CrossFieldTestForm(LoadTestForm):
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data['username'] == cleaned_data['choice']:
+            raise forms.ValidationError('Username and choice must differ.')
+        return cleaned_data
+
+
+def form_view(request):
+    return HttpResponse(LoadTestForm().as_components())
+
+
+CACHED_PAGE = engines['django'].from_string(
+    '{% load material_csrf %}'
+    '<form method="post">{% material_csrf_token %}{{ form.as_components }}'
+    '</form>{% material_csrf_script %}'
+    )
+
+
+@cache_page(60)
+def cached_form_view(request):
+    if request.method == 'POST':
+        return HttpResponse('posted')
+    return HttpResponse(CACHED_PAGE.render({'form': LoadTestForm()}, request))
+
+
+class ValidationView(FieldValidationMixin, FormView):
+    form_class = LoadTestForm
+    template_name = 'material_widgets/widgets/material_text.html'
+    success_url = '/form/'
+
+
+class CrossFieldValidationView(ValidationView):
+    form_class = CrossFieldTestForm
+
+
+urlpatterns = [
+    url(r'^form/$', form_view, name='form'),
+    url(r'^cached/$', cached_form_view, name='cached_form'),
+    url(r'^validate/$', ValidationView.as_view(), name='validate'),
+    url(r'^validate-cross/$', CrossFieldValidationView.as_view(),
+        name='validate_cross'),
+    url(r'^material/', include('material_widgets.urls')),
+    ]
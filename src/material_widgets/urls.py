@@ -0,0 +1,14 @@
+"""
+DJANGO MATERIAL WIDGETS URL CONFIGURATION
+material_widgets/urls.py
+"""
+# pylint: disable=invalid-name
+
+from django.conf.urls import url
+from . import views
+
+app_name = 'material_widgets'
+
+urlpatterns = [
+    url(r'^csrf/$', views.csrf_token, name='csrf_token'),
+    ]
@@ -0,0 +1,79 @@
+"""Views and view mixins of Material widgets.
+
+Include ``material_widgets.urls`` in the project's URL configuration to serve
+the views.
+
+>>> url(r'^material/', include('material_widgets.urls'))
+
+"""
+from collections import OrderedDict
+from django.forms.utils import ErrorDict
+from django.http import JsonResponse
+from django.middleware.csrf import get_token
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+__all__ = ('FieldValidationMixin', 'csrf_token',)
+
+
+@never_cache
+@require_GET
+def csrf_token(request):
+    """Return the CSRF token of the request as JSON, setting its cookie.
+
+    Lets ``material_csrf.js`` submit forms of cached pages, which cannot embed
+    the token.
+
+    """
+    return JsonResponse({'token': get_token(request)})
+
+
+class FieldValidationMixin:
+    """Mixin of `django.views.generic.edit.FormView` validating single fields.
+
+    POST requests with an ``X-Material-Validate`` header, listing the HTML
+    names of fields separated by commas, validate only those fields. The
+    response is JSON mapping each field's name to its row rendered by
+    `material_widgets.forms.BaseMaterialForm.field_components`, with its
+    errors. Only the fields' own cleaning runs: the form's ``clean()`` and
+    model validation may read other fields, and are skipped. Other POST
+    requests are handled by the view as usual.
+
+    ``material_validation.js`` sends these requests from forms with a
+    ``data-mdc-validate`` attribute whenever a changed field loses focus, and
+    replaces the fields' rows with the response. The attribute's value, if
+    any, is the URL to post to instead of the form's action.
+
+    Examples
+    --------
+    >>> class SignupView(FieldValidationMixin, FormView):
+    >>>     form_class = SignupForm
+
+    >>> <form method="post" data-mdc-validate>
+    >>>   {% csrf_token %}
+    >>>   {{ form.as_components }}
+    >>> </form>
+    >>> <script src="{% static 'material_widgets/js/material_validation.js' %}">
+    >>> </script>
+
+    """
+    validation_header = 'HTTP_X_MATERIAL_VALIDATE'
+
+    def post(self, request, *args, **kwargs):
+        names = request.META.get(self.validation_header)
+        if names is None:
+            return super().post(request, *args, **kwargs)
+        return self.validate_fields(self.get_form(), names.split(','))
+
+    def validate_fields(self, form, html_names):
+        """Return the rows of the fields named `html_names`, validated."""
+        # pylint: disable=protected-access
+        names = {form[name].html_name: name for name in form.fields}
+        names = [names[name] for name in html_names if name in names]
+        form.fields = OrderedDict((name, form.fields[name]) for name in names)
+        # clean the fields as full_clean() would, without _clean_form() and
+        # _post_clean(), which may read the cleaned data of other fields
+        form._errors = ErrorDict()
+        form.cleaned_data = {}
+        form._clean_fields()
+        return JsonResponse({'fields': form.field_components(names)})
@@ -0,0 +1,176 @@
+"""Load Material widget templates, and render Material forms, ahead of the
+first request.
+
+Templates are loaded through the form renderer of Material forms,
+`MaterialFormRenderer`, whose cached template loader keeps them compiled for
+the life of the process.
+
+Forms are rendered by `warm_forms` into the MATERIAL_SHARED_CACHE file, which
+outlives the process and is read by every worker of the server, see
+`material_widgets.sharedcache`.
+
+"""
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from time import perf_counter
+import django
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.utils.translation import override
+from .registry import FORMS, discover, registered
+from .renderers import MaterialFormRenderer
+from .sharedcache import shared_cache
+
+__all__ = ('STATUSES', 'TEMPLATE_DIR', 'template_names', 'warm_forms',
+           'warm_up',)
+
+STATUSES = ('stored', 'too large', 'uncacheable', 'skipped',)
+
+TEMPLATE_DIR = 'material_widgets/widgets'
+
+logger = logging.getLogger(__name__)
+
+
+def template_names():
+    """Return the names of every Material widget template, sorted."""
+    directory = os.path.join(
+        os.path.dirname(__file__), 'templates', TEMPLATE_DIR
+        )
+    return sorted(
+        '{}/{}'.format(TEMPLATE_DIR, filename)
+        for filename in os.listdir(directory)
+        if filename.endswith('.html')
+        )
+
+
+def warm_up(render=False, renderer=None):
+    """Load and compile every Material widget template.
+
+    Parameters
+    ----------
+    render : bool, optional
+        Also render one instance of each Material widget class.
+    renderer : django.forms.renderers.BaseRenderer, optional
+        Renderer to warm up. Defaults to `MaterialFormRenderer`.
+
+    Returns
+    -------
+    seconds : float
+        Time taken.
+
+    """
+    renderer = renderer or MaterialFormRenderer()
+    start = perf_counter()
+    names = template_names()
+    for name in names:
+        renderer.get_template(name)
+    if render:
+        from . import widgets
+        for class_name in widgets.__all__:
+            getattr(widgets, class_name)().render(
+                'warm_up', None, renderer=renderer
+                )
+    seconds = perf_counter() - start
+    logger.info(
+        'Warmed up %d Material widget templates%s in %.1f ms.',
+        len(names), ' and widgets' if render else '', seconds * 1000,
+        )
+    return seconds
+
+
+def _initialize():
+    django.setup()
+    discover()
+
+
+def _warm_form(arguments):
+    """Render the named form in a language into the shared cache.
+
+    Returns
+    -------
+    name, language, status, seconds : tuple
+
+    """
+    # pylint: disable=protected-access
+    name, language = arguments
+    with override(language):
+        start = perf_counter()
+        form = FORMS[name]()
+        html = form._render_components()
+        seconds = perf_counter() - start
+        key = form._unbound_key() and form._shared_key()
+        if not form.cache_unbound:
+            status = 'skipped'
+        elif key is None:
+            status = 'uncacheable'
+        elif shared_cache().set(key, html):
+            status = 'stored'
+        else:
+            status = 'too large'
+    return name, language, status, seconds
+
+
+def warm_forms(names=None, languages=None, processes=1):
+    """Render registered forms into the MATERIAL_SHARED_CACHE file.
+
+    Every form is rendered and timed, but only unbound renders of forms with
+    ``cache_unbound = True`` are stored, see
+    `material_widgets.forms.BaseMaterialForm`.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Dotted paths of the forms to render. Defaults to every form of
+        `material_widgets.registry.FORMS`, after `discover`.
+    languages : list of str, optional
+        Language codes to render each form in. Defaults to LANGUAGE_CODE.
+    processes : int, optional
+        Worker processes rendering forms. Forms are rendered in-process if 1.
+
+    Returns
+    -------
+    results : list of dict
+        'form', 'language', 'status', one of `STATUSES`, and 'seconds' taken
+        to instantiate and render, of each form and language, slowest first.
+        Forms are 'skipped' unless ``cache_unbound`` is set, and
+        'uncacheable' if their render has queryset choices or initial data.
+
+    Raises
+    ------
+    django.core.exceptions.ImproperlyConfigured
+        If MATERIAL_SHARED_CACHE is not set.
+    KeyError
+        If a name is not registered.
+
+    """
+    from django.conf import settings
+    if shared_cache() is None:
+        raise ImproperlyConfigured('MATERIAL_SHARED_CACHE is not set.')
+    discover()
+    tasks = [
+        (name, language) for name in registered(names)
+        for language in languages or [settings.LANGUAGE_CODE]
+        ]
+    if processes == 1:
+        outcomes = [_warm_form(task) for task in tasks]
+    else:
+        # children must not share the parent's database connections
+        connections.close_all()
+        pool = multiprocessing.Pool(processes, initializer=_initialize)
+        try:
+            outcomes = pool.map(_warm_form, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    results = [
+        OrderedDict(zip(('form', 'language', 'status', 'seconds'), outcome))
+        for outcome in outcomes
+        ]
+    results.sort(key=lambda result: -result['seconds'])
+    logger.info(
+        'Warmed up %d Material forms in the shared cache.',
+        sum(result['status'] == 'stored' for result in results),
+        )
+    return results